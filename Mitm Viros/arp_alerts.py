@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Uyarı Yöneticisi (Tekilleştirme ve Hız Sınırı)
+Periyodik modda kalıcı bir durum her taramada yeniden uyarı üretir; flood sırasında her bulgu
+kendi bildirimini doğurur. Bu yönetici her bulgu için bir parmak izi çıkarır ve:
+
+- Aynı durumu bastırma penceresi boyunca yalnızca bir kez uyarır,
+- Durum kötüleşirse (önem seviyesi artarsa veya etkilenen adres sayısı katlanırsa) pencereyi
+  beklemeden yükseltilmiş uyarı verir,
+- Tüm uyarıları bir jeton kovası (token bucket) ile sınırlar; sınıra takılanlar sayılır ve
+  geçen bir sonraki uyarıya "bastırılan" sayısı olarak eklenir.
+
+Böylece arayüz, kayıtlar ve bildirim çıkışları olay hızından bağımsız olarak sınırlı trafik alır.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+
+SEVERITY_RANK = {"info": 0, "warning": 1, "critical": 2}
+
+IP_PATTERN = re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}\b")
+MAC_PATTERN = re.compile(r"\b[0-9a-fA-F]{2}(?:[:-][0-9a-fA-F]{2}){5}\b")
+
+
+def finding_rank(finding):
+    """Bulgunun önem sırası (0: bilgi, 1: şüpheli, 2: tehlike)."""
+    message = finding.get("message", "")
+    if "❌" in message:
+        return SEVERITY_RANK["critical"]
+    if "⚠️" in message:
+        return SEVERITY_RANK["warning"]
+    return SEVERITY_RANK["info"]
+
+
+def finding_magnitude(finding):
+    """Bulgunun büyüklüğü: etkilenen IP/MAC sayısı (yoksa 1)."""
+    for key in ("ip_count", "mac_count"):
+        if finding.get(key):
+            return finding[key]
+    return max(len(finding.get("ips") or ()), len(finding.get("macs") or ()), 1)
+
+
+def alert_fingerprint(finding):
+    """
+    Bulgunun parmak izini üretir: tür ve ilgili adresler.
+
+    Arayüzün çıktı satırlarından oluşturduğu bulgularda ip/mac alanı olmadığından adresler
+    mesaj metninden çıkarılır; sayılar (ör. IP adedi) parmak izine girmez.
+
+    Returns:
+        tuple: Parmak izi
+    """
+    ip = finding.get("ip")
+    mac = finding.get("mac")
+    if ip is None and mac is None:
+        message = finding.get("message", "")
+        ip_match = IP_PATTERN.search(message)
+        mac_match = MAC_PATTERN.search(message)
+        ip = ip_match.group(0) if ip_match else None
+        mac = mac_match.group(0).lower().replace("-", ":") if mac_match else None
+    return finding.get("type", "other"), ip, mac
+
+
+class TokenBucket:
+    """Basit jeton kovası: saniyede 'rate' jeton, en fazla 'burst' jeton."""
+
+    def __init__(self, rate, burst, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.clock = clock
+        self.updated = clock()
+
+    def take(self, now=None):
+        """Bir jeton harcar; jeton yoksa False döndürür."""
+        now = self.clock() if now is None else now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class AlertManager:
+    """
+    Bulguları parmak izine göre tekilleştiren, bastıran, hız sınırlayan ve yükselten yönetici.
+    """
+
+    def __init__(self, suppress_window=900.0, rate=1 / 60, burst=5, escalation_factor=2.0,
+                 max_fingerprints=4096, clock=time.monotonic):
+        """
+        Args:
+            suppress_window (float): Aynı durum için tekrar uyarı verilmeyecek süre (saniye)
+            rate (float): Saniyede yenilenen uyarı jetonu (varsayılan: dakikada bir)
+            burst (int): Art arda verilebilecek en fazla uyarı
+            escalation_factor (float): Büyüklük bu oranda artarsa uyarı yükseltilir
+            max_fingerprints (int): Hatırlanan en fazla durum sayısı (en eski unutulur)
+            clock (callable): Zaman kaynağı
+        """
+        self.suppress_window = suppress_window
+        self.escalation_factor = escalation_factor
+        self.max_fingerprints = max_fingerprints
+        self.clock = clock
+        self.bucket = TokenBucket(rate, burst, clock)
+        self.states = OrderedDict()  # parmak izi -> [son uyarı, son görülme, önem, büyüklük]
+        self.lock = threading.Lock()
+        self.pending_suppressed = 0
+        self.stats = {"alerted": 0, "escalated": 0, "suppressed": 0, "rate_limited": 0}
+
+    def admit(self, finding, now=None):
+        """
+        Bir bulgunun uyarı olarak iletilip iletilmeyeceğine karar verir.
+
+        Returns:
+            dict: İletilecek bulgu (gerekirse "escalated" ve "suppressed_count" alanlarıyla),
+                  bastırıldıysa None
+        """
+        now = self.clock() if now is None else now
+        key = alert_fingerprint(finding)
+        rank, magnitude = finding_rank(finding), finding_magnitude(finding)
+        with self.lock:
+            state = self.states.get(key)
+            # Pencere boyunca görülmeyen durum sona ermiş sayılır; tekrar görülürse yeni uyarı
+            if state is not None and now - state[1] > self.suppress_window:
+                state = None
+            escalated = (state is not None and
+                         (rank > state[2] or magnitude >= state[3] * self.escalation_factor))
+            if state is not None and not escalated and now - state[0] < self.suppress_window:
+                state[1] = now
+                self.states.move_to_end(key)
+                self.stats["suppressed"] += 1
+                return None
+
+            if not self.bucket.take(now):
+                if state is not None:
+                    state[1] = now
+                self.pending_suppressed += 1
+                self.stats["rate_limited"] += 1
+                return None
+
+            self.states[key] = [now, now, rank, magnitude]
+            self.states.move_to_end(key)
+            while len(self.states) > self.max_fingerprints:
+                self.states.popitem(last=False)
+
+            alert = dict(finding)
+            if escalated:
+                alert["escalated"] = True
+                self.stats["escalated"] += 1
+            if self.pending_suppressed:
+                alert["suppressed_count"] = self.pending_suppressed
+                self.pending_suppressed = 0
+            self.stats["alerted"] += 1
+            return alert
+
+    def export_state(self, now=None):
+        """
+        Kontrol noktası (arp_state) için durumu saatten bağımsız biçimde döndürür: zamanlar
+        "kaç saniye önce" olarak verilir.
+
+        Returns:
+            dict: {"states": [(parmak izi, son uyarı yaşı, son görülme yaşı, önem, büyüklük)],
+                   "tokens", "bucket_age", "pending_suppressed", "stats"}
+        """
+        now = self.clock() if now is None else now
+        with self.lock:
+            return {
+                "states": [(key, now - state[0], now - state[1], state[2], state[3])
+                           for key, state in self.states.items()],
+                "tokens": self.bucket.tokens,
+                "bucket_age": now - self.bucket.updated,
+                "pending_suppressed": self.pending_suppressed,
+                "stats": dict(self.stats),
+            }
+
+    def restore_state(self, state, elapsed=0.0, now=None):
+        """
+        export_state() çıktısını yükler. Bastırma pencereleri ve jeton kovası süreç kapalıyken
+        geçen süre ('elapsed') kadar ilerletilir; pencereyi çoktan geçmiş durumlar atılır.
+        """
+        now = self.clock() if now is None else now
+        base = now - max(0.0, elapsed)
+        with self.lock:
+            for key, alert_age, seen_age, rank, magnitude in state["states"]:
+                if elapsed + seen_age <= self.suppress_window:
+                    self.states[key] = [base - alert_age, base - seen_age, rank, magnitude]
+                    self.states.move_to_end(key)
+            while len(self.states) > self.max_fingerprints:
+                self.states.popitem(last=False)
+            self.bucket.tokens = min(self.bucket.burst, state["tokens"])
+            self.bucket.updated = base - state["bucket_age"]
+            self.pending_suppressed += state["pending_suppressed"]
+            for key, count in state["stats"].items():
+                if key in self.stats:
+                    self.stats[key] += count
+
+    def filter(self, findings, now=None):
+        """
+        Bulgu listesinden uyarı verilecek olanları döndürür.
+
+        Returns:
+            list: İletilecek bulgular
+        """
+        alerts = []
+        for finding in findings:
+            alert = self.admit(finding, now)
+            if alert is not None:
+                alerts.append(alert)
+        return alerts
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Güvenilir Statik Bağlama Temel Çizgisi (Baseline)
+"10.0.0.1 her zaman 00:11:22:33:44:55'tir" bilgisini araca vermek için kullanılan dosya.
+Dosyadaki bağlamalar karma tablolarına (dict/set) yüklenir; tespit sırasında her kayıt O(1)
+aramayla sınıflandırılır:
+
+- Temel çizgiyle birebir uyan bağlamalar sezgisel kontrollere hiç girmez (hızlı yol), böylece
+  router'lar her taramada "Router olabilir" bilgi gürültüsü üretmez,
+- Temel çizgideki bir IP farklı bir MAC ile görülürse hemen tehlike olarak raporlanır.
+
+Dosya değiştiğinde (mtime/boyut/inode) yeniden okunur ve yeni dizinler tek bir atamayla
+devreye alınır; GUI veya bekçi yeniden başlatılmaz. Hatalı bir düzenleme önceki geçerli
+temel çizgiyi bozmaz.
+
+Dosya biçimi (# ile başlayan satırlar yorumdur):
+    10.0.0.1     00:11:22:33:44:55    # IP ve güvenilir MAC
+    multi        00:11:22:33:44:55    # Birden fazla IP'si olabilecek MAC (router vb.)
+
+Kullanım:
+    python arp_spoofing_detector.py --baseline baseline.txt
+    python arp_baseline.py baseline.txt          # Dosyayı doğrula
+"""
+
+import argparse
+import ipaddress
+import os
+import threading
+import time
+
+# Sınıflandırma sonuçları
+BASELINE_TRUSTED = "trusted"
+BASELINE_MISMATCH = "mismatch"
+BASELINE_UNKNOWN = "unknown"
+
+MULTI_IP_KEYWORD = "multi"
+
+# Dosya okunamadığında (ör. silindi) kullanılan imza
+MISSING_SIGNATURE = ("missing",)
+
+
+def normalize_mac(mac):
+    """
+    MAC adresini ARP tablosundaki karşılaştırma biçimine (küçük harf, ':' ayraçlı) çevirir.
+
+    Raises:
+        ValueError: Geçersiz MAC adresi
+    """
+    parts = mac.replace("-", ":").split(":")
+    if len(parts) != 6 or not all(1 <= len(part) <= 2 for part in parts):
+        raise ValueError(mac)
+    return ":".join(f"{int(part, 16):02x}" for part in parts)
+
+
+def canonical_mac(mac):
+    """
+    Tablodan okunan MAC adresini normalize_mac() biçimine getirir; geçersizse küçük harfli
+    halini döndürür. Zaten standart biçimdeki adresler ayrıştırılmaz (hızlı yol) ve aynı nesne
+    döndürülür; büyük tablolarda kopya tutulmaz.
+    """
+    lowered = mac.lower()
+    if len(lowered) == 17 and lowered[2::3] == ":::::":
+        return mac if lowered == mac else lowered
+    try:
+        return normalize_mac(lowered)
+    except ValueError:
+        return lowered
+
+
+def parse_baseline(lines):
+    """
+    Temel çizgi satırlarını ayrıştırır.
+
+    Args:
+        lines (iterable): Dosya satırları
+
+    Returns:
+        tuple: (bindings {ip: mac}, multi_ip_macs set)
+
+    Raises:
+        ValueError: Geçersiz satır veya aynı IP için çelişen iki MAC varsa
+    """
+    bindings = {}
+    multi_ip_macs = set()
+    for number, line in enumerate(lines, 1):
+        fields = line.split("#", 1)[0].split()
+        if not fields:
+            continue
+        if len(fields) != 2:
+            raise ValueError(f"Satır {number}: 'IP MAC' veya '{MULTI_IP_KEYWORD} MAC' bekleniyordu")
+        key, mac = fields
+        try:
+            mac = normalize_mac(mac)
+        except ValueError:
+            raise ValueError(f"Satır {number}: geçersiz MAC adresi: {fields[1]}") from None
+        if key.lower() == MULTI_IP_KEYWORD:
+            multi_ip_macs.add(mac)
+            continue
+        try:
+            ip = str(ipaddress.IPv4Address(key))
+        except ValueError:
+            raise ValueError(f"Satır {number}: geçersiz IP adresi: {key}") from None
+        if bindings.get(ip, mac) != mac:
+            raise ValueError(f"Satır {number}: {ip} için çelişen MAC adresleri: {bindings[ip]}, {mac}")
+        bindings[ip] = mac
+    return bindings, frozenset(multi_ip_macs)
+
+
+class TrustedBaseline:
+    """
+    Dosyadan yüklenen ve değiştiğinde kendini yenileyen güvenilir bağlama tablosu.
+    """
+
+    def __init__(self, path, check_interval=1.0, clock=time.monotonic):
+        """
+        Args:
+            path (str): Temel çizgi dosyası
+            check_interval (float): Dosya değişikliğinin en sık kontrol edilme aralığı (saniye)
+            clock (callable): Zaman kaynağı
+
+        Raises:
+            OSError, ValueError: İlk yükleme başarısızsa
+        """
+        self.path = path
+        self.check_interval = check_interval
+        self.clock = clock
+        self.version = 0
+        self.last_error = None
+        self.failed_reloads = 0  # Başarısız yeniden yükleme sayısı (aynı hatalı dosya bir kez sayılır)
+        self._signature = None
+        self._failed_signature = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        # (bindings, multi_ip_macs) tek bir referansla değiştirilir; okuyucular kilit almaz
+        self._indexes = ({}, frozenset())
+        self._load(self._stat())
+
+    def _stat(self):
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _load(self, signature):
+        with open(self.path, encoding="utf-8") as baseline_file:
+            indexes = parse_baseline(baseline_file)
+        self._indexes = indexes
+        self._signature = signature
+        self._failed_signature = None
+        self.version += 1
+        self.last_error = None
+
+    def reload_if_changed(self, force=False):
+        """
+        Dosya değiştiyse yeniden yükler. Kontrol check_interval ile sınırlıdır; sık çağrılması
+        (ör. bekçinin her kontrolünde) yalnızca bir saat okumasına mal olur.
+
+        Hatalı bir dosya, değişene kadar yeniden denenmez; her başarısız yükleme
+        `failed_reloads` sayacını bir kez artırır ve hata `last_error` içinde kalır.
+
+        Returns:
+            bool: Yeni bir temel çizgi devreye alındıysa True
+        """
+        now = self.clock()
+        if not force and now < self._next_check:
+            return False
+        with self._lock:
+            self._next_check = now + self.check_interval
+            signature = MISSING_SIGNATURE
+            try:
+                signature = self._stat()
+                if not force and signature in (self._signature, self._failed_signature):
+                    return False
+                self._load(signature)
+                return True
+            except (OSError, ValueError) as error:
+                # Yarım kalmış veya hatalı düzenleme: önceki geçerli temel çizgi kullanılmaya devam eder
+                if signature != self._failed_signature or force:
+                    self.failed_reloads += 1
+                self._failed_signature = signature
+                self.last_error = str(error)
+                return False
+
+    def snapshot(self):
+        """
+        Tutarlı bir dizin çifti döndürür (tek tarama boyunca bunu kullanın).
+
+        Returns:
+            tuple: (bindings {ip: mac}, multi_ip_macs frozenset)
+        """
+        return self._indexes
+
+    def expected_mac(self, ip):
+        """IP için güvenilir MAC adresi (yoksa None)."""
+        return self._indexes[0].get(ip)
+
+    def classify(self, ip, mac):
+        """
+        Bir bağlamayı temel çizgiye göre sınıflandırır.
+
+        Returns:
+            str: BASELINE_TRUSTED, BASELINE_MISMATCH veya BASELINE_UNKNOWN
+        """
+        bindings, multi_ip_macs = self._indexes
+        expected = bindings.get(ip)
+        if expected is not None:
+            return BASELINE_TRUSTED if expected == mac else BASELINE_MISMATCH
+        return BASELINE_TRUSTED if mac in multi_ip_macs else BASELINE_UNKNOWN
+
+
+def mismatch_finding(ip, mac, expected):
+    """Temel çizgiden sapma için bulgu sözlüğü üretir."""
+    return {
+        "type": "baseline_mismatch",
+        "ip": ip,
+        "mac": mac,
+        "expected_mac": expected,
+        "message": f"❌ TEHLİKE: {ip} temel çizgide {expected} olarak kayıtlı, ancak {mac} görüldü!"
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Güvenilir bağlama dosyasını doğrular")
+    parser.add_argument("path", help="Temel çizgi dosyası")
+    args = parser.parse_args(argv)
+    try:
+        baseline = TrustedBaseline(args.path)
+    except (OSError, ValueError) as error:
+        print(f"❌ Temel çizgi yüklenemedi: {error}")
+        return 1
+    bindings, multi_ip_macs = baseline.snapshot()
+    print(f"✅ {len(bindings)} güvenilir bağlama, {len(multi_ip_macs)} çok IP'li MAC yüklendi.")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
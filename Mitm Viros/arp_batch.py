@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Toplu (Batch) Analiz
+Olay müdahalesinde birçok makineden toplanan 'arp -a' / 'ip neigh' dökümlerini ve pcap
+dosyalarını bir süreç havuzunda paralel olarak analiz eder. Her dosyanın sonucu biter bitmez
+JSON Lines olarak yazılır; sonunda dosyalar arası bir özet üretilir:
+
+- Aynı ağ geçidi IP'si farklı dökümlerde farklı MAC'lere çözülüyorsa (bazı makineler zehirlenmiş)
+- Aynı MAC birden fazla dökümde farklı ağ geçidi IP'leri için görülüyorsa
+
+Dosyalar birbirinden bağımsız işlendiğinden verim çekirdek sayısıyla doğrusal ölçeklenir.
+
+Kullanım:
+    python arp_batch.py toplanan_dokumler/ --jobs 8 > sonuclar.jsonl
+    python arp_batch.py "dokumler/*.txt" "yakalamalar/*.pcap"
+"""
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+
+PCAP_MAGICS = (b"\xd4\xc3\xb2\xa1", b"\xa1\xb2\xc3\xd4", b"\x4d\x3c\xb2\xa1", b"\xa1\xb2\x3c\x4d")
+
+# Dökümle birlikte kaydedilmiş rota / ipconfig çıktısından ağ geçidi
+GATEWAY_PATTERNS = [
+    re.compile(r"default via (\d+\.\d+\.\d+\.\d+)"),
+    re.compile(r"(?:Default Gateway|Varsayılan Ağ Geçidi)[ .]*:\s*(\d+\.\d+\.\d+\.\d+)"),
+    re.compile(r"^0\.0\.0\.0\s+0\.0\.0\.0\s+(\d+\.\d+\.\d+\.\d+)", re.MULTILINE),  # route print
+]
+
+
+def collect_inputs(patterns):
+    """
+    Dizin, glob veya dosya yollarını analiz edilecek dosya listesine çevirir.
+
+    Returns:
+        list: Sıralı ve tekilleştirilmiş dosya yolları
+    """
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, _, files in os.walk(pattern):
+                paths.update(os.path.join(root, name) for name in files)
+        else:
+            paths.update(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+    return sorted(paths)
+
+
+def read_dump_text(path):
+    """Döküm dosyasını okur (PowerShell yönlendirmesiyle oluşan UTF-16 dahil)."""
+    with open(path, "rb") as dump_file:
+        data = dump_file.read()
+    if data.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return data.decode("utf-16", errors="replace")
+    return data.decode("utf-8", errors="replace")
+
+
+def guess_gateway(text, arp_table):
+    """
+    Döküm metninden veya tablo içeriğinden ağ geçidi IP'sini tahmin eder.
+
+    Returns:
+        tuple: (ip, kaynak) - kaynak "route" veya "heuristic"; bulunamazsa (None, None)
+    """
+    if text:
+        for pattern in GATEWAY_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                return match.group(1), "route"
+    # Araçtaki diğer kurallarla aynı varsayım: .1 veya .254 genellikle ağ geçididir
+    for suffix in (".1", ".254"):
+        for entry in arp_table:
+            if entry["ip"].endswith(suffix):
+                return entry["ip"], "heuristic"
+    return None, None
+
+
+def _load_pcap(path):
+    from arp_capture import decode_arp, iter_pcap
+    from arp_correlation import DiscrepancyEngine
+
+    engine = DiscrepancyEngine()
+    bindings = {}
+    findings = []
+    packets = 0
+    for timestamp, frame in iter_pcap(path):
+        packet = decode_arp(frame)
+        if packet is None or packet["sender_ip"] == "0.0.0.0":
+            continue
+        packets += 1
+        bindings[(packet["sender_ip"], packet["sender_mac"])] = None
+        findings.extend(engine.observe_wire(packet, timestamp))
+    arp_table = [{"ip": ip, "mac": mac, "interface": "pcap"} for ip, mac in bindings]
+    return arp_table, findings, packets
+
+
+def _load_dump(path):
+    from arp_detector import arp_tablosunu_isle
+
+    text = read_dump_text(path)
+    arp_table = [{"ip": ip, "mac": mac.replace("-", ":"), "interface": "dump"}
+                 for mac, ips in arp_tablosunu_isle(text).items() for ip in ips]
+    return arp_table, text
+
+
+def analyze_file(path):
+    """
+    Tek bir döküm veya pcap dosyasını analiz eder (süreç havuzunda çalışır).
+
+    Returns:
+        dict: {"file", "kind", "entries", "gateway", "findings", "seconds"} veya {"file", "error"}
+    """
+    from arp_spoofing_detector import detect_arp_spoofing
+
+    started = time.perf_counter()
+    try:
+        with open(path, "rb") as input_file:
+            is_pcap = input_file.read(4) in PCAP_MAGICS
+        if is_pcap:
+            arp_table, findings, packets = _load_pcap(path)
+            text = None
+        else:
+            arp_table, text = _load_dump(path)
+            findings, packets = [], None
+
+        gateway_ip, gateway_source = guess_gateway(text, arp_table)
+        gateway_macs = sorted({entry["mac"] for entry in arp_table if entry["ip"] == gateway_ip})
+        gateway = {"ip": gateway_ip or "Bilinmiyor", "mac": gateway_macs[0] if gateway_macs else "Bilinmiyor"}
+        findings.extend(finding for finding in detect_arp_spoofing(arp_table, gateway=gateway)
+                        if finding["type"] != "info_other")
+    except (OSError, ValueError) as error:
+        return {"file": path, "error": str(error)}
+
+    result = {
+        "file": path,
+        "kind": "pcap" if is_pcap else "dump",
+        "entries": len(arp_table),
+        "gateway": {"ip": gateway_ip, "macs": gateway_macs, "source": gateway_source},
+        "findings": findings,
+        "seconds": round(time.perf_counter() - started, 4),
+    }
+    if packets is not None:
+        result["arp_packets"] = packets
+    return result
+
+
+class CrossFileSummary:
+    """Dosya sonuçlarını biriktirip dosyalar arası bulguları üretir."""
+
+    def __init__(self):
+        self.files = 0
+        self.errors = 0
+        self.finding_counts = defaultdict(int)
+        self.gateway_ip_macs = defaultdict(lambda: defaultdict(list))  # ip -> mac -> [dosya]
+        self.gateway_mac_ips = defaultdict(lambda: defaultdict(list))  # mac -> ip -> [dosya]
+
+    def add(self, result):
+        """Bir dosya sonucunu özete ekler."""
+        self.files += 1
+        if "error" in result:
+            self.errors += 1
+            return
+        for finding in result["findings"]:
+            self.finding_counts[finding["type"]] += 1
+        gateway_ip = result["gateway"]["ip"]
+        for mac in result["gateway"]["macs"]:
+            self.gateway_ip_macs[gateway_ip][mac].append(result["file"])
+            self.gateway_mac_ips[mac][gateway_ip].append(result["file"])
+
+    def findings(self):
+        """
+        Dosyalar arası bulguları döndürür.
+
+        Returns:
+            list: Bulgu sözlükleri
+        """
+        findings = []
+        for ip, macs in self.gateway_ip_macs.items():
+            if len(macs) > 1:
+                findings.append({
+                    "type": "batch_gateway_split",
+                    "ip": ip,
+                    "macs": {mac: files for mac, files in macs.items()},
+                    "message": f"❌ TEHLİKE: Ağ geçidi {ip} dökümlerde {len(macs)} farklı MAC adresine çözülüyor: {', '.join(sorted(macs))}"
+                })
+        for mac, ips in self.gateway_mac_ips.items():
+            if len(ips) > 1:
+                findings.append({
+                    "type": "batch_gateway_mac_shared",
+                    "mac": mac,
+                    "ips": {ip: files for ip, files in ips.items()},
+                    "message": f"⚠️ Şüpheli: {mac} MAC adresi dökümlerde {len(ips)} farklı ağ geçidi IP'si için görülüyor: {', '.join(sorted(ips))}"
+                })
+        return findings
+
+    def as_record(self):
+        """JSON Lines çıktısı için özet kaydı."""
+        return {
+            "record": "summary",
+            "files": self.files,
+            "errors": self.errors,
+            "finding_counts": dict(self.finding_counts),
+            "gateways": {ip: {mac: len(files) for mac, files in macs.items()}
+                         for ip, macs in self.gateway_ip_macs.items()},
+            "findings": self.findings(),
+        }
+
+
+def main(argv=None):
+    """Komut satırından toplu analizi çalıştırır."""
+    parser = argparse.ArgumentParser(description="ARP Spoofing Tespit Aracı - Toplu döküm/pcap analizi")
+    parser.add_argument("inputs", nargs="+", help="Dizin, glob veya dosya yolları")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Paralel süreç sayısı")
+    parser.add_argument("--output", default=None, help="JSON Lines çıktı dosyası (varsayılan: stdout)")
+    args = parser.parse_args(argv)
+
+    paths = collect_inputs(args.inputs)
+    if not paths:
+        print("❌ Analiz edilecek dosya bulunamadı.", file=sys.stderr)
+        return 1
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    summary = CrossFileSummary()
+    started = time.perf_counter()
+    try:
+        with multiprocessing.Pool(min(args.jobs, len(paths))) as pool:
+            # Küçük dosyalarda süreçler arası iletişim maliyetini azaltmak için parça boyutu
+            chunksize = max(1, len(paths) // (args.jobs * 8))
+            for result in pool.imap_unordered(analyze_file, paths, chunksize):
+                result["record"] = "file"
+                output.write(json.dumps(result, ensure_ascii=False) + "\n")
+                output.flush()
+                summary.add(result)
+        output.write(json.dumps(summary.as_record(), ensure_ascii=False) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"\n📊 {summary.files} dosya {elapsed:.2f} sn içinde analiz edildi ({summary.errors} hata)", file=sys.stderr)
+    for finding_type, count in sorted(summary.finding_counts.items()):
+        print(f"   {finding_type}: {count}", file=sys.stderr)
+    for finding in summary.findings():
+        print(finding["message"], file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Tespit Sonucu Önbelleği
+Periyodik modda komşu tablosu çoğu zaman iki tarama arasında değişmez. Bu modül tablonun
+içerik parmak izini (sıralı (ip, mac, arayüz) demetlerinin hash'i) hesaplar ve küçük bir
+LRU önbellekte analiz sonuçlarını saklar; aynı tablo için analiz tekrar yapılmaz.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+
+def table_fingerprint(arp_table, *extra):
+    """
+    ARP tablosunun sıradan bağımsız içerik parmak izini hesaplar.
+
+    Args:
+        arp_table (list): ARP tablosu kayıtları
+        *extra: Parmak izine eklenecek ek değerler (ör. ağ geçidi IP/MAC)
+
+    Returns:
+        str: Onaltılık (hex) parmak izi
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    rows = sorted((entry["ip"], entry["mac"].lower(), entry.get("interface", ""))
+                  for entry in arp_table)
+    for ip, mac, interface in rows:
+        digest.update(f"{ip}|{mac}|{interface}\n".encode("utf-8"))
+    for value in extra:
+        digest.update(repr(value).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """Parmak izi -> sonuç eşlemesini tutan küçük, en son kullanılan öncelikli önbellek."""
+
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Anahtarın sonucunu döndürür, yoksa None."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        """Sonucu önbelleğe ekler, gerekirse en eski kaydı atar."""
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """Önbelleği boşaltır."""
+        self.entries.clear()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Paket Yakalama ve Çözümleme
+Linux'ta AF_PACKET ham soketi ile canlı trafik yakalar veya klasik pcap dosyalarını okur.
+Ethernet (802.1Q VLAN dahil), ARP ve IPv4/UDP başlıklarını standart kütüphane ile çözer.
+Canlı yakalama root yetkisi (veya CAP_NET_RAW) gerektirir.
+"""
+
+import socket
+import struct
+import time
+
+ETH_P_ALL = 0x0003
+ETH_P_IP = 0x0800
+ETH_P_ARP = 0x0806
+ETH_P_8021Q = 0x8100
+
+ARP_REQUEST = 1
+ARP_REPLY = 2
+
+ETHERNET_HEADER = struct.Struct("!6s6sH")
+ARP_PACKET = struct.Struct("!HHBBH6s4s6s4s")
+PCAP_GLOBAL_HEADER = struct.Struct("<IHHiIII")
+
+PCAP_MAGIC = 0xA1B2C3D4
+PCAP_MAGIC_NANO = 0xA1B23C4D
+LINKTYPE_ETHERNET = 1
+
+
+def format_mac(mac_bytes):
+    """Binary MAC adresini okunabilir formata çevirir."""
+    return mac_bytes.hex(":")
+
+
+def parse_ethernet(frame):
+    """
+    Ethernet başlığını çözer (tek 802.1Q VLAN etiketi desteklenir).
+
+    Args:
+        frame (bytes): Ham Ethernet çerçevesi
+
+    Returns:
+        tuple: (hedef_mac, kaynak_mac, ethertype, yük) veya çerçeve kısaysa None
+    """
+    if len(frame) < ETHERNET_HEADER.size:
+        return None
+    destination, source, ethertype = ETHERNET_HEADER.unpack_from(frame, 0)
+    offset = ETHERNET_HEADER.size
+    if ethertype == ETH_P_8021Q and len(frame) >= offset + 4:
+        ethertype = struct.unpack_from("!H", frame, offset + 2)[0]
+        offset += 4
+    return destination, source, ethertype, memoryview(frame)[offset:]
+
+
+def decode_arp(frame):
+    """
+    Ethernet çerçevesindeki ARP paketini çözer.
+
+    Returns:
+        dict: {"op", "eth_src", "sender_mac", "sender_ip", "target_mac", "target_ip"};
+              ARP (IPv4/Ethernet) değilse None
+    """
+    parsed = parse_ethernet(frame)
+    if parsed is None or parsed[2] != ETH_P_ARP or len(parsed[3]) < ARP_PACKET.size:
+        return None
+    hardware, protocol, hw_len, proto_len, op, sha, spa, tha, tpa = ARP_PACKET.unpack_from(parsed[3], 0)
+    if hardware != 1 or protocol != ETH_P_IP or hw_len != 6 or proto_len != 4:
+        return None
+    return {
+        "op": op,
+        "eth_src": format_mac(parsed[1]),
+        "sender_mac": format_mac(sha),
+        "sender_ip": socket.inet_ntoa(spa),
+        "target_mac": format_mac(tha),
+        "target_ip": socket.inet_ntoa(tpa),
+    }
+
+
+def decode_udp(frame):
+    """
+    Ethernet çerçevesindeki IPv4/UDP paketini çözer.
+
+    Returns:
+        tuple: (kaynak_mac, kaynak_ip, hedef_ip, kaynak_port, hedef_port, yük);
+               IPv4/UDP değilse veya parçalıysa None
+    """
+    parsed = parse_ethernet(frame)
+    if parsed is None or parsed[2] != ETH_P_IP:
+        return None
+    packet = parsed[3]
+    if len(packet) < 20 or packet[0] >> 4 != 4 or packet[9] != socket.IPPROTO_UDP:
+        return None
+    header_length = (packet[0] & 0x0F) * 4
+    fragment = struct.unpack_from("!H", packet, 6)[0]
+    if fragment & 0x3FFF:  # Parçalanmış paketler desteklenmez
+        return None
+    if len(packet) < header_length + 8:
+        return None
+    source_port, destination_port, length = struct.unpack_from("!HHH", packet, header_length)
+    payload = packet[header_length + 8:header_length + max(length, 8)]
+    return (format_mac(parsed[1]), socket.inet_ntoa(packet[12:16]), socket.inet_ntoa(packet[16:20]),
+            source_port, destination_port, payload)
+
+
+def open_capture_socket(interface=None, timeout=0.5):
+    """
+    Canlı yakalama için AF_PACKET ham soketi açar (yalnızca Linux).
+
+    Args:
+        interface (str): Dinlenecek arayüz (None: tüm arayüzler)
+        timeout (float): recv zaman aşımı; iptal kontrolü için kullanılır
+
+    Returns:
+        socket.socket: Ham soket
+
+    Raises:
+        OSError: Platform desteklemiyorsa veya yetki yoksa
+    """
+    if not hasattr(socket, "AF_PACKET"):
+        raise OSError("Canlı paket yakalama yalnızca Linux'ta (AF_PACKET) destekleniyor")
+    capture = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(ETH_P_ALL))
+    if interface:
+        capture.bind((interface, 0))
+    capture.settimeout(timeout)
+    return capture
+
+
+def iter_live_frames(capture, stop_event=None):
+    """
+    Ham soketten çerçeveleri okur.
+
+    Yields:
+        tuple: (zaman_damgası, çerçeve)
+    """
+    while stop_event is None or not stop_event.is_set():
+        try:
+            frame = capture.recv(65535)
+        except socket.timeout:
+            continue
+        yield time.time(), frame
+
+
+def iter_pcap(path):
+    """
+    Klasik pcap dosyasındaki Ethernet çerçevelerini okur.
+
+    Yields:
+        tuple: (zaman_damgası, çerçeve)
+
+    Raises:
+        ValueError: Dosya pcap değilse veya bağlantı türü Ethernet değilse
+    """
+    with open(path, "rb") as pcap_file:
+        header = pcap_file.read(PCAP_GLOBAL_HEADER.size)
+        if len(header) < PCAP_GLOBAL_HEADER.size:
+            raise ValueError("Geçersiz pcap dosyası")
+        magic = struct.unpack("<I", header[:4])[0]
+        if magic in (PCAP_MAGIC, PCAP_MAGIC_NANO):
+            endian = "<"
+        elif magic in (0xD4C3B2A1, 0x4D3CB2A1):
+            endian = ">"
+            magic = struct.unpack(">I", header[:4])[0]
+        else:
+            raise ValueError("Geçersiz pcap dosyası (pcapng desteklenmiyor)")
+        linktype = struct.unpack(endian + "IHHiIII", header)[6]
+        if linktype != LINKTYPE_ETHERNET:
+            raise ValueError(f"Desteklenmeyen bağlantı türü: {linktype}")
+
+        divisor = 1e9 if magic == PCAP_MAGIC_NANO else 1e6
+        record = struct.Struct(endian + "IIII")
+        while True:
+            record_header = pcap_file.read(record.size)
+            if len(record_header) < record.size:
+                return
+            seconds, fraction, captured_length, _ = record.unpack(record_header)
+            frame = pcap_file.read(captured_length)
+            if len(frame) < captured_length:
+                return
+            yield seconds + fraction / divisor, frame
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Komut Çalıştırma Yardımcıları
+'arp' / 'ip neigh' gibi yedek komutları kesin zaman aşımı ve iptal desteğiyle çalıştırır.
+Çıktı, tüm tamponun dolması beklenmeden borudan satır satır okunur.
+"""
+
+import subprocess
+import threading
+import time
+
+# Yedek komutlar için varsayılan kesin zaman aşımı (saniye)
+COMMAND_TIMEOUT = 5.0
+
+
+class ScanCancelled(Exception):
+    """Tarama kullanıcı tarafından (ör. GUI'deki DURDUR butonu) iptal edildiğinde fırlatılır."""
+
+
+def stream_command(args, timeout=COMMAND_TIMEOUT, cancel_event=None):
+    """
+    Bir komutu çalıştırır ve çıktısını satır satır döndürür.
+
+    Komut ayrı bir süreçte çalışır; bir izleyici thread, süre dolduğunda veya
+    `cancel_event` ayarlandığında süreci sonlandırır. Böylece ters DNS sorgusu gibi
+    nedenlerle takılan bir komut, tarama thread'ini bloke etmez.
+
+    Args:
+        args (list): Çalıştırılacak komut ve argümanları
+        timeout (float): Kesin zaman aşımı (saniye)
+        cancel_event (threading.Event): Ayarlandığında komut iptal edilir
+
+    Yields:
+        str: Çıktının her satırı (satır sonu karakteri olmadan)
+
+    Raises:
+        ScanCancelled: Komut iptal edildiğinde
+        subprocess.TimeoutExpired: Zaman aşımı dolduğunda
+        subprocess.CalledProcessError: Komut sıfırdan farklı kodla çıktığında
+        FileNotFoundError: Komut bulunamadığında
+    """
+    if cancel_event is not None and cancel_event.is_set():
+        raise ScanCancelled()
+
+    process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                               stdin=subprocess.DEVNULL, text=True, bufsize=1)
+    deadline = time.monotonic() + timeout
+    finished = threading.Event()
+    reason = []
+
+    def watch():
+        # Süreç bitene, süre dolana veya iptal gelene kadar bekle
+        while not finished.is_set() and process.poll() is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                reason.append("timeout")
+                break
+            if cancel_event is not None and cancel_event.wait(min(0.05, remaining)):
+                reason.append("cancel")
+                break
+            if cancel_event is None:
+                finished.wait(min(0.05, remaining))
+        if reason and process.poll() is None:
+            process.kill()
+
+    watcher = threading.Thread(target=watch, daemon=True)
+    watcher.start()
+
+    try:
+        for line in process.stdout:
+            yield line.rstrip("\n")
+        returncode = process.wait()
+    finally:
+        finished.set()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+        watcher.join()
+
+    if "cancel" in reason:
+        raise ScanCancelled()
+    if "timeout" in reason:
+        raise subprocess.TimeoutExpired(args, timeout)
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, args)
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Çekirdek Önbelleği / Kablo Tutarsızlık Motoru
+Çekirdeğin komşu önbelleği yalnızca hostun kabul ettiği bağlamaları gösterir; kablodaki
+ARP yanıtları başka şeyler iddia edebilir ve başka bir hostu hedefleyen saldırgan bizim
+önbelleğimizde hiç görünmez. Bu motor, dinlenen ARP akışını periyodik okunan çekirdek
+tablosuyla zaman pencereli bir indekste birleştirir ve son N saniye içinde önbellekle veya
+birbirleriyle çelişen bağlamaları raporlar. Bellek, pencere dışına çıkan kayıtlar atılarak
+sınırlı tutulur.
+
+Kullanım:
+    python arp_correlation.py --interface eth0 --window 10
+"""
+
+import argparse
+import threading
+import time
+from collections import deque
+
+from arp_capture import decode_arp, open_capture_socket, iter_live_frames, iter_pcap
+from arp_pipeline import ObservationPipeline, ClaimCoalescer
+from arp_rules import RuleEngine, EVENT_PACKET, packet_rules
+
+
+def wire_observation_key(packet):
+    """Kablo gözlemleri için birleştirme anahtarı: (gönderen IP, gönderen MAC, Ethernet kaynağı)."""
+    return packet["sender_ip"], packet["sender_mac"], packet["eth_src"]
+
+
+class DiscrepancyEngine:
+    """
+    Kablodaki ARP iddialarını ve çekirdek tablosunu zaman penceresi içinde karşılaştırır.
+
+    - wire_conflict: Aynı IP için pencere içinde farklı MAC'lerden iddia
+    - wire_kernel_mismatch: Kablodaki iddia ile çekirdek önbelleği uyuşmuyor
+    - wire_header_mismatch: Ethernet kaynak MAC'i ile ARP gönderen MAC'i farklı
+    """
+
+    def __init__(self, window=10.0, max_claims=100000, on_finding=None, clock=time.monotonic):
+        """
+        Args:
+            window (float): Korelasyon penceresi (saniye)
+            max_claims (int): Pencerede tutulacak en fazla iddia sayısı (bellek sınırı)
+            on_finding (callable): Yeni bulgu ile çağrılır
+            clock (callable): Zaman kaynağı
+        """
+        self.window = window
+        self.max_claims = max_claims
+        self.on_finding = on_finding
+        self.clock = clock
+
+        self.claims = {}  # ip -> {mac: son görülme}
+        self.order = deque()  # (zaman, ip, mac) - pencereden çıkarma sırası
+        self.kernel = {}  # ip -> mac (son çekirdek tablosu)
+        self.kernel_time = None
+        self.reported = {}  # bulgu anahtarı -> rapor zamanı
+        self.lock = threading.Lock()
+        self.evicted = 0
+
+    def _evict(self, now):
+        horizon = now - self.window
+        while self.order and (self.order[0][0] < horizon or len(self.order) > self.max_claims):
+            seen, ip, mac = self.order.popleft()
+            macs = self.claims.get(ip)
+            # Aynı iddia daha sonra tekrar görüldüyse kuyruktaki eski kopyayı atla
+            if macs is not None and macs.get(mac) == seen:
+                del macs[mac]
+                if not macs:
+                    del self.claims[ip]
+                self.evicted += 1
+        for key in [key for key, reported in self.reported.items() if reported < horizon]:
+            del self.reported[key]
+
+    def _report(self, findings, key, finding, now):
+        # Aynı bulgu pencere boyunca bir kez raporlanır
+        if key in self.reported:
+            return
+        self.reported[key] = now
+        findings.append(finding)
+        if self.on_finding:
+            self.on_finding(finding)
+
+    def observe_wire(self, packet, now=None):
+        """
+        Kablodan çözülen bir ARP paketini işler.
+
+        Args:
+            packet (dict): arp_capture.decode_arp() çıktısı
+            now (float): Gözlem zamanı
+
+        Returns:
+            list: Bu paketle oluşan yeni bulgular
+        """
+        now = self.clock() if now is None else now
+        ip, mac = packet["sender_ip"], packet["sender_mac"]
+        findings = []
+        if ip == "0.0.0.0":  # ARP probe: IP iddiası yok
+            return findings
+
+        with self.lock:
+            self._evict(now)
+
+            if packet["eth_src"] != mac:
+                self._report(findings, ("wire_header_mismatch", ip, packet["eth_src"], mac), {
+                    "type": "wire_header_mismatch",
+                    "ip": ip,
+                    "mac": mac,
+                    "eth_src": packet["eth_src"],
+                    "message": f"⚠️ Şüpheli: {ip} için ARP gönderen MAC {mac}, Ethernet kaynağı {packet['eth_src']}"
+                }, now)
+
+            macs = self.claims.setdefault(ip, {})
+            for other_mac in macs:
+                if other_mac != mac:
+                    pair = tuple(sorted((mac, other_mac)))
+                    self._report(findings, ("wire_conflict", ip) + pair, {
+                        "type": "wire_conflict",
+                        "ip": ip,
+                        "macs": list(pair),
+                        "message": f"❌ TEHLİKE: {ip} IP adresi son {self.window:.0f} sn içinde kabloda farklı MAC'lerle iddia edildi: {pair[0]}, {pair[1]}"
+                    }, now)
+            macs[mac] = now
+            self.order.append((now, ip, mac))
+
+            kernel_mac = self.kernel.get(ip)
+            if kernel_mac is not None and kernel_mac != mac and self._kernel_fresh(now):
+                findings.extend(self._kernel_mismatch(ip, kernel_mac, mac, now))
+        return findings
+
+    def observe_kernel(self, arp_table, now=None):
+        """
+        Çekirdekten okunan komşu tablosunu işler ve pencere içindeki iddialarla karşılaştırır.
+
+        Args:
+            arp_table (list): get_arp_table() biçiminde kayıtlar
+            now (float): Okuma zamanı
+
+        Returns:
+            list: Yeni bulgular
+        """
+        now = self.clock() if now is None else now
+        findings = []
+        with self.lock:
+            self._evict(now)
+            self.kernel = {entry["ip"]: entry["mac"].lower() for entry in arp_table}
+            self.kernel_time = now
+            for ip, kernel_mac in self.kernel.items():
+                for mac in self.claims.get(ip, ()):
+                    if mac != kernel_mac:
+                        findings.extend(self._kernel_mismatch(ip, kernel_mac, mac, now))
+        return findings
+
+    def _kernel_fresh(self, now):
+        return self.kernel_time is not None and now - self.kernel_time <= self.window
+
+    def _kernel_mismatch(self, ip, kernel_mac, wire_mac, now):
+        findings = []
+        self._report(findings, ("wire_kernel_mismatch", ip, kernel_mac, wire_mac), {
+            "type": "wire_kernel_mismatch",
+            "ip": ip,
+            "mac": wire_mac,
+            "kernel_mac": kernel_mac,
+            "message": f"❌ TEHLİKE: {ip} için kablodaki ARP {wire_mac} diyor, çekirdek önbelleği {kernel_mac}"
+        }, now)
+        return findings
+
+
+class WireMonitor:
+    """
+    ARP trafiğini dinleyip çekirdek tablosunu periyodik okuyarak motoru besleyen yardımcı.
+
+    Yakalama thread'i paketleri sınırlı bir gözlem hattına bırakır ve hiçbir zaman tespiti
+    beklemez; ayrı bir analiz thread'i hattı boşaltır. Ağ geçidine ait paketler atılmaz.
+    Tekrarlanan iddialar motora yalnızca pencere başına bir özet olarak ulaşır.
+    """
+
+    def __init__(self, engine, table_source, interface=None, kernel_interval=2.0,
+                 pipeline=None, gateway=None, rules=None):
+        """
+        Args:
+            engine (DiscrepancyEngine): Beslenecek motor
+            table_source (callable): Çekirdek tablosunu döndüren fonksiyon
+            interface (str): Dinlenecek arayüz
+            kernel_interval (float): Çekirdek tablosu okuma aralığı (saniye)
+            pipeline (ObservationPipeline): Gözlem hattı (varsayılan: 10000 kayıt)
+            gateway (tuple): (ip, mac) kritik ağ geçidi; None ise otomatik öğrenilir
+            rules (RuleEngine): Paket kuralları (varsayılan: yerleşik paket kuralları). Bulgular
+                motorun on_finding çağrısıyla raporlanır.
+        """
+        self.engine = engine
+        self.table_source = table_source
+        self.interface = interface
+        self.kernel_interval = kernel_interval
+        self.pipeline = pipeline or ObservationPipeline(key=wire_observation_key)
+        self.coalescer = ClaimCoalescer(window=min(5.0, engine.window / 2))
+        self.gateway = gateway
+        self.rules = rules if rules is not None else RuleEngine(packet_rules())
+        self._stop_event = threading.Event()
+        self._threads = []
+
+    def _capture_loop(self):
+        capture = open_capture_socket(self.interface)
+        try:
+            for _, frame in iter_live_frames(capture, self._stop_event):
+                packet = decode_arp(frame)
+                if packet is not None:
+                    packet["ip"], packet["mac"] = packet["sender_ip"], packet["sender_mac"]
+                    self.pipeline.put(packet)
+        finally:
+            capture.close()
+
+    def _analysis_loop(self):
+        while not self._stop_event.is_set():
+            for packet in self.pipeline.get_batch(timeout=0.5):
+                if self.coalescer.offer(packet, self.interface):
+                    self.engine.observe_wire(packet)
+                    self._apply_rules(packet)
+            for summary in self.coalescer.flush():
+                self.engine.observe_wire(summary)
+
+    def _apply_rules(self, packet):
+        findings = self.rules.dispatch(EVENT_PACKET, packet, {"gateway": self.gateway})
+        if findings and self.engine.on_finding:
+            for finding in findings:
+                self.engine.on_finding(finding)
+
+    def _kernel_loop(self):
+        while not self._stop_event.is_set():
+            table = self.table_source()
+            if table is not None:
+                self.engine.observe_kernel(table)
+            self._stop_event.wait(self.kernel_interval)
+
+    def start(self):
+        """Yakalama ve çekirdek okuma thread'lerini başlatır."""
+        if self.gateway is None:
+            from arp_watchdog import read_default_gateway_ip, read_neighbor_mac
+            gateway_ip = read_default_gateway_ip()
+            gateway_mac = read_neighbor_mac(gateway_ip) if gateway_ip else None
+            self.gateway = (gateway_ip, gateway_mac)
+        self.pipeline.set_critical([ip for ip in self.gateway[:1] if ip],
+                                   [mac for mac in self.gateway[1:] if mac])
+        self._stop_event.clear()
+        self._threads = [threading.Thread(target=self._capture_loop, daemon=True),
+                         threading.Thread(target=self._analysis_loop, daemon=True),
+                         threading.Thread(target=self._kernel_loop, daemon=True)]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        """Thread'leri durdurur."""
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(1.0)
+
+
+def main(argv=None):
+    """Komut satırından tutarsızlık motorunu çalıştırır."""
+    parser = argparse.ArgumentParser(description="ARP Spoofing Tespit Aracı - Kablo/önbellek korelasyonu")
+    parser.add_argument("--interface", default=None, help="Canlı yakalama arayüzü")
+    parser.add_argument("--pcap", default=None, help="Okunacak pcap dosyası (yalnızca kablo karşılaştırması)")
+    parser.add_argument("--window", type=float, default=10.0, help="Korelasyon penceresi (saniye)")
+    parser.add_argument("--kernel-interval", type=float, default=2.0, help="Çekirdek tablosu okuma aralığı")
+    parser.add_argument("--rule-stats", action="store_true",
+                        help="Çıkışta paket kurallarının CPU süresi ve isabet sayılarını yazdır")
+    args = parser.parse_args(argv)
+
+    print_finding = lambda finding: print(finding["message"], flush=True)
+
+    if args.pcap:
+        # Kayıttaki zaman damgaları kullanılır
+        engine = DiscrepancyEngine(args.window, on_finding=print_finding)
+        coalescer = ClaimCoalescer(window=min(5.0, args.window / 2))
+        for timestamp, frame in iter_pcap(args.pcap):
+            packet = decode_arp(frame)
+            if packet is None:
+                continue
+            if coalescer.offer(packet, now=timestamp):
+                engine.observe_wire(packet, timestamp)
+            for summary in coalescer.flush(timestamp):
+                engine.observe_wire(summary, summary["last_seen"])
+        stats = coalescer.stats
+        print(f"📊 {stats['offered']} ARP paketi, tespite iletilen: {stats['forwarded']}, özet: {stats['summaries']}")
+        return 0
+
+    from arp_watchdog import read_proc_arp_table
+    table_source = read_proc_arp_table
+    if read_proc_arp_table() is None:
+        from arp_spoofing_detector import get_arp_table
+        table_source = get_arp_table
+
+    engine = DiscrepancyEngine(args.window, on_finding=print_finding)
+    monitor = WireMonitor(engine, table_source, args.interface, args.kernel_interval)
+    monitor.start()
+    print(f"🛡️  Kablo/önbellek korelasyonu aktif (pencere: {args.window:.0f} sn). Durdurmak için Ctrl+C.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        monitor.stop()
+        if args.rule_stats:
+            print("\n".join(monitor.rules.format_stats()))
+        stats = monitor.pipeline.stats
+        print(f"\n📊 Birleştirilen: {stats['coalesced']}, örneklemeyle atılan: {stats['sampled_out']}, "
+              f"kuyruk dolu atılan: {stats['dropped_full']}")
+        print("👋 Program sonlandırıldı.")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Yerel Canlı Pano (Server-Sent Events)
+Tek bir tarayıcının bellekteki durumunu (bağlamalar, bulgular, ölçümler) yerel bir web
+panosunda yayınlar. İzleyiciler bağlandığında bir anlık görüntü alır, ardından yalnızca
+artımlı güncellemeler (yeni/değişen/silinen bağlamalar, bulgular, ölçümler) SSE ile itilir.
+İzleyici başına tarama veya tablo dökümü yapılmaz; tüm dağıtım tek bir asyncio döngüsünde
+yürür. Yavaş bir izleyicinin kuyruğu dolarsa bağlantısı kesilir (tarayıcı yeniden bağlanıp
+güncel anlık görüntüyü alır), diğer izleyiciler etkilenmez.
+
+Kullanım:
+    python arp_dashboard.py --port 8765 --interval 10
+    python arp_spoofing_detector.py --dashboard 8765
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+
+VIEWER_QUEUE_SIZE = 256
+KEEPALIVE_INTERVAL = 15.0
+MAX_RECENT_FINDINGS = 200
+
+DASHBOARD_HTML = """<!DOCTYPE html>
+<html lang="tr"><head><meta charset="utf-8"><title>ARP Spoofing Tespit Aracı</title>
+<style>
+body{font-family:Segoe UI,sans-serif;background:#121212;color:#e0e0e0;margin:20px}
+h1{font-size:20px}table{border-collapse:collapse;width:100%}td,th{padding:4px 8px;border-bottom:1px solid #333;text-align:left}
+.critical{color:#f44336}.warning{color:#ff9800}.info{color:#90caf9}#metrics span{margin-right:20px}
+</style></head><body>
+<h1>ARP Spoofing Tespit Aracı - Canlı Pano</h1>
+<div id="metrics"></div>
+<h2>Bulgular</h2><ul id="findings"></ul>
+<h2>ARP Tablosu</h2><table><thead><tr><th>IP Adresi</th><th>MAC Adresi</th><th>Arayüz</th></tr></thead><tbody id="bindings"></tbody></table>
+<script>
+const bindings = new Map();
+const esc = v => String(v ?? "").replace(/[&<>"]/g, c => ({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}[c]));
+function renderBindings() {
+  const rows = [...bindings.entries()].sort().map(([ip, b]) => `<tr><td>${esc(ip)}</td><td>${esc(b.mac)}</td><td>${esc(b.interface)}</td></tr>`);
+  document.getElementById("bindings").innerHTML = rows.join("");
+}
+function addFinding(f) {
+  const li = document.createElement("li");
+  li.className = f.severity || "info";
+  li.textContent = (f.time || "") + " " + f.message;
+  const list = document.getElementById("findings");
+  list.insertBefore(li, list.firstChild);
+  while (list.children.length > 200) list.removeChild(list.lastChild);
+}
+function renderMetrics(m) {
+  document.getElementById("metrics").innerHTML = Object.entries(m).map(([k, v]) => `<span>${esc(k)}: <b>${esc(v)}</b></span>`).join("");
+}
+const source = new EventSource("/events");
+source.addEventListener("snapshot", e => {
+  const s = JSON.parse(e.data);
+  bindings.clear();
+  for (const [ip, b] of Object.entries(s.bindings)) bindings.set(ip, b);
+  document.getElementById("findings").innerHTML = "";
+  s.findings.forEach(addFinding);
+  renderBindings(); renderMetrics(s.metrics);
+});
+source.addEventListener("binding", e => {
+  const d = JSON.parse(e.data);
+  if (d.change === "removed") bindings.delete(d.ip); else bindings.set(d.ip, d);
+  renderBindings();
+});
+source.addEventListener("finding", e => addFinding(JSON.parse(e.data)));
+source.addEventListener("metrics", e => renderMetrics(JSON.parse(e.data)));
+</script></body></html>
+"""
+
+
+class DashboardServer:
+    """
+    Tarayıcı durumunu tutan ve SSE izleyicilerine artımlı olarak dağıtan pano sunucusu.
+
+    publish_table() ve write_batch() herhangi bir thread'den çağrılabilir; güncellemeler
+    asyncio döngüsüne call_soon_threadsafe ile aktarılır. write_batch/close sayesinde olay
+    yazıcısının (EventWriter) bir çıkışı olarak da kullanılabilir.
+    """
+
+    def __init__(self, host="127.0.0.1", port=8765):
+        self.host = host
+        self.port = port
+        self.bindings = {}  # ip -> {"mac", "interface"}
+        self.findings = deque(maxlen=MAX_RECENT_FINDINGS)
+        self.metrics = {"taramalar": 0, "kayıt": 0, "bulgu": 0, "izleyici": 0, "son_tarama": "-"}
+        self.viewers = set()
+        self.event_id = 0
+        self.loop = None
+        self.server = None
+        self._thread = None
+        self._ready = threading.Event()
+        self.error = None  # Sunucu başlatılamadıysa (ör. port kullanımda) hata
+
+    # ---- Durum güncellemeleri (herhangi bir thread) ----
+
+    def publish_table(self, arp_table):
+        """Yeni tarama sonucunu bağlama farkları olarak yayınlar."""
+        if arp_table is None:
+            return
+        self._call(self._apply_table, [dict(entry) for entry in arp_table])
+
+    def publish_metrics(self, values):
+        """Tarayıcıya ait ek ölçümleri (ör. etkin tarama aralığı) yayınlar."""
+        self._call(self._apply_metrics, dict(values))
+
+    def write_batch(self, events):
+        """Olay yazıcısı çıkışı: bulguları yayınlar."""
+        self._call(self._apply_findings, list(events))
+
+    def close(self):
+        """Sunucuyu durdurur."""
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        if self._thread is not None:
+            self._thread.join(2.0)
+
+    def _call(self, function, argument):
+        if self.loop is not None and not self.loop.is_closed():
+            try:
+                self.loop.call_soon_threadsafe(function, argument)
+            except RuntimeError:
+                pass  # Döngü kapanıyor
+
+    # ---- asyncio döngüsü içinde çalışanlar ----
+
+    def _broadcast(self, event, data):
+        self.event_id += 1
+        message = f"id: {self.event_id}\nevent: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+        for queue in list(self.viewers):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Yavaş izleyici: bağlantıyı kapat, yeniden bağlanınca anlık görüntü alır
+                self.viewers.discard(queue)
+
+    def _apply_table(self, arp_table):
+        current = {entry["ip"]: {"mac": entry["mac"].lower(), "interface": entry.get("interface")}
+                   for entry in arp_table}
+        for ip, binding in current.items():
+            previous = self.bindings.get(ip)
+            if previous is None:
+                self._broadcast("binding", dict(binding, ip=ip, change="added"))
+            elif previous != binding:
+                self._broadcast("binding", dict(binding, ip=ip, change="changed", old_mac=previous["mac"]))
+        for ip in self.bindings.keys() - current.keys():
+            self._broadcast("binding", {"ip": ip, "change": "removed"})
+        self.bindings = current
+        self.metrics["taramalar"] += 1
+        self.metrics["kayıt"] = len(current)
+        self.metrics["son_tarama"] = time.strftime("%H:%M:%S")
+        self._broadcast("metrics", self.metrics)
+
+    def _apply_findings(self, events):
+        for event in events:
+            self.findings.append(event)
+            self._broadcast("finding", event)
+        self.metrics["bulgu"] += len(events)
+        self._broadcast("metrics", self.metrics)
+
+    def _apply_metrics(self, values):
+        self.metrics.update(values)
+        self._broadcast("metrics", self.metrics)
+
+    def snapshot(self):
+        """İzleyiciye bağlanırken gönderilen tam durum."""
+        return {"bindings": self.bindings, "findings": list(self.findings), "metrics": self.metrics}
+
+    async def _handle(self, reader, writer):
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 10)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+            writer.close()
+            return
+        request_line = request.split(b"\r\n", 1)[0].decode("latin-1").split()
+        path = request_line[1].split("?", 1)[0] if len(request_line) >= 2 else "/"
+
+        try:
+            if path == "/events":
+                await self._serve_events(writer)
+            elif path == "/state":
+                self._respond(writer, "200 OK", "application/json",
+                              json.dumps(self.snapshot(), ensure_ascii=False).encode("utf-8"))
+            elif path == "/":
+                self._respond(writer, "200 OK", "text/html; charset=utf-8", DASHBOARD_HTML.encode("utf-8"))
+            else:
+                self._respond(writer, "404 Not Found", "text/plain", b"Bulunamadi")
+            await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _respond(writer, status, content_type, body):
+        writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body)
+
+    async def _serve_events(self, writer):
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                     b"Cache-Control: no-cache\r\nConnection: keep-alive\r\n\r\n")
+        queue = asyncio.Queue(VIEWER_QUEUE_SIZE)
+        snapshot = json.dumps(self.snapshot(), ensure_ascii=False)
+        writer.write(f"retry: 2000\nid: {self.event_id}\nevent: snapshot\ndata: {snapshot}\n\n".encode("utf-8"))
+        self.viewers.add(queue)
+        self.metrics["izleyici"] = len(self.viewers)
+        try:
+            while queue in self.viewers or not queue.empty():
+                try:
+                    message = await asyncio.wait_for(queue.get(), KEEPALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    if queue not in self.viewers:
+                        break
+                    message = b": keepalive\n\n"
+                writer.write(message)
+                await asyncio.wait_for(writer.drain(), KEEPALIVE_INTERVAL * 2)
+        except asyncio.TimeoutError:
+            pass  # Takılan izleyici
+        finally:
+            self.viewers.discard(queue)
+            self.metrics["izleyici"] = len(self.viewers)
+
+    async def _serve(self):
+        self.loop = asyncio.get_running_loop()
+        self.server = await asyncio.start_server(self._handle, self.host, self.port, backlog=1024)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self._ready.set()
+        async with self.server:
+            await self.server.serve_forever()
+
+    def start(self):
+        """
+        Sunucuyu arka plan thread'indeki asyncio döngüsünde başlatır.
+
+        Returns:
+            int: Dinlenen port
+
+        Raises:
+            OSError: Adres dinlenemezse (ör. port kullanımda) veya sunucu zamanında açılmazsa
+        """
+        def run():
+            try:
+                asyncio.run(self._serve())
+            except RuntimeError:
+                pass  # close() ile döngü durduruldu
+            except OSError as error:
+                self.error = error
+            finally:
+                self._ready.set()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        if not self._ready.wait(5):
+            raise OSError(f"Pano {self.host}:{self.port} adresinde zamanında başlatılamadı")
+        if self.error is not None:
+            raise self.error
+        return self.port
+
+
+def _scanner_loop(dashboard, interval, stop_event):
+    """Bağımsız modda tek tarayıcı: tablo okuma ve tespit her aralıkta bir kez yapılır."""
+    from arp_spoofing_detector import get_arp_table, get_default_gateway, detect_arp_spoofing
+    from arp_events import make_event
+    from arp_alerts import AlertManager
+
+    # Kalıcı durumlar her taramada yeniden yayınlanmasın
+    alert_manager = AlertManager(rate=1.0, burst=100)
+    while not stop_event.is_set():
+        arp_table = get_arp_table()
+        findings = detect_arp_spoofing(arp_table, gateway=get_default_gateway()) if arp_table else []
+        dashboard.publish_table(arp_table)
+        findings = [finding for finding in findings if not finding["type"].startswith("info_")]
+        new_findings = [make_event(finding, arp_table) for finding in alert_manager.filter(findings)]
+        if new_findings:
+            dashboard.write_batch(new_findings)
+        stop_event.wait(interval)
+
+
+def main(argv=None):
+    """Komut satırından panoyu ve tek tarayıcıyı çalıştırır."""
+    parser = argparse.ArgumentParser(description="ARP Spoofing Tespit Aracı - Canlı pano")
+    parser.add_argument("--host", default="127.0.0.1", help="Dinlenecek adres")
+    parser.add_argument("--port", type=int, default=8765, help="Dinlenecek port")
+    parser.add_argument("--interval", type=float, default=10.0, help="Tarama aralığı (saniye)")
+    args = parser.parse_args(argv)
+
+    dashboard = DashboardServer(args.host, args.port)
+    try:
+        port = dashboard.start()
+    except OSError as error:
+        print(f"❌ Pano başlatılamadı: {error}")
+        return 1
+    print(f"🌐 Pano: http://{args.host}:{port}/  (durdurmak için Ctrl+C)")
+    stop_event = threading.Event()
+    scanner = threading.Thread(target=_scanner_loop, args=(dashboard, args.interval, stop_event), daemon=True)
+    scanner.start()
+    try:
+        while scanner.is_alive():
+            scanner.join(1)
+    except KeyboardInterrupt:
+        stop_event.set()
+        print("\n👋 Pano durduruldu.")
+    dashboard.close()
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
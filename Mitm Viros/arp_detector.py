@@ -14,6 +14,12 @@ import sys
 from collections import defaultdict
 import os
 
+from arp_command import stream_command, COMMAND_TIMEOUT
+from arp_scheduler import AdaptiveInterval, format_interval, new_findings
+
+# Periyodik kontrol aralığı (uyarlamalı modda üst sınır)
+KONTROL_ARALIGI = 86400
+
 def temizle_ekran():
     """İşletim sistemine göre terminal ekranını temizler."""
     if platform.system() == "Windows":
@@ -21,16 +27,23 @@ def temizle_ekran():
     else:
         os.system('clear')
 
-def arp_tablosunu_al():
+def arp_tablosunu_al(iptal_olayi=None, zaman_asimi=COMMAND_TIMEOUT):
     """
     İşletim sistemine bağlı olarak ARP tablosunu alır ve döndürür.
     
     Windows, Linux ve macOS için farklı komutlar çalıştırılır.
-    Eğer 'arp' komutu bulunamazsa, alternatif komutlar denenir.
+    Eğer 'arp' komutu bulunamazsa veya zaman aşımına uğrarsa, alternatif komutlar denenir.
     Demo modu ile örnek veriler sunulur.
     
+    Args:
+        iptal_olayi (threading.Event): Ayarlandığında çalışan komut iptal edilir
+        zaman_asimi (float): Her komut için kesin zaman aşımı (saniye)
+    
     Returns:
         str: ARP tablosunun çıktısı
+    
+    Raises:
+        ScanCancelled: Tarama iptal edildiğinde
     """
     # Demo modu için basit bir argüman kontrolü
     if len(sys.argv) > 1 and sys.argv[1] == "--demo":
@@ -50,17 +63,21 @@ def arp_tablosunu_al():
     komutlar = []
     
     if platform.system() == "Windows":
-        komutlar = ["arp -a"]
-    else:  # Linux ve macOS
-        komutlar = ["arp -a", "ip neigh", "ip neighbour"]
+        komutlar = [["arp", "-a"]]
+    else:  # Linux ve macOS (-n: ters DNS sorgusu yapma)
+        komutlar = [["arp", "-a", "-n"], ["ip", "neigh"], ["ip", "neighbour"]]
     
     for komut in komutlar:
         try:
-            sonuc = subprocess.check_output(komut, shell=True, universal_newlines=True)
-            print(f"✅ ARP tablosu '{komut}' komutu ile alındı.")
-            return sonuc
+            # Çıktı borudan satır satır okunur, takılan komut zaman aşımında sonlandırılır
+            satirlar = list(stream_command(komut, zaman_asimi, iptal_olayi))
+            print(f"✅ ARP tablosu '{' '.join(komut)}' komutu ile alındı.")
+            return "\n".join(satirlar)
         except subprocess.CalledProcessError:
             continue
+        except subprocess.TimeoutExpired:
+            print(f"⏱️  '{' '.join(komut)}' komutu zaman aşımına uğradı, alternatif deneniyor.")
+            continue
         except FileNotFoundError:
             continue
     
@@ -164,7 +181,8 @@ def sonuclari_yazdir(supheli_macler):
 def periyodik_kontrol():
     """
     Kullanıcıdan periyodik kontrol yapılıp yapılmayacağını sorar ve gerekirse zamanlanmış kontrol başlatır.
-    Demo modunda ise otomatik olarak hayır cevabı verir.
+    Demo modunda ise otomatik olarak hayır cevabı verir. --adaptive ile aralık sabit 24 saat yerine
+    değişim hızına göre ayarlanır: tablo değiştikçe sıklaşır, aynı kaldıkça 24 saate kadar seyrekleşir.
     """
     # Demo modu kontrolü
     if len(sys.argv) > 1 and sys.argv[1] == "--demo":
@@ -172,21 +190,43 @@ def periyodik_kontrol():
         print("👋 Program sonlandırıldı. İyi günler!")
         return
         
+    uyarlamali = AdaptiveInterval(ceiling=KONTROL_ARALIGI) if "--adaptive" in sys.argv else None
+    if uyarlamali is not None:
+        siklik = f"değişime göre {format_interval(uyarlamali.floor)} ile 24 saat arasında"
+    else:
+        siklik = "24 saatte bir"
+    
     while True:
-        cevap = input("\n🔄 Periyodik kontrol yapmak istiyor musunuz? (24 saatte bir) [E/h]: ").lower()
+        cevap = input(f"\n🔄 Periyodik kontrol yapmak istiyor musunuz? ({siklik}) [E/h]: ").lower()
         
         if cevap == "" or cevap == "e":
-            print("\n🕒 Periyodik kontrol aktifleştirildi. 24 saatte bir ARP tablosu kontrol edilecek.")
+            print(f"\n🕒 Periyodik kontrol aktifleştirildi. ARP tablosu {siklik} kontrol edilecek.")
             print("ℹ️  Programı sonlandırmak için Ctrl+C tuşlarına basabilirsiniz.")
             
             try:
+                onceki_cikti = None
+                onceki_supheliler = set()
                 while True:
                     # İlk kontrol hemen yapılır
-                    arp_kontrol_et()
+                    baslangic = time.thread_time()
+                    sonuc = arp_kontrol_et()
+                    
+                    bekleme = KONTROL_ARALIGI
+                    if uyarlamali is not None:
+                        # Yalnızca yeni ortaya çıkan şüpheli durumlar aralığı tabana indirir
+                        arp_ciktisi, supheli_macler = sonuc or (None, [])
+                        degisti = arp_ciktisi != onceki_cikti
+                        onceki_cikti = arp_ciktisi
+                        yeni = []
+                        if sonuc is not None:
+                            yeni, onceki_supheliler = new_findings(supheli_macler, onceki_supheliler,
+                                                                   lambda oge: oge[0])
+                        bekleme = uyarlamali.observe(degisti, bool(yeni),
+                                                     time.thread_time() - baslangic)
+                        print(f"\n📊 Uyarlamalı aralık: {format_interval(bekleme)} ({uyarlamali.reason})")
                     
-                    # 24 saat (86400 saniye) bekle
-                    print(f"\n⏱️  Bir sonraki kontrol {time.strftime('%d.%m.%Y %H:%M:%S', time.localtime(time.time() + 86400))} tarihinde yapılacak.")
-                    time.sleep(86400)
+                    print(f"\n⏱️  Bir sonraki kontrol {time.strftime('%d.%m.%Y %H:%M:%S', time.localtime(time.time() + bekleme))} tarihinde yapılacak.")
+                    time.sleep(bekleme)
                     temizle_ekran()
             except KeyboardInterrupt:
                 print("\n\n👋 Program sonlandırıldı. İyi günler!")
@@ -197,15 +237,21 @@ def periyodik_kontrol():
         else:
             print("❓ Lütfen 'e' (evet) veya 'h' (hayır) olarak cevap verin.")
 
-def arp_kontrol_et():
+def arp_kontrol_et(iptal_olayi=None):
     """
     ARP tablosunu alıp kontrol eder ve sonuçları yazdırır.
+    
+    Args:
+        iptal_olayi (threading.Event): Ayarlandığında tarama iptal edilir
+    
+    Returns:
+        tuple: (ARP komutu çıktısı, şüpheli MAC listesi); tablo alınamazsa None
     """
     print("\n🔍 ARP tablosu kontrol ediliyor...")
-    arp_ciktisi = arp_tablosunu_al()
+    arp_ciktisi = arp_tablosunu_al(iptal_olayi)
     
     if not arp_ciktisi:
-        return
+        return None
     
     print(f"✅ {len(arp_ciktisi.splitlines())} ARP kaydı bulundu.")
     
@@ -213,6 +259,7 @@ def arp_kontrol_et():
     supheli_macler = arp_spoofing_kontrol(mac_to_ips)
     
     sonuclari_yazdir(supheli_macler)
+    return arp_ciktisi, supheli_macler
 
 def main():
     """
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Makine Tarafından Okunabilir Olay Çıktısı
+Bulguları JSON Lines (dosya veya stdout) ve RFC 5424 syslog (yerel soket veya UDP) olarak
+yazar. Yazma işi arka plandaki bir kuyruk thread'inde toplu yapılır; yavaş disk veya takılan
+syslog tespit döngüsünü hiçbir zaman bloklamaz (kuyruk dolarsa olay atılır ve sayılır).
+
+Her olay şu alanları taşır: type, severity, ip, mac, interface, monotonic (time.monotonic),
+time (ISO 8601, UTC) ve message.
+"""
+
+import datetime
+import json
+import os
+import queue
+import socket
+import sys
+import threading
+import time
+
+from arp_alerts import AlertManager
+
+SEVERITY_CRITICAL = "critical"
+SEVERITY_WARNING = "warning"
+SEVERITY_INFO = "info"
+
+# RFC 5424 önem seviyeleri
+SYSLOG_SEVERITY = {SEVERITY_CRITICAL: 2, SEVERITY_WARNING: 4, SEVERITY_INFO: 6}
+SYSLOG_FACILITY_AUTHPRIV = 10
+SYSLOG_SD_ID = "arp@32473"  # 32473: belgeleme için ayrılmış özel kuruluş numarası
+DEFAULT_SYSLOG_ADDRESS = "/dev/log"
+# Unix soketi olmayan sistemlerde (Windows) yerel syslog yerine kullanılan UDP adresi
+FALLBACK_SYSLOG_ADDRESS = ("127.0.0.1", 514)
+
+
+def finding_severity(finding):
+    """
+    Bulgunun önem seviyesini mesaj önekinden çıkarır (arayüzdeki sınıflandırmayla aynı).
+
+    Returns:
+        str: SEVERITY_CRITICAL, SEVERITY_WARNING veya SEVERITY_INFO
+    """
+    message = finding.get("message", "")
+    if "❌" in message:
+        return SEVERITY_CRITICAL
+    if "⚠️" in message:
+        return SEVERITY_WARNING
+    return SEVERITY_INFO
+
+
+def make_event(finding, arp_table=None, interface=None):
+    """
+    Bir bulgu sözlüğünü olay kaydına çevirir.
+
+    Args:
+        finding (dict): detect_arp_spoofing() vb. tarafından üretilen bulgu
+        arp_table (list): Arayüz bilgisini bulmak için taranan tablo (isteğe bağlı)
+        interface (str): Bilinen arayüz (tablodan bulunamazsa kullanılır)
+
+    Returns:
+        dict: Olay
+    """
+    ip = finding.get("ip") or next(iter(finding.get("ips") or ()), None)
+    mac = finding.get("mac") or next(iter(finding.get("macs") or ()), None)
+    if arp_table and interface is None:
+        for entry in arp_table:
+            if entry["ip"] == ip or entry["mac"].lower() == mac:
+                interface = entry.get("interface")
+                break
+
+    event = {key: value for key, value in finding.items() if key != "message"}
+    event.update({
+        "type": finding.get("type", "other"),
+        "severity": finding_severity(finding),
+        "ip": ip,
+        "mac": mac,
+        "interface": interface,
+        "monotonic": time.monotonic(),
+        "time": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="milliseconds"),
+        "message": finding.get("message", ""),
+    })
+    return event
+
+
+class JsonLinesSink:
+    """Olayları satır başına bir JSON nesnesi olarak yazar."""
+
+    def __init__(self, path="-"):
+        """
+        Args:
+            path (str): Dosya yolu; "-" ise stdout
+        """
+        self.stream = sys.stdout if path == "-" else open(path, "a", encoding="utf-8")
+
+    def write_batch(self, events):
+        self.stream.write("".join(json.dumps(event, ensure_ascii=False, default=str) + "\n"
+                                  for event in events))
+        self.stream.flush()
+
+    def close(self):
+        if self.stream is not sys.stdout:
+            self.stream.close()
+
+
+class SyslogSink:
+    """
+    Olayları RFC 5424 biçiminde syslog'a gönderir.
+
+    Adres bir yol ise yerel Unix datagram soketi, "host:port" ise UDP kullanılır. Unix soketi
+    olmayan sistemlerde (Windows) yol verilirse 127.0.0.1:514'e UDP ile gönderilir. Soket
+    bloklamayan kipte açılır; syslog takılırsa mesaj atılır ve sayılır.
+    """
+
+    def __init__(self, address=DEFAULT_SYSLOG_ADDRESS, app_name="arp-detector",
+                 facility=SYSLOG_FACILITY_AUTHPRIV):
+        if address.startswith("/") or ":" not in address:
+            if hasattr(socket, "AF_UNIX") and os.name != "nt":
+                self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                self.target = address
+            else:
+                self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self.target = FALLBACK_SYSLOG_ADDRESS
+        else:
+            host, _, port = address.rpartition(":")
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.target = (host, int(port))
+        self.sock.setblocking(False)
+        self.app_name = app_name
+        self.facility = facility
+        self.hostname = socket.gethostname() or "-"
+        self.procid = str(os.getpid())
+        self.dropped = 0
+
+    @staticmethod
+    def _sd_value(value):
+        # RFC 5424 6.3.3: ", \ ve ] kaçışlanır
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("]", "\\]")
+
+    def format(self, event):
+        """Olayı RFC 5424 mesajına çevirir."""
+        priority = self.facility * 8 + SYSLOG_SEVERITY.get(event["severity"], 6)
+        params = " ".join(f'{name}="{self._sd_value(event[name])}"'
+                          for name in ("type", "severity", "ip", "mac", "interface", "monotonic")
+                          if event.get(name) is not None)
+        # MSG, BOM ile başlayan UTF-8 metin olarak gönderilir
+        return (f"<{priority}>1 {event['time']} {self.hostname} {self.app_name} {self.procid} "
+                f"{event['type']} [{SYSLOG_SD_ID} {params}] \ufeff{event['message']}").encode("utf-8")
+
+    def write_batch(self, events):
+        for event in events:
+            try:
+                self.sock.sendto(self.format(event), self.target)
+            except OSError:
+                self.dropped += 1
+
+    def close(self):
+        self.sock.close()
+
+
+class EventWriter:
+    """
+    Olayları sınırlı bir kuyruktan alıp arka planda toplu olarak çıkışlara yazan yazıcı.
+    """
+
+    def __init__(self, sinks, maxsize=10000, batch_size=256, alert_manager=None):
+        """
+        Args:
+            sinks (list): write_batch(events) ve close() sağlayan çıkışlar
+            maxsize (int): Kuyruk sınırı; dolduğunda yeni olaylar atılır
+            batch_size (int): Tek seferde yazılacak en fazla olay
+            alert_manager (AlertManager): Verilirse yalnızca yeni/kötüleşen bulgular yazılır
+        """
+        self.sinks = list(sinks)
+        self.alert_manager = alert_manager
+        self.batch_size = batch_size
+        self.queue = queue.Queue(maxsize)
+        self.dropped = 0
+        self.written = 0
+        self._failed_sinks = set()  # Hatası bir kez bildirilmiş çıkışlar
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def emit(self, finding, arp_table=None, interface=None):
+        """
+        Bir bulguyu yazılmak üzere kuyruğa bırakır (hiçbir zaman bloklamaz).
+
+        Returns:
+            bool: Kuyruğa alındıysa True, bastırıldıysa veya kuyruk dolu olduğu için atıldıysa False
+        """
+        if self.alert_manager is not None:
+            finding = self.alert_manager.admit(finding)
+            if finding is None:
+                return False
+        try:
+            self.queue.put_nowait(make_event(finding, arp_table, interface))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _run(self):
+        while True:
+            event = self.queue.get()
+            if event is None:
+                return
+            batch = [event]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    event = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if event is None:
+                    stop = True
+                    break
+                batch.append(event)
+            for sink in self.sinks:
+                try:
+                    sink.write_batch(batch)
+                except Exception as error:
+                    # Tek bir çıkışın hatası (ör. JSON'a çevrilemeyen alan) yazıcı thread'ini
+                    # durdurmamalı; aksi halde kuyruk dolar ve sonraki tüm olaylar atılır
+                    self.dropped += len(batch)
+                    self._report_failure(sink, error)
+            self.written += len(batch)
+            if stop:
+                return
+
+    def _report_failure(self, sink, error):
+        if id(sink) in self._failed_sinks:
+            return
+        self._failed_sinks.add(id(sink))
+        print(f"⚠️ Olay çıkışı {type(sink).__name__} yazamadı, olaylar atılıyor: "
+              f"{type(error).__name__}: {error}", file=sys.stderr, flush=True)
+
+    def close(self, timeout=2.0):
+        """Kuyruktaki olayları yazar ve çıkışları kapatır."""
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+        for sink in self.sinks:
+            sink.close()
+
+
+def writer_from_args(jsonl=None, syslog=None, webhooks=None, outbox=None, extra_sinks=()):
+    """
+    Komut satırı seçeneklerinden olay yazıcısı oluşturur.
+
+    Args:
+        jsonl (str): JSON Lines dosyası veya "-" (stdout)
+        syslog (str): Syslog adresi (yerel soket yolu veya host:port)
+        webhooks (list): Bulguların gönderileceği HTTP adresleri
+        outbox (str): Gönderilemeyen bildirimlerin saklanacağı dosya
+        extra_sinks (list): Ek çıkışlar (ör. canlı pano)
+
+    Returns:
+        EventWriter: Hiç çıkış yoksa None
+    """
+    sinks = []
+    if jsonl:
+        sinks.append(JsonLinesSink(jsonl))
+    if syslog:
+        sinks.append(SyslogSink(syslog))
+    if webhooks:
+        from arp_notify import WebhookNotifier
+        sinks.append(WebhookNotifier(webhooks, outbox_path=outbox))
+    sinks.extend(extra_sinks)
+    # Kayıtlar arayüzden daha sık uyarı alabilir, ancak yine de sınırlı kalır
+    return EventWriter(sinks, alert_manager=AlertManager(rate=1.0, burst=100)) if sinks else None
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Filo (Fleet) Toplayıcısı
+Birçok hosttaki sensörlerin (ajan) komşu tablolarını tek bir ağ çapında IP<->MAC görünümünde
+birleştirir. Ajanlar kalıcı TCP bağlantısı üzerinden yalnızca tablo farklarını (delta)
+arp_wire ikili biçiminde gönderir; asyncio tabanlı toplayıcı bu farkları indekslere işler ve
+tek bir hostun göremeyeceği durumları tespit eder (ör. aynı MAC'in birden fazla segmentte
+ağ geçidi olarak görünmesi).
+
+Aynı özel adres aralığını kullanan siteler (her sitede ağ geçidi 192.168.1.1) birbiriyle
+karıştırılmasın diye IP çakışmaları yalnızca aynı segmentteki sensörler arasında aranır.
+Segment, ajanın bağlandığında sabitlediği ağ geçidi IP/MAC çiftidir (veya --segment ile
+verilen ad).
+
+Kullanım:
+    python arp_fleet.py aggregator --port 9750
+    python arp_fleet.py agent --server 10.0.0.5:9750
+    python arp_fleet.py agent --server 10.0.0.5:9750 --segment istanbul-ofis
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import struct
+from collections import Counter, defaultdict
+
+import arp_wire
+
+DEFAULT_PORT = 9750
+
+# Tek bir mesajın en büyük boyutu (bayt); daha büyük mesajlar bağlantıyı kapatır
+MAX_MESSAGE_SIZE = 4 * 1024 * 1024
+
+# Çerçeve: uzunluk(I) + mesaj türü(B) + yük
+FRAME_HEADER = struct.Struct("<IB")
+MESSAGE_HELLO = 1  # Yük: JSON {"sensor", "gateway"}
+MESSAGE_DELTA = 2  # Yük: arp_wire anlık görüntü veya fark
+
+
+def encode_frame(message_type, payload):
+    """Yükü uzunluk önekli bir çerçeveye koyar."""
+    return FRAME_HEADER.pack(len(payload), message_type) + payload
+
+
+async def read_frame(reader):
+    """
+    Akıştan bir çerçeve okur.
+
+    Returns:
+        tuple: (mesaj türü, yük); bağlantı kapandıysa None
+    """
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+    except asyncio.IncompleteReadError:
+        return None
+    length, message_type = FRAME_HEADER.unpack(header)
+    if length > MAX_MESSAGE_SIZE:
+        raise ValueError("Mesaj çok büyük")
+    return message_type, await reader.readexactly(length)
+
+
+def snapshot_rows(arp_table):
+    """ARP tablosunu (ip, mac, arayüz) demetleri kümesine çevirir."""
+    return {(entry["ip"], entry["mac"].lower(), entry.get("interface", "")) for entry in arp_table}
+
+
+class FleetAggregator:
+    """
+    Sensörlerden gelen tablo farklarını birleştirir ve sensörler arası tespit yapar.
+
+    İndeksler yalnızca değişen kayıtlar için güncellenir; her farkta yalnızca etkilenen IP'ler
+    yeniden değerlendirilir. Böylece binlerce ajan tek çekirdekte takip edilebilir.
+    """
+
+    def __init__(self, on_finding=None):
+        self.on_finding = on_finding
+        self.sensors = {}  # sensör -> {"gateway": ip, "segment": ad, "rows": set, "pairs": Counter}
+        self.ip_index = defaultdict(lambda: defaultdict(set))  # ip -> mac -> {sensör}
+        self.mac_index = defaultdict(lambda: defaultdict(set))  # mac -> ip -> {sensör}
+        self.gateway_ips = defaultdict(set)  # ağ geçidi ip -> {sensör}
+        self.findings = {}  # (tip, anahtar) -> bulgu
+        self.messages = 0
+
+    # ---------- İndeks güncelleme ----------
+
+    def register_sensor(self, sensor_id, gateway_ip=None, segment=None):
+        """
+        Yeni bağlanan (veya yeniden bağlanan) sensörü kaydeder.
+
+        Args:
+            sensor_id (str): Sensör kimliği
+            gateway_ip (str): Sensörün ağ geçidi IP'si
+            segment (str): Sensörün segmenti; IP çakışmaları yalnızca aynı segmentteki sensörler
+                arasında aranır (None: segmenti bilinmeyen sensörler ortak bir segmentte sayılır)
+        """
+        self.remove_sensor(sensor_id)
+        self.sensors[sensor_id] = {"gateway": gateway_ip, "segment": segment, "rows": set(), "pairs": Counter()}
+        if gateway_ip:
+            self.gateway_ips[gateway_ip].add(sensor_id)
+            self._evaluate({gateway_ip})
+
+    def remove_sensor(self, sensor_id):
+        """Sensörün tüm kayıtlarını görünümden çıkarır."""
+        state = self.sensors.pop(sensor_id, None)
+        if state is None:
+            return
+        affected, released_macs = self._remove_rows(sensor_id, state, state["rows"])
+        gateway_ip = state["gateway"]
+        if gateway_ip:
+            self.gateway_ips[gateway_ip].discard(sensor_id)
+            if not self.gateway_ips[gateway_ip]:
+                del self.gateway_ips[gateway_ip]
+            affected.add(gateway_ip)
+        self._evaluate(affected, released_macs)
+
+    def apply_delta(self, sensor_id, added=(), removed=(), full=False):
+        """
+        Sensörden gelen tablo farkını uygular.
+
+        Args:
+            sensor_id (str): Sensör kimliği
+            added (iterable): Eklenen (ip, mac, arayüz) demetleri
+            removed (iterable): Silinen (ip, mac, arayüz) demetleri
+            full (bool): True ise `added` sensörün tablosunun tamamıdır
+        """
+        state = self.sensors.setdefault(sensor_id, {"gateway": None, "segment": None, "rows": set(),
+                                                    "pairs": Counter()})
+        added = {tuple(row) for row in added}
+        if full:
+            removed = state["rows"] - added
+            added = added - state["rows"]
+        else:
+            removed = {tuple(row) for row in removed} & state["rows"]
+            added = added - state["rows"]
+
+        affected, released_macs = self._remove_rows(sensor_id, state, removed)
+        state["rows"] -= removed
+        for ip, mac, interface in added:
+            # Aynı ip/mac birden fazla arayüzde görülebilir; indekse bir kez eklenir
+            state["pairs"][(ip, mac)] += 1
+            if state["pairs"][(ip, mac)] == 1:
+                self.ip_index[ip][mac].add(sensor_id)
+                self.mac_index[mac][ip].add(sensor_id)
+                affected.add(ip)
+        state["rows"] |= added
+        self._evaluate(affected, released_macs)
+
+    def _remove_rows(self, sensor_id, state, rows):
+        """
+        Returns:
+            tuple: (etkilenen IP'ler, bu sensörde bağlaması kalkan MAC'ler)
+        """
+        affected, released_macs = set(), set()
+        pairs = state["pairs"]
+        for ip, mac, interface in rows:
+            pairs[(ip, mac)] -= 1
+            if pairs[(ip, mac)] > 0:
+                continue
+            del pairs[(ip, mac)]
+            self._discard(self.ip_index, ip, mac, sensor_id)
+            self._discard(self.mac_index, mac, ip, sensor_id)
+            affected.add(ip)
+            released_macs.add(mac)
+        return affected, released_macs
+
+    @staticmethod
+    def _discard(index, key, sub_key, sensor_id):
+        sensors = index[key][sub_key]
+        sensors.discard(sensor_id)
+        if not sensors:
+            del index[key][sub_key]
+        if not index[key]:
+            del index[key]
+
+    # ---------- Tespit ----------
+
+    def _evaluate(self, ips, released_macs=()):
+        # Artık etkilenen IP'lere bağlı olmayan MAC'lerin ağ geçidi bulguları da yeniden
+        # değerlendirilir; aksi halde ağ geçidini bırakan MAC'in bulgusu hiç temizlenmez
+        for mac in released_macs:
+            self._evaluate_gateway_mac(mac)
+        for ip in ips:
+            macs = self.ip_index.get(ip, {})
+            is_gateway = ip in self.gateway_ips
+
+            key = ("fleet_ip_conflict", ip)
+            conflicts = self._segment_conflicts(macs) if len(macs) > 1 else {}
+            if conflicts:
+                details = "; ".join(
+                    (f"[{segment}] " if segment is not None else "") +
+                    ", ".join(f"{mac} ({len(sensors)} sensör)" for mac, sensors in sorted(segment_macs.items()))
+                    for segment, segment_macs in sorted(conflicts.items(), key=lambda item: str(item[0])))
+                prefix = "❌ TEHLİKE: Ağ geçidi" if is_gateway else "⚠️ Şüpheli: IP"
+                self._set_finding(key, {
+                    "type": "fleet_ip_conflict",
+                    "ip": ip,
+                    "macs": sorted({mac for segment_macs in conflicts.values() for mac in segment_macs}),
+                    "segments": sorted(str(segment) for segment in conflicts),
+                    "gateway": is_gateway,
+                    "message": f"{prefix} {ip} farklı sensörlerde farklı MAC adresleriyle görülüyor: {details}"
+                })
+            else:
+                self._clear_finding(key)
+
+            for mac in list(macs):
+                self._evaluate_gateway_mac(mac)
+
+    def _segment_conflicts(self, macs):
+        """
+        Bir IP'nin MAC'lerini sensör segmentlerine göre gruplar.
+
+        Returns:
+            dict: segment -> {mac: {sensör}}; yalnızca birden fazla MAC görülen segmentler
+        """
+        segments = defaultdict(lambda: defaultdict(set))
+        for mac, sensors in macs.items():
+            for sensor_id in sensors:
+                segment = self.sensors[sensor_id]["segment"] if sensor_id in self.sensors else None
+                segments[segment][mac].add(sensor_id)
+        return {segment: segment_macs for segment, segment_macs in segments.items() if len(segment_macs) > 1}
+
+    def _evaluate_gateway_mac(self, mac):
+        # Bir MAC birden fazla segmentin ağ geçidi IP'sini sahipleniyorsa şüphelidir
+        bound_ips = self.mac_index.get(mac, {})
+        smaller, larger = sorted((bound_ips, self.gateway_ips), key=len)
+        gateway_ips = sorted(ip for ip in smaller if ip in larger)
+        key = ("fleet_gateway_multi_segment", mac)
+        if len(gateway_ips) > 1:
+            self._set_finding(key, {
+                "type": "fleet_gateway_multi_segment",
+                "mac": mac,
+                "ips": gateway_ips,
+                "message": f"❌ TEHLİKE: {mac} MAC adresi {len(gateway_ips)} farklı segmentte ağ geçidi olarak görülüyor: {', '.join(gateway_ips)}"
+            })
+        else:
+            self._clear_finding(key)
+
+    def _set_finding(self, key, finding):
+        previous = self.findings.get(key)
+        self.findings[key] = finding
+        if (previous is None or previous["message"] != finding["message"]) and self.on_finding:
+            self.on_finding(finding)
+
+    def _clear_finding(self, key):
+        self.findings.pop(key, None)
+
+    def active_findings(self):
+        """Şu an geçerli olan sensörler arası bulguları döndürür."""
+        return list(self.findings.values())
+
+    # ---------- Ağ ----------
+
+    async def handle_agent(self, reader, writer):
+        """Tek bir ajan bağlantısını işler."""
+        sensor_id = None
+        try:
+            while True:
+                frame = await read_frame(reader)
+                if frame is None:
+                    break
+                message_type, payload = frame
+                self.messages += 1
+                if message_type == MESSAGE_HELLO:
+                    hello = json.loads(payload)
+                    sensor_id = str(hello["sensor"])
+                    segment = hello.get("segment")
+                    self.register_sensor(sensor_id, hello.get("gateway"),
+                                         str(segment) if segment is not None else None)
+                elif message_type == MESSAGE_DELTA and sensor_id is not None:
+                    delta = arp_wire.decode(payload)
+                    self.apply_delta(sensor_id, snapshot_rows(delta["added"]),
+                                     snapshot_rows(delta["removed"]),
+                                     delta["kind"] == arp_wire.KIND_FULL)
+        except (arp_wire.WireFormatError, ValueError, KeyError, TypeError, ConnectionError,
+                asyncio.IncompleteReadError):
+            pass  # Bozuk mesaj veya kopan bağlantı: sensörü çıkar
+        finally:
+            if sensor_id is not None:
+                self.remove_sensor(sensor_id)
+            writer.close()
+
+    async def serve(self, host="0.0.0.0", port=DEFAULT_PORT):
+        """Toplayıcı sunucusunu başlatır ve sunucu nesnesini döndürür."""
+        return await asyncio.start_server(self.handle_agent, host, port, backlog=4096)
+
+
+class FleetAgent:
+    """
+    Yerel komşu tablosunu periyodik olarak okuyup toplayıcıya fark olarak gönderen ajan.
+    Bağlantı koptuğunda artan beklemelerle yeniden bağlanır ve tam tabloyu yeniden gönderir.
+    """
+
+    def __init__(self, host, port, sensor_id=None, interval=5.0, table_source=None,
+                 gateway_source=None, gateway_mac_source=None, segment=None):
+        """
+        Args:
+            host (str): Toplayıcı adresi
+            port (int): Toplayıcı portu
+            sensor_id (str): Sensör kimliği (varsayılan: makine adı)
+            interval (float): Tablo okuma aralığı (saniye)
+            table_source (callable): ARP tablosunu (kayıt listesi) döndüren fonksiyon
+            gateway_source (callable): Ağ geçidi IP'sini döndüren fonksiyon
+            gateway_mac_source (callable): IP -> MAC okuma fonksiyonu; segment verilmediyse ilk
+                bağlantıda ağ geçidi IP/MAC çifti segment olarak sabitlenir (sonraki bir sahte
+                cevap sensörü başka segmente taşıyamaz)
+            segment (str): Sensörün segment adı (aynı özel aralığı kullanan siteleri ayırır)
+        """
+        self.host = host
+        self.port = port
+        self.sensor_id = sensor_id or socket.gethostname()
+        self.interval = interval
+        self.table_source = table_source
+        self.gateway_source = gateway_source
+        self.gateway_mac_source = gateway_mac_source
+        self.segment = segment
+        self.running = True
+        self.skipped_rows = 0  # Kabloya yazılamadığı için gönderilmeyen kayıtlar
+
+    async def _read_table(self):
+        # Tablo okuma bloke edici olduğu için ayrı thread'de çalıştırılır
+        loop = asyncio.get_running_loop()
+        return self._encodable(await loop.run_in_executor(None, self.table_source))
+
+    def _encodable(self, arp_table):
+        """
+        Geçersiz IP/MAC içeren kayıtları atar; tek bir bozuk satır ajanı durdurmaz.
+
+        Returns:
+            list: Gönderilebilir kayıtlar; tablo okunamadıysa None
+        """
+        if arp_table is None:
+            return None
+        rows = []
+        for entry in arp_table:
+            try:
+                arp_wire.check_entry(entry)
+            except (arp_wire.WireFormatError, KeyError, TypeError, AttributeError):
+                self.skipped_rows += 1
+                continue
+            rows.append(entry)
+        return rows
+
+    async def run_once(self):
+        """Tek bir bağlantı oturumunu bağlantı kopana kadar çalıştırır."""
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            gateway = self.gateway_source() if self.gateway_source else None
+            if self.segment is None and gateway and self.gateway_mac_source:
+                gateway_mac = self.gateway_mac_source(gateway)
+                if gateway_mac:
+                    self.segment = f"{gateway}@{gateway_mac.lower()}"
+            hello = json.dumps({"sensor": self.sensor_id, "gateway": gateway,
+                                "segment": self.segment}).encode("utf-8")
+            writer.write(encode_frame(MESSAGE_HELLO, hello))
+
+            # Tablo okunamadıysa boş tabloyla başlanır (hiçbir bağlama iddia edilmez)
+            previous = await self._read_table() or []
+            writer.write(encode_frame(MESSAGE_DELTA, arp_wire.encode_snapshot(previous)))
+            await writer.drain()
+
+            while self.running:
+                await asyncio.sleep(self.interval)
+                current = await self._read_table()
+                if current is None:
+                    continue  # Okuma hatası: kayıtları silinmiş gibi gönderme
+                # Tablo değişmediyse hiçbir şey gönderme
+                if snapshot_rows(current) != snapshot_rows(previous):
+                    writer.write(encode_frame(MESSAGE_DELTA, arp_wire.encode_delta(previous, current)))
+                    await writer.drain()
+                previous = current
+        finally:
+            writer.close()
+
+    async def run(self):
+        """Ajanı durdurulana kadar, bağlantı hatalarında yeniden bağlanarak çalıştırır."""
+        backoff = 1.0
+        while self.running:
+            try:
+                await self.run_once()
+                backoff = 1.0
+            except OSError as e:
+                print(f"⚠️ Toplayıcıya bağlanılamadı ({e}), {backoff:.0f} sn sonra tekrar denenecek.")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 60.0)
+            except (arp_wire.WireFormatError, ValueError) as e:
+                # Kodlanamayan tablo: bağlantı yeniden kurulur, ajan çalışmaya devam eder
+                print(f"⚠️ ARP tablosu gönderilemedi ({e}), {backoff:.0f} sn sonra tekrar denenecek.")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 60.0)
+
+
+def main(argv=None):
+    """Komut satırından toplayıcı veya ajan modunu çalıştırır."""
+    parser = argparse.ArgumentParser(description="ARP Spoofing Tespit Aracı - Filo modu")
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    aggregator_parser = sub.add_parser("aggregator", help="Sensör verilerini toplayan sunucu")
+    aggregator_parser.add_argument("--host", default="0.0.0.0")
+    aggregator_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+
+    agent_parser = sub.add_parser("agent", help="Yerel tabloyu toplayıcıya gönderen ajan")
+    agent_parser.add_argument("--server", required=True, help="host:port")
+    agent_parser.add_argument("--sensor-id", default=None)
+    agent_parser.add_argument("--interval", type=float, default=5.0)
+    agent_parser.add_argument("--segment", default=None,
+                              help="Segment adı (varsayılan: ilk bağlantıdaki ağ geçidi IP/MAC çifti)")
+
+    args = parser.parse_args(argv)
+
+    if args.mode == "aggregator":
+        aggregator = FleetAggregator(on_finding=lambda finding: print(finding["message"], flush=True))
+
+        async def serve_forever():
+            server = await aggregator.serve(args.host, args.port)
+            print(f"🛡️  Filo toplayıcısı {args.host}:{args.port} adresinde dinliyor.")
+            async with server:
+                await server.serve_forever()
+
+        coroutine = serve_forever()
+    else:
+        from arp_spoofing_detector import get_arp_table
+        from arp_watchdog import read_default_gateway_ip, read_neighbor_mac
+
+        host, _, port = args.server.rpartition(":")
+        agent = FleetAgent(host, int(port or DEFAULT_PORT), args.sensor_id, args.interval,
+                           table_source=get_arp_table, gateway_source=read_default_gateway_ip,
+                           gateway_mac_source=read_neighbor_mac, segment=args.segment)
+        print(f"🛰️  Ajan '{agent.sensor_id}' -> {args.server}")
+        coroutine = agent.run()
+
+    try:
+        asyncio.run(coroutine)
+    except KeyboardInterrupt:
+        print("\n👋 Program sonlandırıldı.")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -11,6 +11,8 @@ from tkinter import scrolledtext, messagebox, ttk
 import threading
 import time
 import arp_detector
+from arp_command import ScanCancelled
+from arp_scheduler import AdaptiveInterval, format_interval, new_findings
 
 class ARP_GUI:
     def __init__(self, root):
@@ -81,6 +83,18 @@ class ARP_GUI:
                                           activeforeground=self.text_color)
         self.periodic_check.pack(side=tk.LEFT, padx=10)
         
+        # Uyarlamalı aralık onay kutusu (değişim varsa sıklaşır, durgunken 24 saate kadar seyrekleşir)
+        self.adaptive_var = tk.BooleanVar()
+        self.adaptive_check = tk.Checkbutton(options_frame, 
+                                          text="Uyarlamalı aralık", 
+                                          variable=self.adaptive_var,
+                                          bg=self.bg_color, 
+                                          fg=self.text_color,
+                                          selectcolor=self.bg_color,
+                                          activebackground=self.bg_color,
+                                          activeforeground=self.text_color)
+        self.adaptive_check.pack(side=tk.LEFT, padx=10)
+        
         # Sonuçlar için metin alanı
         self.results_text = scrolledtext.ScrolledText(self.main_frame, 
                                                     wrap=tk.WORD, 
@@ -136,6 +150,10 @@ class ARP_GUI:
         # Periyodik tarama için durum değişkenleri
         self.periodic_running = False
         self.periodic_thread = None
+        self.poll_interval = None  # Uyarlamalı modda AdaptiveInterval
+        self.last_output = None  # Son periyodik taramanın ARP çıktısı (değişim tespiti için)
+        self.last_suspicious = set()  # Son taramanın şüpheli MAC'leri (yeni bulgu tespiti için)
+        self.cancel_event = threading.Event()  # Durdur butonu çalışan komutu iptal eder
         
         # Durum çubuğu
         self.status_var = tk.StringVar()
@@ -281,15 +299,24 @@ class ARP_GUI:
         Periyodik taramayı başlatır.
         """
         self.periodic_running = True
+        self.cancel_event.clear()
         self.stop_button.config(state=tk.NORMAL)
         self.scan_button.config(state=tk.DISABLED)
         self.periodic_check.config(state=tk.DISABLED)
+        self.adaptive_check.config(state=tk.DISABLED)
         
-        self.update_text("\n🕒 Periyodik kontrol aktifleştirildi. 24 saatte bir ARP tablosu kontrol edilecek.\n")
+        self.last_output = None
+        if self.adaptive_var.get():
+            self.poll_interval = AdaptiveInterval(ceiling=arp_detector.KONTROL_ARALIGI)
+            self.update_text("\n🕒 Periyodik kontrol aktifleştirildi. ARP tablosu değişim hızına göre "
+                             f"{format_interval(self.poll_interval.floor)} ile 24 saat arasında kontrol edilecek.\n")
+        else:
+            self.poll_interval = None
+            self.update_text("\n🕒 Periyodik kontrol aktifleştirildi. 24 saatte bir ARP tablosu kontrol edilecek.\n")
         self.update_text("ℹ️  Durdurmak için 'Durdur' butonuna tıklayabilirsiniz.\n")
         
-        # 24 saat sonrası için zaman hesapla
-        next_time = time.localtime(time.time() + 86400)
+        # Bir sonraki kontrol zamanını hesapla
+        next_time = time.localtime(time.time() + self.current_period())
         self.update_text(f"\n⏱️  Bir sonraki kontrol {time.strftime('%d.%m.%Y %H:%M:%S', next_time)} tarihinde yapılacak.\n")
         
         # Periyodik tarama iş parçacığını başlat
@@ -299,24 +326,35 @@ class ARP_GUI:
         # Durumu güncelle
         self.status_var.set("Periyodik tarama aktif")
     
+    def current_period(self):
+        """
+        Şu anki periyodik kontrol aralığı.
+        
+        Returns:
+            float: Saniye (uyarlamalı modda değişim hızına göre, aksi halde 24 saat)
+        """
+        if self.poll_interval is not None:
+            return self.poll_interval.interval
+        return arp_detector.KONTROL_ARALIGI
+    
     def _periodic_scan_thread(self):
         """
         Periyodik tarama iş parçacığı.
         """
         try:
             while self.periodic_running:
-                # 24 saat bekle (86400 saniye)
-                for i in range(86400):
+                # Aralık kadar bekle (varsayılan 24 saat; uyarlamalı modda her taramadan sonra değişir)
+                period = int(self.current_period())
+                for i in range(period):
                     # Her saniye kontrol et, kalan süreyi güncelle
                     if not self.periodic_running:
                         return
                     
-                    if i % 60 == 0:  # Her dakikada bir durum çubuğunu güncelle
-                        remaining = 86400 - i
-                        hours, remainder = divmod(remaining, 3600)
-                        minutes, seconds = divmod(remainder, 60)
-                        self.root.after(0, lambda h=hours, m=minutes: self.status_var.set(
-                            f"Bir sonraki taramaya {h} saat {m} dakika kaldı"))
+                    # Durum çubuğu: uzun beklemelerde dakikada, bir saatten kısa olanlarda saniyede bir
+                    if i % 60 == 0 or period < 3600:
+                        remaining = period - i
+                        self.root.after(0, lambda r=remaining: self.status_var.set(
+                            f"Bir sonraki taramaya {format_interval(r)} kaldı"))
                     
                     time.sleep(1)
                 
@@ -341,14 +379,31 @@ class ARP_GUI:
         """
         try:
             # ARP taramasını yap
-            self.capture_output(arp_detector.arp_kontrol_et)
+            started_cpu = time.thread_time()
+            result = self.capture_output(arp_detector.arp_kontrol_et, self.cancel_event)
+            
+            # Uyarlamalı aralık: tablo değiştiyse kısalır, aynı kaldıysa uzar; yalnızca yeni
+            # şüpheli MAC'ler tabana indirir (tablo alınamadıysa önceki bulgular unutulmaz)
+            if self.poll_interval is not None:
+                arp_output, suspicious_macs = result or (None, [])
+                changed = arp_output != self.last_output
+                self.last_output = arp_output
+                fresh = []
+                if result is not None:
+                    fresh, self.last_suspicious = new_findings(suspicious_macs, self.last_suspicious,
+                                                               lambda item: item[0])
+                interval = self.poll_interval.observe(changed, bool(fresh),
+                                                      time.thread_time() - started_cpu)
+                self.update_text(f"\n📊 Uyarlamalı aralık: {format_interval(interval)} ({self.poll_interval.reason})\n")
             
-            # 24 saat sonrası için zaman hesapla
-            next_time = time.localtime(time.time() + 86400)
+            # Bir sonraki kontrol zamanını hesapla
+            next_time = time.localtime(time.time() + self.current_period())
             self.update_text(f"\n⏱️  Bir sonraki kontrol {time.strftime('%d.%m.%Y %H:%M:%S', next_time)} tarihinde yapılacak.\n")
             
             # Durumu güncelle
             self.status_var.set("Periyodik tarama aktif")
+        except ScanCancelled:
+            pass  # Durdur butonu ile iptal edildi
         except Exception as e:
             messagebox.showerror("Hata", f"Periyodik tarama sırasında bir hata oluştu: {str(e)}")
             self.stop_periodic_scan()
@@ -358,9 +413,11 @@ class ARP_GUI:
         Periyodik taramayı durdurur.
         """
         self.periodic_running = False
+        self.cancel_event.set()  # Çalışan tarama komutunu sonlandır
         self.stop_button.config(state=tk.DISABLED)
         self.scan_button.config(state=tk.NORMAL)
         self.periodic_check.config(state=tk.NORMAL)
+        self.adaptive_check.config(state=tk.NORMAL)
         self.periodic_var.set(False)
         
         self.update_text("\n🛑 Periyodik tarama durduruldu.\n")
@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Uçtan Uca Tespit Gecikmesi Ölçüm Düzeneği (yalnızca Linux, root)
+Sahte ARP cevabının kabloya çıktığı andan aracın uyarı bulgusunu ürettiği ana kadar geçen
+süreyi gerçek bir çekirdek üzerinde ölçer. Ağ isim alanları (network namespace) ve veth çiftleriyle küçük bir ağ kurulur:
+
+    arplat-gw  (10.77.0.1, ağ geçidi)  ─┐
+    arplat-vic (10.77.0.2, kurban)     ─┼─ arplat-sw (br0 köprüsü)
+    arplat-atk (10.77.0.3, saldırgan)  ─┘
+
+Her denemede kurbanın ağ geçidi kaydı gerçek MAC'e döndürülür, kurban isim alanındaki dedektör
+sıfırdan kurulur (önceki denemenin tekilleştirme durumu taşınmaz), çekirdeğin ARP kilit süresi
+(locktime, 1 sn) beklenir ve saldırgan kurbana belirlenen hızda sahte cevaplar gönderir.
+Dedektör, aracın kendi tespit yolunun ağ geçidi için ilk tehdit bulgusunu ürettiği anı
+bildirir. Tüm süreçler aynı CLOCK_MONOTONIC saatini kullandığından gecikme doğrudan hesaplanır.
+
+Tespit yolları:
+    scan:     periyodik tam tarama (get_arp_table + detect_arp_spoofing + delta kuralları)
+    watchdog: ağ geçidi bekçisi (GatewayWatchdog.check_once, /proc/net/arp)
+    wire:     kablo izleyicisi (WireMonitor: gözlem hattı, paket kuralları, tutarsızlık motoru)
+
+Kullanım:
+    sudo python arp_latency.py --trials 50 --rate 10 --interval 0.1
+    sudo python arp_latency.py --modes watchdog wire --json sonuclar.json
+"""
+
+import argparse
+import json
+import os
+import queue
+import select
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from arp_capture import ETHERNET_HEADER, ARP_PACKET, ETH_P_ARP, ARP_REPLY
+
+MODES = ("scan", "watchdog", "wire")
+
+PREFIX = "arplat"
+SUBNET = "10.77.0"
+HOSTS = {
+    # rol: (IP, MAC)
+    "gw": (f"{SUBNET}.1", "02:77:00:00:00:01"),
+    "vic": (f"{SUBNET}.2", "02:77:00:00:00:02"),
+    "atk": (f"{SUBNET}.3", "02:77:00:00:00:03"),
+}
+
+# Çekirdeğin aynı kaydı yeniden yazmasına izin vermeden önce beklediği süre (neigh locktime)
+ARP_LOCKTIME = 1.0
+
+
+def percentile(sorted_values, fraction):
+    """Sıralı listede en yakın sıra (nearest-rank) yüzdeliği."""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def build_arp_reply(sender_mac, sender_ip, target_mac, target_ip):
+    """Ethernet çerçevesi içinde ARP cevabı oluşturur."""
+    sender_mac, target_mac = bytes.fromhex(sender_mac.replace(":", "")), bytes.fromhex(target_mac.replace(":", ""))
+    return (ETHERNET_HEADER.pack(target_mac, sender_mac, ETH_P_ARP) +
+            ARP_PACKET.pack(1, 0x0800, 6, 4, ARP_REPLY, sender_mac, socket.inet_aton(sender_ip),
+                            target_mac, socket.inet_aton(target_ip)))
+
+
+# ============= İSİM ALANI KURULUMU =============
+
+def _ip(*args, namespace=None):
+    command = (["ip", "netns", "exec", namespace] if namespace else []) + ["ip"] + list(args)
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+
+def namespace_name(role):
+    return f"{PREFIX}-{role}"
+
+
+def teardown_topology():
+    """Düzeneğin isim alanlarını siler (veth çiftleri onlarla birlikte kaldırılır)."""
+    for role in ("sw",) + tuple(HOSTS):
+        subprocess.run(["ip", "netns", "del", namespace_name(role)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def setup_topology():
+    """
+    Köprü ve üç host isim alanını kurar.
+
+    Raises:
+        subprocess.CalledProcessError: ip komutu başarısız olursa (ör. root değilse)
+    """
+    teardown_topology()
+    switch = namespace_name("sw")
+    _ip("netns", "add", switch)
+    _ip("link", "add", "br0", "type", "bridge", namespace=switch)
+    _ip("link", "set", "br0", "up", namespace=switch)
+    for role, (address, mac) in HOSTS.items():
+        namespace = namespace_name(role)
+        host_side, switch_side = f"{PREFIX}-{role}", f"sw-{role}"
+        _ip("netns", "add", namespace)
+        _ip("link", "add", host_side, "address", mac, "type", "veth", "peer", "name", switch_side)
+        _ip("link", "set", host_side, "netns", namespace)
+        _ip("link", "set", switch_side, "netns", switch)
+        _ip("link", "set", switch_side, "master", "br0", "up", namespace=switch)
+        _ip("link", "set", "lo", "up", namespace=namespace)
+        _ip("addr", "add", f"{address}/24", "dev", host_side, namespace=namespace)
+        _ip("link", "set", host_side, "up", namespace=namespace)
+
+
+def restore_gateway_binding():
+    """Kurbanın ağ geçidi kaydını gerçek MAC'e döndürür."""
+    gateway_ip, gateway_mac = HOSTS["gw"]
+    _ip("neigh", "replace", gateway_ip, "lladdr", gateway_mac, "dev", f"{PREFIX}-vic",
+        "nud", "reachable", namespace=namespace_name("vic"))
+
+
+# ============= YARDIMCI SÜREÇLER =============
+
+class Helper:
+    """İsim alanında çalışan yardımcı süreç; stdout satırları bir kuyruğa okunur."""
+
+    def __init__(self, role, arguments):
+        command = ["ip", "netns", "exec", namespace_name(role), sys.executable, "-u",
+                   os.path.abspath(__file__)] + arguments
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        text=True, bufsize=1)
+        self.lines = queue.Queue()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        for line in self.process.stdout:
+            self.lines.put(line.split())
+        self.lines.put(None)
+
+    def send(self, command):
+        self.process.stdin.write(command + "\n")
+        self.process.stdin.flush()
+
+    def expect(self, word, timeout):
+        """
+        Belirtilen sözcükle başlayan satırı bekler.
+
+        Returns:
+            list: Satırın alanları; zaman aşımında None
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                fields = self.lines.get(timeout=remaining)
+            except queue.Empty:
+                return None
+            if fields is None:
+                raise RuntimeError(f"Yardımcı süreç beklenmedik şekilde sonlandı: {self.process.args}")
+            if fields and fields[0] == word:
+                return fields
+
+    def drain(self):
+        """Kuyruktaki okunmamış satırları döndürür."""
+        lines = []
+        while True:
+            try:
+                fields = self.lines.get_nowait()
+            except queue.Empty:
+                return lines
+            if fields:
+                lines.append(fields)
+
+    def close(self):
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        self.process.terminate()
+        try:
+            self.process.wait(2.0)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+def command_reader():
+    """
+    stdin'den satır satır komut okuyan fonksiyon döndürür. stdin tamponsuz okunur; select ile
+    bekleme, tamponlu dosya nesnesiyle güvenilir değildir.
+
+    Returns:
+        callable: next_command(timeout=None) -> komut, zaman aşımında "", stdin kapandıysa None
+    """
+    pending = b""
+
+    def next_command(timeout=None):
+        nonlocal pending
+        while b"\n" not in pending:
+            if not select.select([0], [], [], timeout)[0]:
+                return ""
+            chunk = os.read(0, 4096)
+            if not chunk:
+                return None
+            pending += chunk
+        line, pending = pending.split(b"\n", 1)
+        return line.decode().strip()
+
+    return next_command
+
+
+def run_injector(interface, sender_ip, sender_mac, target_ip, target_mac, rate):
+    """
+    Enjektör: stdin'den komut okur. ONCE: tek cevap; BURST: STOP gelene kadar 'rate' hızında
+    cevap; her gönderimden önce ilk paketin zamanı 'SENT <monotonic>' olarak yazılır.
+    """
+    frame = build_arp_reply(sender_mac, sender_ip, target_mac, target_ip)
+    sender = socket.socket(socket.AF_PACKET, socket.SOCK_RAW)
+    sender.bind((interface, 0))
+    period = 1.0 / rate
+    next_command = command_reader()
+
+    print("READY", flush=True)
+    command = next_command()
+    while command is not None:
+        if command in ("ONCE", "BURST"):
+            print(f"SENT {time.monotonic():.9f}", flush=True)
+            sender.send(frame)
+        if command == "BURST":
+            # STOP gelene kadar sabit hızda tekrarla
+            command = next_command(period)
+            while command == "":
+                sender.send(frame)
+                command = next_command(period)
+            if command == "STOP":
+                command = next_command()
+            continue
+        command = next_command()
+    sender.close()
+    return 0
+
+
+# ============= DEDEKTÖR SÜREÇLERİ =============
+
+class ScanProbe:
+    """Periyodik tam tarama yolu: tablo okuma, tablo kuralları ve taramalar arası delta kuralları."""
+
+    polling = True
+
+    def __init__(self, interface, gateway_ip, gateway_mac):
+        self.gateway = {"ip": gateway_ip, "mac": gateway_mac}
+        self.engine = None
+
+    def arm(self, report):
+        """Yeni kural motoru kurar ve delta kuralları için ilk (gerçek) tabloyu gösterir."""
+        from arp_rules import RuleEngine, default_rules
+        from arp_spoofing_detector import get_arp_table
+
+        self.report = report
+        self.engine = RuleEngine(default_rules())
+        self.engine.observe_table(get_arp_table() or [], {"gateway": self.gateway})
+
+    def step(self):
+        from arp_spoofing_detector import detect_arp_spoofing, get_arp_table
+
+        table = get_arp_table()
+        if not table:
+            return
+        context = {"gateway": self.gateway}
+        for finding in (detect_arp_spoofing(table, gateway=self.gateway, engine=self.engine) +
+                        self.engine.observe_table(table, context)):
+            self.report(finding)
+
+    def close(self):
+        self.engine = None
+
+
+class WatchdogProbe:
+    """Ağ geçidi bekçisi yolu: sabitlenmiş MAC ile GatewayWatchdog.check_once()."""
+
+    polling = True
+
+    def __init__(self, interface, gateway_ip, gateway_mac):
+        self.gateway_ip, self.gateway_mac = gateway_ip, gateway_mac
+        self.watchdog = None
+
+    def arm(self, report):
+        from arp_watchdog import GatewayWatchdog
+
+        self.report = report
+        self.watchdog = GatewayWatchdog(self.gateway_ip, self.gateway_mac)
+
+    def step(self):
+        alert = self.watchdog.check_once()
+        if alert is not None:
+            self.report(alert)
+
+    def close(self):
+        self.watchdog = None
+
+
+class WireProbe:
+    """Kablo izleyicisi yolu: WireMonitor (kendi thread'leri) ve tutarsızlık motoru."""
+
+    polling = False
+
+    def __init__(self, interface, gateway_ip, gateway_mac):
+        self.interface = interface
+        self.gateway = (gateway_ip, gateway_mac)
+        self.monitor = None
+
+    def arm(self, report):
+        from arp_correlation import DiscrepancyEngine, WireMonitor
+        from arp_watchdog import read_proc_arp_table
+
+        engine = DiscrepancyEngine(on_finding=report)
+        self.monitor = WireMonitor(engine, read_proc_arp_table, self.interface, gateway=self.gateway)
+        self.monitor.start()
+
+    def close(self):
+        if self.monitor is not None:
+            self.monitor.stop()
+            self.monitor = None
+
+
+PROBES = {"scan": ScanProbe, "watchdog": WatchdogProbe, "wire": WireProbe}
+
+
+def run_detector(mode, interface, gateway_ip, gateway_mac, interval):
+    """
+    Dedektör: stdin'den komut okur. RESET: tespit yolunu sıfırdan kurar ve 'ARMED' yazar.
+    Kurulumdan sonra ağ geçidi için ilk tehdit bulgusu üretildiği anda
+    'ALERT <monotonic> <tür> <mac>' satırı yazılır (zaman bulgunun üretildiği andır).
+    """
+    from arp_rules import is_threat
+
+    probe = PROBES[mode](interface, gateway_ip, gateway_mac)
+    fired = threading.Event()
+    lock = threading.Lock()
+
+    def report(finding):
+        stamped = time.monotonic()
+        if (finding.get("ip") != gateway_ip or finding.get("mac") == gateway_mac or
+                not is_threat(finding)):
+            return
+        with lock:
+            if fired.is_set():
+                return
+            fired.set()
+        print(f"ALERT {stamped:.9f} {finding['type']} {finding.get('mac')}", flush=True)
+
+    next_command = command_reader()
+    print("READY", flush=True)
+    armed = False
+    command = next_command()
+    while command is not None:
+        if command == "RESET":
+            probe.close()
+            fired.clear()
+            probe.arm(report)
+            armed = True
+            print("ARMED", flush=True)
+        if probe.polling and armed:
+            probe.step()
+            command = next_command(interval)
+        else:
+            command = next_command()
+    probe.close()
+    return 0
+
+
+# ============= ÖLÇÜM =============
+
+def measure_mode(mode, trials, rate, interval, timeout):
+    """
+    Bir tespit yolu için deneme döngüsünü çalıştırır.
+
+    Returns:
+        dict: {"mode", "trials", "missed", "false_alerts", "alert_types", "latencies_ms"}
+    """
+    gateway_ip, gateway_mac = HOSTS["gw"]
+    victim_ip, victim_mac = HOSTS["vic"]
+    attacker_mac = HOSTS["atk"][1]
+    common = ["--target-ip", victim_ip, "--target-mac", victim_mac, "--sender-ip", gateway_ip]
+    genuine = Helper("gw", ["--inject", f"{PREFIX}-gw", "--sender-mac", gateway_mac,
+                            "--rate", "1"] + common)
+    forged = Helper("atk", ["--inject", f"{PREFIX}-atk", "--sender-mac", attacker_mac,
+                            "--rate", str(rate)] + common)
+    detector = Helper("vic", ["--detect", mode, "--interface", f"{PREFIX}-vic", "--gateway-ip",
+                              gateway_ip, "--gateway-mac", gateway_mac, "--interval", str(interval)])
+    latencies, missed, false_alerts, alert_types = [], 0, 0, {}
+    try:
+        for helper in (genuine, forged, detector):
+            if helper.expect("READY", 10.0) is None:
+                raise RuntimeError(f"Yardımcı süreç hazır olmadı: {helper.process.args}")
+        for _ in range(trials):
+            # Gerçek bağlamaya dön (çekirdek kaydı + kablo için gerçek cevap), dedektörü sıfırla
+            restore_gateway_binding()
+            genuine.send("ONCE")
+            detector.drain()
+            detector.send("RESET")
+            if detector.expect("ARMED", timeout) is None:
+                missed += 1
+                continue
+            # Sahte cevabın kaydı yeniden yazabilmesi için kilit süresini bekle; bu sürede
+            # gelen uyarı saldırıdan önce olduğu için yanlış alarmdır
+            time.sleep(ARP_LOCKTIME + 0.1)
+            if any(fields[0] == "ALERT" for fields in detector.drain()):
+                false_alerts += 1
+                continue
+            forged.send("BURST")
+            sent = forged.expect("SENT", timeout)
+            detected = detector.expect("ALERT", timeout)
+            forged.send("STOP")
+            if sent is None or detected is None:
+                missed += 1
+                continue
+            alert_types[detected[2]] = alert_types.get(detected[2], 0) + 1
+            latencies.append((float(detected[1]) - float(sent[1])) * 1000)
+    finally:
+        for helper in (genuine, forged, detector):
+            helper.close()
+    return {"mode": mode, "trials": trials, "missed": missed, "false_alerts": false_alerts,
+            "alert_types": alert_types, "latencies_ms": latencies}
+
+
+def summarize(result):
+    """Gecikme yüzdeliklerini hesaplar."""
+    values = sorted(result["latencies_ms"])
+    return {
+        "mode": result["mode"],
+        "trials": result["trials"],
+        "missed": result["missed"],
+        "false_alerts": result["false_alerts"],
+        "p50_ms": percentile(values, 0.50),
+        "p90_ms": percentile(values, 0.90),
+        "p99_ms": percentile(values, 0.99),
+        "max_ms": values[-1] if values else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uçtan uca ARP spoofing tespit gecikmesi ölçümü (root)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES), help="Ölçülecek tespit yolları")
+    parser.add_argument("--trials", type=int, default=30, help="Yöntem başına deneme sayısı")
+    parser.add_argument("--rate", type=float, default=10.0, help="Saldırganın saniyedeki sahte cevap sayısı")
+    parser.add_argument("--interval", type=float, default=0.2, help="Tarama ve bekçi yollarının okuma aralığı (saniye)")
+    parser.add_argument("--timeout", type=float, default=5.0, help="Deneme başına tespit zaman aşımı (saniye)")
+    parser.add_argument("--json", metavar="DOSYA", default=None, help="Ham gecikmeleri ve özeti JSON olarak yaz")
+    parser.add_argument("--keep", action="store_true", help="Bittiğinde isim alanlarını silme")
+    # İsim alanı içindeki yardımcı süreçler için (doğrudan kullanılmaz)
+    parser.add_argument("--detect", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--inject", metavar="ARAYÜZ", help=argparse.SUPPRESS)
+    parser.add_argument("--interface", help=argparse.SUPPRESS)
+    parser.add_argument("--sender-ip", help=argparse.SUPPRESS)
+    parser.add_argument("--sender-mac", help=argparse.SUPPRESS)
+    parser.add_argument("--target-ip", help=argparse.SUPPRESS)
+    parser.add_argument("--target-mac", help=argparse.SUPPRESS)
+    parser.add_argument("--gateway-ip", help=argparse.SUPPRESS)
+    parser.add_argument("--gateway-mac", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.inject:
+        return run_injector(args.inject, args.sender_ip, args.sender_mac, args.target_ip,
+                            args.target_mac, args.rate)
+    if args.detect:
+        return run_detector(args.detect, args.interface, args.gateway_ip, args.gateway_mac,
+                            args.interval)
+
+    if not sys.platform.startswith("linux") or os.geteuid() != 0:
+        print("❌ Bu düzenek Linux'ta root yetkisiyle çalışır (ağ isim alanları ve ham soketler).")
+        return 1
+    try:
+        setup_topology()
+    except (OSError, subprocess.CalledProcessError) as error:
+        stderr = getattr(error, "stderr", b"") or b""
+        print(f"❌ Ağ isim alanları kurulamadı: {error} {stderr.decode(errors='replace').strip()}")
+        teardown_topology()
+        return 1
+
+    results = []
+    try:
+        print(f"📌 Deneme: {args.trials}, sahte cevap hızı: {args.rate:g}/sn, yoklama aralığı: {args.interval:g} sn")
+        for mode in args.modes:
+            print(f"🔍 {mode} ölçülüyor...", flush=True)
+            results.append(measure_mode(mode, args.trials, args.rate, args.interval, args.timeout))
+    finally:
+        if not args.keep:
+            teardown_topology()
+
+    print(f"\n{'Yol':<12} {'Deneme':>7} {'Kaçan':>6} {'Yanlış':>7} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'maks ms':>9}")
+    summaries = [summarize(result) for result in results]
+    for summary in summaries:
+        cells = [f"{summary[key]:>9.2f}" if summary[key] is not None else f"{'-':>9}"
+                 for key in ("p50_ms", "p90_ms", "p99_ms", "max_ms")]
+        print(f"{summary['mode']:<12} {summary['trials']:>7} {summary['missed']:>6} "
+              f"{summary['false_alerts']:>7} {' '.join(cells)}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as output:
+            json.dump({"summary": summaries, "results": results}, output, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
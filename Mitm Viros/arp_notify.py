@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Webhook Bildirimleri
+Bulguları yapılandırılmış HTTP uç noktalarına JSON olarak gönderir. Gönderim, olay yazıcısının
+bir çıkışı (sink) olarak çalışır ancak kendi thread'inde yürür:
+
+- Olaylar uç nokta başına sınırlı bir giden kutusunda (outbox) birikir ve toplu gönderilir,
+- Her uç nokta için kalıcı (keep-alive) HTTP bağlantısı tekrar kullanılır,
+- Hata durumunda üstel geri çekilme (backoff) ile yeniden denenir; Retry-After dikkate alınır,
+- Giden kutusu diske atomik olarak yazılır ve yeniden başlatmada geri yüklenir.
+
+Yavaş veya erişilemeyen bir alıcı tespit döngüsünü hiçbir zaman bekletmez; kutu dolarsa en
+eski olaylar atılır ve sayılır.
+
+Kullanım:
+    python arp_spoofing_detector.py --webhook http://127.0.0.1:8080/arp --outbox giden.json
+"""
+
+import http.client
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+# Kalıcı hatalar: yeniden denemek anlamsız (408 ve 429 hariç 4xx)
+RETRYABLE_CLIENT_ERRORS = (408, 429)
+
+
+class Endpoint:
+    """Tek bir webhook adresi için giden kutusu, bağlantı ve geri çekilme durumu."""
+
+    def __init__(self, url, max_outbox, timeout):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Geçersiz webhook adresi: {url}")
+        self.url = url
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self.timeout = timeout
+        self.outbox = deque(maxlen=max_outbox)
+        self.connection = None
+        self.failures = 0
+        self.next_attempt = 0.0
+        self.delivered = 0
+        self.dropped = 0
+
+    def connect(self):
+        """Kalıcı bağlantıyı döndürür; yoksa açar."""
+        if self.connection is None:
+            connection_class = (http.client.HTTPSConnection if self.scheme == "https"
+                                else http.client.HTTPConnection)
+            self.connection = connection_class(self.host, self.port, timeout=self.timeout)
+        return self.connection
+
+    def reset(self):
+        """Bağlantıyı kapatır (hata sonrası yeniden açılır)."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def enqueue(self, events):
+        """Olayları giden kutusuna ekler; kutu doluysa en eskiler atılır."""
+        overflow = max(0, len(self.outbox) + len(events) - self.outbox.maxlen)
+        self.dropped += overflow
+        self.outbox.extend(events)
+
+
+class WebhookNotifier:
+    """
+    Olay yazıcısı için toplu ve asenkron webhook çıkışı.
+    """
+
+    def __init__(self, urls, outbox_path=None, batch_size=50, flush_interval=2.0,
+                 max_outbox=10000, timeout=5.0, backoff_base=1.0, backoff_max=300.0,
+                 persist_interval=5.0):
+        """
+        Args:
+            urls (list): Webhook adresleri
+            outbox_path (str): Giden kutusunun saklanacağı dosya (None: yalnızca bellekte)
+            batch_size (int): Tek istekte gönderilecek en fazla olay
+            flush_interval (float): Toplu gönderim için en fazla bekleme (saniye)
+            max_outbox (int): Uç nokta başına giden kutusu sınırı
+            timeout (float): HTTP bağlantı/okuma zaman aşımı
+            backoff_base (float): İlk yeniden deneme gecikmesi
+            backoff_max (float): En uzun yeniden deneme gecikmesi
+            persist_interval (float): Giden kutusunun diske yazılma aralığı
+        """
+        self.endpoints = [Endpoint(url, max_outbox, timeout) for url in urls]
+        self.outbox_path = outbox_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.persist_interval = persist_interval
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+        self._dirty = False
+        self._last_persist = 0.0
+        self._first_pending = None
+        self._load()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    # ---- Olay yazıcısı çıkışı arayüzü ----
+
+    def write_batch(self, events):
+        """Olayları giden kutularına ekler (bloklamaz)."""
+        with self._lock:
+            for endpoint in self.endpoints:
+                endpoint.enqueue(events)
+            self._dirty = True
+            if self._first_pending is None:
+                self._first_pending = time.monotonic()
+        if sum(len(endpoint.outbox) for endpoint in self.endpoints) >= self.batch_size:
+            self._wakeup.set()
+
+    def close(self, timeout=5.0):
+        """Kalan olayları göndermeyi bir kez dener, giden kutusunu kaydeder ve durur."""
+        self._stop_event.set()
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._persist(force=True)
+        for endpoint in self.endpoints:
+            endpoint.reset()
+
+    # ---- Kalıcılık ----
+
+    def _load(self):
+        if not self.outbox_path or not os.path.exists(self.outbox_path):
+            return
+        try:
+            with open(self.outbox_path, encoding="utf-8") as outbox_file:
+                saved = json.load(outbox_file)
+        except (OSError, ValueError):
+            return
+        for endpoint in self.endpoints:
+            endpoint.enqueue(saved.get(endpoint.url, []))
+        if any(endpoint.outbox for endpoint in self.endpoints):
+            self._first_pending = 0.0  # Bekleyen olaylar hemen gönderilsin
+
+    def _persist(self, force=False):
+        if not self.outbox_path:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if not self._dirty or (not force and now - self._last_persist < self.persist_interval):
+                return
+            snapshot = {endpoint.url: list(endpoint.outbox) for endpoint in self.endpoints}
+            self._dirty = False
+            self._last_persist = now
+        directory = os.path.dirname(os.path.abspath(self.outbox_path))
+        handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".outbox-")
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as temp_file:
+                json.dump(snapshot, temp_file, ensure_ascii=False)
+            os.replace(temp_path, self.outbox_path)
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+    # ---- Gönderim ----
+
+    def _backoff(self, endpoint, retry_after=None):
+        endpoint.failures += 1
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (endpoint.failures - 1))
+        delay = delay * (0.5 + random.random() / 2)  # Eşzamanlı sensörler aynı anda denemesin
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        endpoint.next_attempt = time.monotonic() + delay
+
+    def _deliver(self, endpoint):
+        """
+        Uç noktanın giden kutusundan bir toplu istek gönderir.
+
+        Returns:
+            bool: Gönderim başarılıysa (veya kalıcı hata nedeniyle atıldıysa) True
+        """
+        with self._lock:
+            batch = [endpoint.outbox[index] for index in range(min(self.batch_size, len(endpoint.outbox)))]
+        if not batch:
+            return True
+        body = json.dumps({"events": batch}, ensure_ascii=False).encode("utf-8")
+        try:
+            connection = endpoint.connect()
+            connection.request("POST", endpoint.path, body=body, headers={
+                "Content-Type": "application/json",
+                "Connection": "keep-alive",
+            })
+            response = connection.getresponse()
+            response.read()  # Bağlantının yeniden kullanılabilmesi için yanıt tüketilir
+            status = response.status
+            retry_after = response.getheader("Retry-After")
+            if response.getheader("Connection", "").lower() == "close":
+                endpoint.reset()
+        except (OSError, http.client.HTTPException):
+            endpoint.reset()
+            self._backoff(endpoint)
+            return False
+
+        if 200 <= status < 300 or (400 <= status < 500 and status not in RETRYABLE_CLIENT_ERRORS):
+            with self._lock:
+                for _ in range(min(len(batch), len(endpoint.outbox))):
+                    endpoint.outbox.popleft()
+                self._dirty = True
+            if status < 300:
+                endpoint.delivered += len(batch)
+            else:
+                endpoint.dropped += len(batch)
+            endpoint.failures = 0
+            endpoint.next_attempt = 0.0
+            return True
+
+        try:
+            retry_after = float(retry_after) if retry_after else None
+        except ValueError:
+            retry_after = None
+        self._backoff(endpoint, retry_after)
+        return False
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            stopping = self._stop_event.is_set()
+            now = time.monotonic()
+            due = stopping or (self._first_pending is not None and
+                               now - self._first_pending >= self.flush_interval)
+            for endpoint in self.endpoints:
+                if not endpoint.outbox:
+                    continue
+                if not stopping and endpoint.next_attempt > now:
+                    continue
+                if not due and len(endpoint.outbox) < self.batch_size:
+                    continue
+                # Başarılı oldukça kutuyu boşalt; hata olursa sonraki tura bırak
+                while endpoint.outbox and self._deliver(endpoint):
+                    if self._stop_event.is_set() and not stopping:
+                        break
+            with self._lock:
+                if not any(endpoint.outbox for endpoint in self.endpoints):
+                    self._first_pending = None
+                elif due:
+                    self._first_pending = now
+            self._persist()
+            if stopping:
+                return
+
+    @property
+    def stats(self):
+        """Uç nokta başına gönderilen, atılan ve bekleyen olay sayıları."""
+        return {endpoint.url: {"delivered": endpoint.delivered, "dropped": endpoint.dropped,
+                               "pending": len(endpoint.outbox), "failures": endpoint.failures}
+                for endpoint in self.endpoints}
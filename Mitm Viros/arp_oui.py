@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Bellek Eşlemeli OUI Üretici İndeksi
+IEEE MA-L (oui.csv / oui.txt), MA-M (mam.csv) ve MA-S (oui36.csv) kayıtlarını sıralı bir
+ikili dosyaya derler. Dosya mmap ile açılır; yükleme anlık, RSS maliyeti yalnızca erişilen
+sayfalar kadardır.
+
+İç içe bloklar (MA-L içindeki MA-M/MA-S) derleme sırasında birbiriyle çakışmayan aralıklara
+bölünür; böylece arama, başlangıç adresleri dizisinde tek bir ikili aramadır (bisect, C'de).
+Ağ geçidi IP'sini iddia eden bir MAC'in router yerine dizüstü bilgisayar üreticisine ait
+olması güçlü bir işarettir. MAC'in üst 16 biti ile seçilen kova tablosu ikili aramayı birkaç
+karşılaştırmaya indirir; tekrar eden MAC'ler için küçük bir önbellek kullanılır.
+
+Dosya düzeni (küçük uçlu):
+    başlık  "<4sHHII": sihirli sayı, sürüm, ayrılmış, aralık sayısı, üretici sayısı
+    uint32[65537]        kova tablosu: üst 16 biti b olan ilk aralığın numarası
+    uint64[aralık]       aralık başlangıçları (48 bit MAC değeri), sıralı
+    uint32[aralık]       üretici numarası (NO_VENDOR: kayıtsız aralık)
+    uint32[üretici + 1]  isim ofsetleri
+    UTF-8 isimler
+
+Kullanım:
+    python arp_oui.py compile oui.csv mam.csv oui36.csv -o oui.bin
+    python arp_oui.py lookup 00:1a:2b:3c:4d:5e
+"""
+
+import argparse
+import bisect
+import csv
+import mmap
+import os
+import re
+import struct
+import tempfile
+import time
+
+MAGIC = b"OUIM"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+NO_VENDOR = 0xFFFFFFFF
+MAC_SPACE = 1 << 48
+BUCKET_BITS = 16
+BUCKET_COUNT = 1 << BUCKET_BITS
+BUCKET_SHIFT = 48 - BUCKET_BITS
+CACHE_SIZE = 65536
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "oui.bin")
+
+# oui.txt satırı: "00-1A-2B   (hex)		Üretici"
+OUI_TXT_PATTERN = re.compile(r"^([0-9A-Fa-f]{2}-[0-9A-Fa-f]{2}-[0-9A-Fa-f]{2})\s+\(hex\)\s+(.+)$")
+
+
+class OuiFormatError(Exception):
+    """İndeks dosyası bozuk veya desteklenmeyen sürümde."""
+
+
+def parse_registry(path):
+    """
+    Bir IEEE kayıt dosyasını okur.
+
+    Yields:
+        tuple: (başlangıç, uzunluk_bit, üretici)
+    """
+    with open(path, encoding="utf-8", errors="replace", newline="") as registry_file:
+        first_line = registry_file.readline()
+        registry_file.seek(0)
+        if first_line.startswith("Registry,"):
+            # CSV: Registry,Assignment,Organization Name,Organization Address
+            for row in csv.DictReader(registry_file):
+                assignment = row.get("Assignment", "").strip()
+                name = (row.get("Organization Name") or "").strip()
+                if not assignment or not name or not re.fullmatch(r"[0-9A-Fa-f]+", assignment):
+                    continue
+                bits = len(assignment) * 4
+                if bits not in (24, 28, 36):
+                    continue
+                yield int(assignment, 16) << (48 - bits), bits, name
+        else:
+            for line in registry_file:
+                match = OUI_TXT_PATTERN.match(line.strip())
+                if match:
+                    yield int(match.group(1).replace("-", ""), 16) << 24, 24, match.group(2).strip()
+
+
+def build_segments(blocks):
+    """
+    İç içe blokları çakışmayan aralıklara böler.
+
+    Args:
+        blocks (list): (başlangıç, uzunluk_bit, üretici_no) demetleri
+
+    Returns:
+        list: Sıralı (başlangıç, üretici_no) aralıkları
+    """
+    segments = []
+
+    def emit(start, vendor):
+        if segments and segments[-1][0] == start:
+            segments.pop()
+        if segments and segments[-1][1] == vendor:
+            return
+        segments.append((start, vendor))
+
+    # Aynı başlangıçta büyük blok önce gelir; IEEE blokları iç içe (laminer) olduğundan yığın yeterli
+    stack = []  # (bitiş, üretici_no)
+    emit(0, NO_VENDOR)
+    for start, bits, vendor in sorted(set(blocks), key=lambda block: (block[0], block[1])):
+        end = start + (1 << (48 - bits))
+        while stack and stack[-1][0] <= start:
+            popped_end, _ = stack.pop()
+            emit(popped_end, stack[-1][1] if stack else NO_VENDOR)
+        emit(start, vendor)
+        stack.append((end, vendor))
+    while stack:
+        popped_end, _ = stack.pop()
+        emit(popped_end, stack[-1][1] if stack else NO_VENDOR)
+    # Adres uzayının sonunu gösteren kayıt gereksiz
+    if segments and segments[-1][0] >= MAC_SPACE:
+        segments.pop()
+    return segments
+
+
+def compile_index(registry_paths, output_path):
+    """
+    Kayıt dosyalarını ikili indekse derler (atomik yazım).
+
+    Returns:
+        tuple: (aralık sayısı, üretici sayısı)
+    """
+    names = {}
+    blocks = []
+    for path in registry_paths:
+        for start, bits, name in parse_registry(path):
+            vendor = names.setdefault(name, len(names))
+            blocks.append((start, bits, vendor))
+
+    segments = build_segments(blocks)
+    name_blob = bytearray()
+    offsets = []
+    for name in names:  # dict ekleme sırası = üretici numarası
+        offsets.append(len(name_blob))
+        name_blob += name.encode("utf-8")
+    offsets.append(len(name_blob))
+
+    starts = [start for start, _ in segments]
+    buckets = [bisect.bisect_left(starts, bucket << BUCKET_SHIFT) for bucket in range(BUCKET_COUNT)]
+    buckets.append(len(starts))
+    payload = b"".join([
+        HEADER.pack(MAGIC, VERSION, 0, len(segments), len(names)),
+        struct.pack(f"<{len(buckets)}I", *buckets),
+        struct.pack(f"<{len(segments)}Q", *starts),
+        struct.pack(f"<{len(segments)}I", *(vendor for _, vendor in segments)),
+        struct.pack(f"<{len(offsets)}I", *offsets),
+        bytes(name_blob),
+    ])
+    directory = os.path.dirname(os.path.abspath(output_path))
+    handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".oui-")
+    with os.fdopen(handle, "wb") as temp_file:
+        temp_file.write(payload)
+    os.replace(temp_path, output_path)
+    return len(segments), len(names)
+
+
+def mac_to_int(mac):
+    """'aa:bb:cc:dd:ee:ff' veya 'aa-bb-...' biçimindeki MAC'i 48 bitlik tamsayıya çevirir."""
+    return int(mac.replace(":", "").replace("-", ""), 16)
+
+
+class OuiIndex:
+    """
+    Derlenmiş OUI indeksini mmap ile açan salt okunur arama nesnesi.
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        """
+        Raises:
+            OSError: Dosya açılamazsa
+            OuiFormatError: Dosya geçersizse
+        """
+        with open(path, "rb") as index_file:
+            self._mmap = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < HEADER.size:
+            raise OuiFormatError("OUI indeksi çok kısa")
+        magic, version, _, segment_count, name_count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            raise OuiFormatError("Geçersiz veya desteklenmeyen OUI indeksi")
+
+        view = memoryview(self._mmap)
+        offset = HEADER.size
+        self._buckets = view[offset:offset + (BUCKET_COUNT + 1) * 4].cast("I")
+        offset += (BUCKET_COUNT + 1) * 4
+        self._starts = view[offset:offset + segment_count * 8].cast("Q")
+        offset += segment_count * 8
+        self._vendors = view[offset:offset + segment_count * 4].cast("I")
+        offset += segment_count * 4
+        self._name_offsets = view[offset:offset + (name_count + 1) * 4].cast("I")
+        self._names_base = offset + (name_count + 1) * 4
+        self._name_cache = {}
+        self._cache = {}  # MAC metni -> üretici (tekrar eden MAC'ler için)
+        self.segment_count = segment_count
+        self.vendor_count = name_count
+
+    def _name(self, vendor):
+        name = self._name_cache.get(vendor)
+        if name is None:
+            start = self._names_base + self._name_offsets[vendor]
+            end = self._names_base + self._name_offsets[vendor + 1]
+            name = self._name_cache[vendor] = self._mmap[start:end].decode("utf-8")
+        return name
+
+    def lookup_int(self, value):
+        """48 bitlik MAC değeri için üretici adını döndürür (yoksa None)."""
+        bucket = value >> BUCKET_SHIFT
+        index = bisect.bisect_right(self._starts, value, self._buckets[bucket], self._buckets[bucket + 1]) - 1
+        if index < 0:
+            return None
+        vendor = self._vendors[index]
+        return None if vendor == NO_VENDOR else self._name(vendor)
+
+    def lookup(self, mac):
+        """
+        MAC adresinin üreticisini döndürür.
+
+        Returns:
+            str: Üretici adı; kayıtsız, yerel yönetimli veya geçersiz MAC için None
+        """
+        try:
+            return self._cache[mac]
+        except KeyError:
+            pass
+        try:
+            value = mac_to_int(mac)
+        except ValueError:
+            return None
+        # Yerel yönetimli (U/L biti) adresler IEEE'ye kayıtlı değildir
+        vendor = None if value >> 40 & 0x02 else self.lookup_int(value)
+        if len(self._cache) >= CACHE_SIZE:
+            self._cache.clear()
+        self._cache[mac] = vendor
+        return vendor
+
+    def close(self):
+        """Eşlemeyi kapatır."""
+        self._buckets.release()
+        self._starts.release()
+        self._vendors.release()
+        self._name_offsets.release()
+        self._mmap.close()
+
+
+_default_index = None
+
+
+def default_index():
+    """
+    Modül yanındaki oui.bin dosyasını (bir kez) açar.
+
+    Returns:
+        OuiIndex: İndeks yoksa veya bozuksa None
+    """
+    global _default_index
+    if _default_index is None:
+        try:
+            _default_index = OuiIndex(os.environ.get("ARP_OUI_INDEX", DEFAULT_INDEX_PATH))
+        except (OSError, OuiFormatError):
+            _default_index = False
+    return _default_index or None
+
+
+def annotate_findings(findings, index=None):
+    """
+    Bulgulara MAC üreticilerini ekler ("vendor" / "vendors" alanları ve mesaj sonu).
+
+    Args:
+        findings (list): Bulgu sözlükleri (yerinde güncellenir)
+        index (OuiIndex): Kullanılacak indeks (varsayılan: default_index())
+
+    Returns:
+        list: Aynı bulgu listesi
+    """
+    index = index or default_index()
+    if index is None:
+        return findings
+    for finding in findings:
+        if finding.get("macs"):
+            vendors = {mac: index.lookup(mac) or "Bilinmeyen üretici" for mac in finding["macs"]}
+            finding["vendors"] = vendors
+            if len(set(vendors.values())) > 1 and "Üreticiler:" not in finding.get("message", ""):
+                finding["message"] += " - Üreticiler: " + ", ".join(f"{mac} ({vendor})" for mac, vendor in vendors.items())
+        elif finding.get("mac"):
+            vendor = index.lookup(finding["mac"])
+            if vendor:
+                finding["vendor"] = vendor
+    return findings
+
+
+def main(argv=None):
+    """Komut satırından indeks derler veya MAC arar."""
+    parser = argparse.ArgumentParser(description="ARP Spoofing Tespit Aracı - OUI üretici indeksi")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    compile_parser = subparsers.add_parser("compile", help="IEEE kayıtlarını ikili indekse derle")
+    compile_parser.add_argument("registries", nargs="+", help="oui.csv, mam.csv, oui36.csv veya oui.txt")
+    compile_parser.add_argument("-o", "--output", default=DEFAULT_INDEX_PATH, help="Çıktı dosyası")
+    lookup_parser = subparsers.add_parser("lookup", help="MAC adreslerinin üreticisini göster")
+    lookup_parser.add_argument("macs", nargs="+")
+    lookup_parser.add_argument("--index", default=DEFAULT_INDEX_PATH)
+    lookup_parser.add_argument("--benchmark", type=int, default=0, metavar="N",
+                               help="N arama yapıp MAC başına süreyi ölç")
+    args = parser.parse_args(argv)
+
+    if args.command == "compile":
+        started = time.perf_counter()
+        segments, vendors = compile_index(args.registries, args.output)
+        print(f"✅ {vendors} üretici, {segments} aralık -> {args.output} ({time.perf_counter() - started:.2f} sn)")
+        return 0
+
+    index = OuiIndex(args.index)
+    for mac in args.macs:
+        print(f"{mac}: {index.lookup(mac) or 'Bilinmeyen üretici'}")
+    if args.benchmark:
+        started = time.perf_counter()
+        for position in range(args.benchmark):
+            index.lookup(args.macs[position % len(args.macs)])
+        elapsed = time.perf_counter() - started
+        print(f"📊 MAC başına {elapsed / args.benchmark * 1e6:.3f} µs")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
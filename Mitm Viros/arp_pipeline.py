@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Sınırlı Gözlem Hattı (Geri Basınç ve Yük Atma)
+Yakalama/tablo okuma ile tespit arasında sınırlı bir kuyruk tanımlar. Paketler tespitin
+işleyebileceğinden hızlı geldiğinde sırasıyla:
+
+1. Kuyrukta bekleyen aynı gözlemler tek kayıtta birleştirilir (sayaç ve son görülme artar),
+2. Yüksek su seviyesinin üzerinde kritik olmayan trafik örneklenir (doluluk arttıkça oran düşer),
+3. Kuyruk tamamen doluysa kritik olmayan gözlemler atılır.
+
+Ağ geçidine ait gözlemler (IP veya MAC) hiçbir zaman atılmaz ve tüketiciye önce verilir.
+Atılan her şey sayaçlarda görünür; böylece tespit, saldırı sırasında dakikalarca geride
+kalmak yerine gerçek zamanlı kalır. Bloklayan üreticiler (ör. periyodik tablo okuma)
+block=True ile yer açılana kadar bekleyebilir.
+
+ClaimCoalescer ise hattın arkasında durur: sağlıklı bir ağ aynı (ip, mac) iddialarını
+sürekli tekrarlar, zehirleyici de yalanını her saniye yineler. Yalnızca yeni veya değişen
+iddialar tespite hemen iletilir; tekrarlar pencere başına bir özet olarak gönderilir.
+"""
+
+import random
+import threading
+import time
+from collections import deque, OrderedDict
+
+
+def observation_key(observation):
+    """Varsayılan birleştirme anahtarı: (ip, mac, arayüz)."""
+    return observation.get("ip"), observation.get("mac"), observation.get("interface")
+
+
+class ObservationPipeline:
+    """
+    Kritik gözlemlere öncelik veren, birleştiren ve örnekleyen sınırlı kuyruk.
+    """
+
+    def __init__(self, maxsize=10000, high_watermark=0.5, min_sample_rate=0.05,
+                 key=observation_key, rng=random.random):
+        """
+        Args:
+            maxsize (int): Kritik olmayan gözlemler için kuyruk sınırı
+            high_watermark (float): Örneklemenin başladığı doluluk oranı (0-1)
+            min_sample_rate (float): Kuyruk dolmaya yakınken kabul edilen en düşük oran
+            key (callable): Gözlemden birleştirme anahtarı üreten fonksiyon
+            rng (callable): [0, 1) aralığında sayı üreten fonksiyon (örnekleme için)
+        """
+        self.maxsize = maxsize
+        self.high = int(maxsize * high_watermark)
+        self.min_sample_rate = min_sample_rate
+        self.key = key
+        self.rng = rng
+
+        self.critical_ips = set()
+        self.critical_macs = set()
+
+        self._critical = deque()
+        self._normal = deque()
+        self._pending = {}  # anahtar -> kuyruktaki gözlem (birleştirme için)
+        self._condition = threading.Condition()
+        self.stats = {
+            "accepted": 0,
+            "critical": 0,
+            "coalesced": 0,
+            "sampled_out": 0,
+            "dropped_full": 0,
+            "blocked": 0,
+            "max_depth": 0,
+        }
+
+    def set_critical(self, ips=(), macs=()):
+        """Hiçbir zaman atılmayacak IP ve MAC adreslerini belirler (ör. ağ geçidi)."""
+        with self._condition:
+            self.critical_ips = set(ips)
+            self.critical_macs = {mac.lower() for mac in macs}
+
+    def is_critical(self, observation):
+        """Gözlem ağ geçidi gibi kritik bir adresle ilgiliyse True döndürür."""
+        return (observation.get("ip") in self.critical_ips or
+                observation.get("mac") in self.critical_macs)
+
+    def depth(self):
+        """Bekleyen gözlem sayısı."""
+        return len(self._critical) + len(self._normal)
+
+    def sample_rate(self):
+        """
+        Mevcut dolulukta kritik olmayan yeni gözlemlerin kabul oranı.
+
+        Returns:
+            float: Yüksek su seviyesinin altında 1.0, kuyruk doluyken min_sample_rate
+        """
+        depth = len(self._normal)
+        if depth < self.high:
+            return 1.0
+        span = max(1, self.maxsize - self.high)
+        return max(self.min_sample_rate, 1.0 - (depth - self.high) / span)
+
+    def put(self, observation, block=False, timeout=None):
+        """
+        Bir gözlemi hatta ekler.
+
+        Args:
+            observation (dict): Gözlem ("ip", "mac" ve isteğe bağlı "interface" alanları)
+            block (bool): True ise kuyruk doluyken atmak yerine yer açılmasını bekle
+            timeout (float): Bekleme üst sınırı (saniye)
+
+        Returns:
+            bool: Gözlem kabul edildi veya birleştirildiyse True, atıldıysa False
+        """
+        key = self.key(observation)
+        now = time.monotonic()
+        with self._condition:
+            pending = self._pending.get(key)
+            if pending is not None:
+                # 1. Birleştirme: kuyrukta aynı gözlem zaten bekliyor
+                pending["count"] = pending.get("count", 1) + 1
+                pending["last_seen"] = now
+                self.stats["coalesced"] += 1
+                return True
+
+            if self.is_critical(observation):
+                self._critical.append(observation)
+                self.stats["critical"] += 1
+            else:
+                if block:
+                    deadline = None if timeout is None else now + timeout
+                    while len(self._normal) >= self.maxsize:
+                        self.stats["blocked"] += 1
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            self.stats["dropped_full"] += 1
+                            return False
+                        self._condition.wait(remaining)
+                elif len(self._normal) >= self.maxsize:
+                    # 3. Kuyruk dolu: kritik olmayan gözlem atılır
+                    self.stats["dropped_full"] += 1
+                    return False
+                elif self.rng() >= self.sample_rate():
+                    # 2. Örnekleme: aşırı yükte kritik olmayan trafiğin bir kısmı atılır
+                    self.stats["sampled_out"] += 1
+                    return False
+                self._normal.append(observation)
+
+            observation.setdefault("count", 1)
+            observation["last_seen"] = now
+            self._pending[key] = observation
+            self.stats["accepted"] += 1
+            depth = len(self._critical) + len(self._normal)
+            if depth > self.stats["max_depth"]:
+                self.stats["max_depth"] = depth
+            self._condition.notify_all()
+            return True
+
+    def get_batch(self, limit=1024, timeout=None):
+        """
+        Bekleyen gözlemleri (önce kritik olanlar) toplu olarak alır.
+
+        Args:
+            limit (int): En fazla gözlem sayısı
+            timeout (float): Hat boşsa bekleme süresi (None: süresiz)
+
+        Returns:
+            list: Gözlemler; zaman aşımında boş liste
+        """
+        with self._condition:
+            if not self._critical and not self._normal:
+                self._condition.wait(timeout)
+            batch = []
+            for source in (self._critical, self._normal):
+                while source and len(batch) < limit:
+                    observation = source.popleft()
+                    self._pending.pop(self.key(observation), None)
+                    batch.append(observation)
+            if batch:
+                self._condition.notify_all()
+            return batch
+
+    def shed_total(self):
+        """Atılan toplam gözlem sayısı (birleştirilenler hariç)."""
+        return self.stats["sampled_out"] + self.stats["dropped_full"]
+
+
+class ClaimCoalescer:
+    """
+    (ip, mac, arayüz) anahtarlı küçük bir tabloyla aynı ARP iddialarını birleştirir.
+
+    Pencere süresi tespit motorunun korelasyon penceresinden büyük olmamalıdır; böylece
+    tekrarlanan iddialar motorda her pencerede tazelenir ve tespit doğruluğu kaybolmaz.
+    """
+
+    def __init__(self, window=5.0, max_entries=65536, clock=time.monotonic):
+        """
+        Args:
+            window (float): Özet aralığı (saniye)
+            max_entries (int): Tablodaki en fazla iddia sayısı (en eski görülen atılır)
+            clock (callable): Zaman kaynağı
+        """
+        self.window = window
+        self.max_entries = max_entries
+        self.clock = clock
+        self.claims = OrderedDict()  # (ip, mac, arayüz) -> [paket, ilk, son, sayaç, pencere sayacı]
+        self.last_flush = clock()
+        self.stats = {"offered": 0, "forwarded": 0, "suppressed": 0, "summaries": 0, "expired": 0}
+
+    def offer(self, packet, interface=None, now=None):
+        """
+        Bir ARP iddiasını tabloya işler.
+
+        Args:
+            packet (dict): arp_capture.decode_arp() çıktısı
+            interface (str): Paketin yakalandığı arayüz
+            now (float): Gözlem zamanı
+
+        Returns:
+            bool: İddia yeni veya değişmişse (hemen iletilmeli) True, tekrarsa False
+        """
+        now = self.clock() if now is None else now
+        key = (packet["sender_ip"], packet["sender_mac"], interface)
+        self.stats["offered"] += 1
+        entry = self.claims.get(key)
+        if entry is not None and entry[0]["eth_src"] == packet["eth_src"]:
+            entry[2] = now
+            entry[3] += 1
+            entry[4] += 1
+            self.claims.move_to_end(key)
+            self.stats["suppressed"] += 1
+            return False
+
+        # Yeni iddia veya aynı iddia farklı Ethernet kaynağından (değişiklik)
+        self.claims[key] = [packet, now, now, 1, 0]
+        self.claims.move_to_end(key)
+        if len(self.claims) > self.max_entries:
+            self.claims.popitem(last=False)
+            self.stats["expired"] += 1
+        self.stats["forwarded"] += 1
+        return True
+
+    def flush(self, now=None, force=False):
+        """
+        Pencere dolduysa tekrarlanan iddiaların özetlerini döndürür ve bayat kayıtları atar.
+
+        Args:
+            now (float): Şimdiki zaman
+            force (bool): Pencere dolmasa da özet üret
+
+        Returns:
+            list: Özet paketleri ("count", "first_seen", "last_seen" alanlarıyla)
+        """
+        now = self.clock() if now is None else now
+        if not force and now - self.last_flush < self.window:
+            return []
+        self.last_flush = now
+
+        # Üç pencere boyunca görülmeyen iddialar atılır; yeniden görülürse yeni sayılır
+        horizon = now - 3 * self.window
+        while self.claims:
+            key, entry = next(iter(self.claims.items()))
+            if entry[2] >= horizon:
+                break
+            del self.claims[key]
+            self.stats["expired"] += 1
+
+        summaries = []
+        for entry in self.claims.values():
+            if entry[4]:
+                summary = dict(entry[0], count=entry[3], first_seen=entry[1], last_seen=entry[2])
+                summary["summary"] = True
+                summaries.append(summary)
+                entry[4] = 0
+        self.stats["summaries"] += len(summaries)
+        return summaries
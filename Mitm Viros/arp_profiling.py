@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Çalışma Zamanında Açılabilen Profil Çıkarma
+Müşteri ağında yavaş bir taramanın zamanını nereye harcadığını görmek için:
+
+- cProfile: Sonraki N taramayı (tarama + arayüz güncelleme bölümleri) profiller ve
+  pstats dosyası ile okunabilir bir özet yazar,
+- tracemalloc: N tarama boyunca her taramadan sonra bellek anlık görüntüsü alır ve bir
+  öncekine göre en çok büyüyen ayırma noktalarını yazar,
+- Yığın dökümü: SIGUSR1 ile tüm thread'lerin anlık yığını yazılır, ardından birkaç saniye
+  boyunca yığınlar örneklenip katlanmış (flame graph uyumlu) biçimde toplanır,
+- SIGUSR2 ile cProfile ve tracemalloc çalışan süreçte yeniden başlatmadan, bir sonraki
+  taramadan itibaren açılır.
+
+Tüm sonuçlar destek kaydına eklenebilecek dosyalar olarak çıktı dizinine yazılır. Kapalıyken
+bölümler paylaşılan bir nullcontext döndürür; ek maliyet bir öznitelik kontrolüdür.
+
+Kullanım:
+    python arp_spoofing_detector.py --profile-scans 5 --trace-memory 5 --profile-dir profiller
+    kill -USR1 <pid>     # Yığın dökümü ve örnekleme
+    kill -USR2 <pid>     # Sonraki taramaları profille
+"""
+
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import signal
+import sys
+import threading
+import time
+import traceback
+import tracemalloc
+from collections import Counter
+
+DEFAULT_PROFILE_DIR = "arp-profiles"
+
+_DISABLED = contextlib.nullcontext()
+
+
+def _thread_names():
+    return {thread.ident: thread.name for thread in threading.enumerate()}
+
+
+def collapse_stack(frame):
+    """Yığını kökten yaprağa 'dosya:fonksiyon;...' biçiminde tek satıra katlar."""
+    parts = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(parts))
+
+
+class ScanProfiler:
+    """
+    Taramaları isteğe bağlı olarak profilleyen ve sonuçları dosyaya yazan yardımcı.
+    """
+
+    def __init__(self, output_dir=DEFAULT_PROFILE_DIR, top=30, trace_frames=10):
+        """
+        Args:
+            output_dir (str): Sonuç dosyalarının yazılacağı dizin (ilk yazımda oluşturulur)
+            top (int): Özetlerde gösterilecek satır sayısı
+            trace_frames (int): tracemalloc'un her ayırma için sakladığı çerçeve sayısı
+        """
+        self.output_dir = output_dir
+        self.top = top
+        self.trace_frames = trace_frames
+        self.active = False
+        self.written = []
+        self._lock = threading.Lock()
+        self._profile_remaining = 0
+        self._profiles = {}  # bölüm adı -> cProfile.Profile (her thread kendi bölümünü kullanır)
+        self._memory_remaining = 0
+        self._memory_snapshot = None
+        self._memory_index = 0
+        self._sampling = False
+        self._requested = 0  # Sinyalle istenen tarama sayısı; sonraki scan() başında kurulur
+
+    # ---- Dosyalar ----
+
+    def _path(self, kind, extension):
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(self.output_dir, f"{kind}-{stamp}-{os.getpid()}.{extension}")
+        self.written.append(path)
+        return path
+
+    # ---- Açma ----
+
+    def profile_scans(self, count):
+        """Sonraki 'count' taramayı cProfile ile profiller."""
+        with self._lock:
+            if count > 0 and not self._profile_remaining:
+                self._profiles = {}
+            self._profile_remaining = max(self._profile_remaining, count)
+            self._update_active()
+
+    def trace_memory(self, count):
+        """Sonraki 'count' tarama boyunca bellek ayırmalarını izler."""
+        with self._lock:
+            if count > 0 and not tracemalloc.is_tracing():
+                tracemalloc.start(self.trace_frames)
+                self._memory_snapshot = self._take_snapshot()
+                self._memory_index = 0
+            self._memory_remaining = max(self._memory_remaining, count)
+            self._update_active()
+
+    def request_scans(self, count):
+        """
+        Sonraki 'count' taramanın profillenmesini ve bellek izlemesini ister; asıl kurulum bir
+        sonraki scan() başında yapılır. Kilit almadığı için sinyal işleyicisinden çağrılabilir
+        (işleyici ana thread'de, kilidi tutan bir bölümün ortasında çalışabilir).
+        """
+        self._requested = max(self._requested, count)
+        self.active = True
+
+    def _arm_requested(self):
+        count, self._requested = self._requested, 0
+        self.profile_scans(count)
+        self.trace_memory(count)
+
+    def _update_active(self):
+        self.active = bool(self._profile_remaining or self._memory_remaining or self._requested)
+
+    # ---- Bölümler ----
+
+    def section(self, name):
+        """
+        Bir kod bölümünü (ör. "update_ui") profil açıksa cProfile altında çalıştırır.
+
+        Returns:
+            context manager
+        """
+        if not self._profile_remaining:
+            return _DISABLED
+        return self._profiled_section(name)
+
+    @contextlib.contextmanager
+    def _profiled_section(self, name):
+        with self._lock:
+            profile = self._profiles.get(name)
+            if profile is None:
+                profile = self._profiles[name] = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Bu thread'de başka bir profil aracı zaten etkin (Python 3.12+)
+            yield
+            return
+        try:
+            yield
+        finally:
+            profile.disable()
+
+    def scan(self):
+        """
+        Bir taramayı çevreler: profil açıksa "scan" bölümü olarak profiller, bittiğinde
+        kalan tarama sayılarını azaltır ve gerekirse sonuçları yazar.
+
+        Returns:
+            context manager
+        """
+        if not self.active:
+            return _DISABLED
+        if self._requested:
+            self._arm_requested()
+        return self._scan()
+
+    @contextlib.contextmanager
+    def _scan(self):
+        try:
+            with self.section("scan"):
+                yield
+        finally:
+            self._scan_finished()
+
+    def _scan_finished(self):
+        with self._lock:
+            if self._profile_remaining:
+                self._profile_remaining -= 1
+                if not self._profile_remaining:
+                    self._write_profile()
+            if self._memory_remaining:
+                self._memory_remaining -= 1
+                self._write_memory_diff()
+                if not self._memory_remaining:
+                    tracemalloc.stop()
+                    self._memory_snapshot = None
+            self._update_active()
+
+    def _write_profile(self):
+        profiles = list(self._profiles.items())
+        self._profiles = {}
+        if not profiles:
+            return
+        stats = pstats.Stats(profiles[0][1])
+        for _, profile in profiles[1:]:
+            stats.add(profile)
+        stats.dump_stats(self._path("profile", "pstats"))
+        summary = io.StringIO()
+        summary.write(f"Bölümler: {', '.join(name for name, _ in profiles)}\n\n")
+        stats.stream = summary
+        stats.sort_stats("cumulative").print_stats(self.top)
+        stats.sort_stats("tottime").print_stats(self.top)
+        with open(self._path("profile", "txt"), "w", encoding="utf-8") as output:
+            output.write(summary.getvalue())
+
+    @staticmethod
+    def _take_snapshot():
+        # Profil araçlarının kendi ayırmaları sonuçları kirletmesin
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, module.__file__) for module in (tracemalloc, cProfile, pstats)
+        ] + [tracemalloc.Filter(False, "<frozen importlib._bootstrap>")])
+
+    def _write_memory_diff(self):
+        snapshot = self._take_snapshot()
+        self._memory_index += 1
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"Tarama {self._memory_index}: izlenen bellek {current / 1024:.1f} KiB (tepe {peak / 1024:.1f} KiB)",
+                 "", f"Bir önceki taramaya göre en çok büyüyen {self.top} ayırma noktası:"]
+        lines.extend(str(stat) for stat in snapshot.compare_to(self._memory_snapshot, "lineno")[:self.top])
+        lines.extend(["", f"Toplam boyuta göre en büyük {self.top} ayırma noktası:"])
+        lines.extend(str(stat) for stat in snapshot.statistics("lineno")[:self.top])
+        self._memory_snapshot = snapshot
+        with open(self._path(f"memory-scan{self._memory_index}", "txt"), "w", encoding="utf-8") as output:
+            output.write("\n".join(lines) + "\n")
+
+    # ---- Yığın dökümü ----
+
+    def dump_stacks(self):
+        """
+        Tüm thread'lerin anlık yığınını dosyaya yazar.
+
+        Returns:
+            str: Dosya yolu
+        """
+        names = _thread_names()
+        path = self._path("stacks", "txt")
+        with open(path, "w", encoding="utf-8") as output:
+            for ident, frame in sys._current_frames().items():
+                output.write(f"--- Thread {names.get(ident, ident)} ---\n")
+                output.write("".join(traceback.format_stack(frame)))
+                output.write("\n")
+        return path
+
+    def sample_stacks(self, duration=5.0, interval=0.01):
+        """
+        Arka planda 'duration' saniye boyunca tüm thread'lerin yığınını örnekler ve katlanmış
+        yığın sayılarını yazar (flamegraph.pl / speedscope ile açılabilir). Örnekleme zaten
+        sürüyorsa yeni örnekleme başlatılmaz.
+        """
+        if self._sampling:
+            return
+        self._sampling = True
+
+        def sample():
+            counts = Counter()
+            own = threading.get_ident()
+            deadline = time.monotonic() + duration
+            try:
+                while time.monotonic() < deadline:
+                    names = _thread_names()
+                    for ident, frame in sys._current_frames().items():
+                        if ident != own:
+                            counts[f"{names.get(ident, ident)};{collapse_stack(frame)}"] += 1
+                    time.sleep(interval)
+                with open(self._path("samples", "folded"), "w", encoding="utf-8") as output:
+                    for stack, count in counts.most_common():
+                        output.write(f"{stack} {count}\n")
+            finally:
+                self._sampling = False
+
+        threading.Thread(target=sample, name="stack-sampler", daemon=True).start()
+
+    def install_signal_handlers(self, scans=3):
+        """
+        SIGUSR1: yığın dökümü ve örnekleme; SIGUSR2: sonraki 'scans' taramayı profille
+        (yalnızca POSIX, ana thread'den çağrılmalı). SIGUSR2 işleyicisi kilit almaz, yalnızca
+        istek bırakır; profil bir sonraki taramada kurulur.
+
+        Returns:
+            bool: İşleyiciler kurulduysa True
+        """
+        if not hasattr(signal, "SIGUSR1") or threading.current_thread() is not threading.main_thread():
+            return False
+
+        def on_dump(signum, frame):
+            self.dump_stacks()
+            self.sample_stacks()
+
+        def on_profile(signum, frame):
+            self.request_scans(scans)
+
+        signal.signal(signal.SIGUSR1, on_dump)
+        signal.signal(signal.SIGUSR2, on_profile)
+        return True
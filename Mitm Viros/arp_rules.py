@@ -0,0 +1,749 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Kural Motoru
+Tespit mantığı, ihtiyaç duydukları olaylara kayıt olan kurallara bölünür:
+
+- filter:   Dizinlemeden önce tam ARP tablosu; filtreler güvenli sayılan kayıtları (multicast,
+            broadcast, özel IP, router adresleri) işaretler ve dizinlerin dışında bırakır
+- snapshot: Tek geçişte dizinlenmiş tam ARP tablosu (macs, mac_to_ips, ip_to_macs, sketch)
+- delta:    Ardışık iki tablo arasındaki eklenen/silinen/değişen bağlamalar
+- packet:   Kablodan çözülen tek bir ARP paketi (arp_capture.decode_arp)
+
+Kurallar bir kez olay -> (işleyici, istatistik, örnekleme oranı) dağıtım tablosuna derlenir;
+dağıtım sırasında arama veya getattr yapılmaz. Her kuralın çağrı sayısı, ürettiği bulgu sayısı
+(isabet) ve harcadığı CPU süresi (thread_time) tutulur. Ölçülen maliyete göre pahalı kurallar
+kapatılabilir veya örneklenebilir (enforce_budget); kritik kurallar (ör. ağ geçidi) hiçbir
+zaman örneklenmez.
+
+Kullanım:
+    python arp_spoofing_detector.py --disable-rule special_addresses --rule-stats
+    python arp_spoofing_detector.py --disable-rule router_ip     # .1/.254 adreslerini de kontrol et
+    python arp_rules.py --benchmark 20000
+"""
+
+import argparse
+import random
+import time
+
+from arp_alerts import finding_rank, SEVERITY_RANK
+
+EVENT_FILTER = "filter"
+EVENT_SNAPSHOT = "snapshot"
+EVENT_DELTA = "delta"
+EVENT_PACKET = "packet"
+EVENTS = (EVENT_FILTER, EVENT_SNAPSHOT, EVENT_DELTA, EVENT_PACKET)
+
+# Filtre kurallarının kayıtlara koyduğu işaretler (snapshot["flags"], kayıt başına bir bayt)
+FILTER_SAFE_MAC = 0x01  # Kayıt hiçbir dizine girmez ve kira kontrolünden geçmez
+FILTER_SAFE_IP = 0x02  # Kayıt sezgisel kontrollere (MAC -> IP'ler) ve kira kontrolüne girmez
+FILTER_ROUTER = 0x04  # MAC başına çok IP kontrolüne girmez (router birden fazla IP'ye sahip olabilir)
+
+# Güvenli MAC adresleri ve önekleri
+SAFE_MAC_PREFIXES = (
+    "01:", "03:", "05:", "07:", "09:", "0b:", "0d:", "0f:",  # Multicast
+    "33:33",  # IPv6 multicast
+    "01:00:5e",  # IPv4 multicast
+    "00:00:00",  # Geçersiz veya çözümlenmemiş
+)
+SAFE_MAC_ADDRESSES = frozenset((
+    "ff:ff:ff:ff:ff:ff",  # Broadcast
+))
+
+# Standart protokoller için ayrılmış MAC önekleri
+RESERVED_MAC_PREFIXES = ("01:00:",)
+
+# Özel ağlarda (192.168/16) güvenli sayılan broadcast/multicast MAC önekleri
+PRIVATE_NETWORK_PREFIXES = ("192.168.",)
+PRIVATE_MULTICAST_MAC_PREFIXES = ("ff:ff:ff", "01:00:5e")
+
+# Güvenli IP adres aralıkları
+SAFE_IP_PREFIXES = (
+    "224.0.0.",  # Local Network Control Block
+    "239.255.255.",  # Local Scope
+    "127.",  # Loopback
+    "255.255.255.",  # Broadcast
+    "169.254.",  # Link-local
+    "0.0.0.",  # Geçersiz
+)
+
+# Router/gateway olabilecek adresler: MAC başına çok IP kontrolüne girmez
+ROUTER_IP_SUFFIXES = (".1", ".254")
+
+# İzin verilen maksimum IP sayısı - bu sayıya kadar yalnızca bilgi verilir
+MAX_ALLOWED_IPS = 3
+
+# Sınırlı bellek modunda bu sayıdan fazla farklı MAC görülürse MAC/ARP flood olarak raporlanır
+MAC_FLOOD_THRESHOLD = 1024
+
+# Tehdit sayılmayan (bilgi amaçlı) bulgu türleri
+INFO_TYPES = frozenset((
+    "info_broadcast", "info_multicast", "info_special_ip",
+    "info_other", "info_broadcast_multicast",
+    "broadcast_mac", "multicast_mac",
+))
+
+
+def is_threat(finding):
+    """
+    Bulgu gerçek bir tehdit mi? Bilgi türleri ve önek olarak ⚠️/❌ taşımayan bulgular değildir.
+
+    Returns:
+        bool: Şüpheli veya tehlike seviyesindeyse True
+    """
+    finding_type = finding.get("type", "")
+    if finding_type.startswith("info_") or finding_type in INFO_TYPES:
+        return False
+    return finding_rank(finding) >= SEVERITY_RANK["warning"]
+
+
+class Rule:
+    """
+    Kural temel sınıfı. Alt sınıflar 'events' içinde listeledikleri her olay için
+    on_<olay>(payload, context) yöntemini tanımlar ve bulgu listesi (veya None) döndürür.
+    Filtre kuralları bulgu yerine işaretledikleri kayıt sayısını döndürür.
+    """
+
+    name = None
+    events = ()
+    critical = False  # True ise bütçe aşımında örneklenmez
+
+    def on_filter(self, snapshot, context):
+        return None
+
+    def on_snapshot(self, snapshot, context):
+        return None
+
+    def on_delta(self, delta, context):
+        return None
+
+    def on_packet(self, packet, context):
+        return None
+
+
+class RuleStats:
+    """Bir kuralın maliyet ve isabet sayaçları."""
+
+    __slots__ = ("name", "calls", "skipped", "hits", "cpu_ns")
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.skipped = 0  # Örnekleme nedeniyle atlanan çağrılar
+        self.hits = 0
+        self.cpu_ns = 0
+
+    @property
+    def mean_us(self):
+        """Çağrı başına ortalama CPU süresi (mikrosaniye)."""
+        return self.cpu_ns / self.calls / 1000 if self.calls else 0.0
+
+
+class RuleEngine:
+    """
+    Kuralları olay türüne göre derleyip çalıştıran, maliyetlerini ölçen motor.
+    """
+
+    def __init__(self, rules=(), budget_us=None, rng=random.random, cpu_clock=time.thread_time_ns):
+        """
+        Args:
+            rules (iterable): Başlangıçta kaydedilecek kurallar (sırası bulgu sırasını belirler)
+            budget_us (float): Kural çağrısı başına CPU bütçesi; enforce_budget() varsayılanı
+            rng (callable): Örnekleme için [0, 1) rastgele sayı üreteci
+            cpu_clock (callable): Nanosaniye cinsinden CPU zamanı kaynağı
+        """
+        self.budget_us = budget_us
+        self.rng = rng
+        self.cpu_clock = cpu_clock
+        self.generation = 0  # Kural kümesi/ayarları her değiştiğinde artar (önbellek anahtarı)
+        self._rules = {}  # ad -> [kural, etkin, örnekleme oranı, istatistik]
+        self._dispatch = None
+        self._previous_bindings = None
+        for rule in rules:
+            self.register(rule)
+
+    # ---- Kayıt ve ayarlar ----
+
+    def register(self, rule, sample_rate=1.0, enabled=True):
+        """
+        Kural ekler (aynı adlı kural varsa yerine geçer).
+
+        Returns:
+            Rule: Eklenen kural
+        """
+        unknown = set(rule.events) - set(EVENTS)
+        if not rule.name or unknown:
+            raise ValueError(f"Geçersiz kural: {rule.name!r} (bilinmeyen olaylar: {sorted(unknown)})")
+        self._rules[rule.name] = [rule, enabled, sample_rate, RuleStats(rule.name)]
+        self._invalidate()
+        return rule
+
+    def _entry(self, name):
+        try:
+            return self._rules[name]
+        except KeyError:
+            raise KeyError(f"Bilinmeyen kural: {name} (mevcut: {', '.join(self._rules)})") from None
+
+    def disable(self, name):
+        """Kuralı kapatır."""
+        self._entry(name)[1] = False
+        self._invalidate()
+
+    def enable(self, name):
+        """Kuralı açar."""
+        self._entry(name)[1] = True
+        self._invalidate()
+
+    def set_sample_rate(self, name, rate):
+        """Kuralın çalıştırılma olasılığını ayarlar (1.0: her olayda)."""
+        if not 0.0 < rate <= 1.0:
+            raise ValueError(f"Örnekleme oranı (0, 1] aralığında olmalı: {rate}")
+        self._entry(name)[2] = rate
+        self._invalidate()
+
+    def _invalidate(self):
+        self._dispatch = None
+        self.generation += 1
+
+    def compile(self):
+        """
+        Etkin kuralları olay -> ((işleyici, istatistik, oran), ...) tablosuna derler.
+
+        Returns:
+            dict: Dağıtım tablosu
+        """
+        dispatch = {event: [] for event in EVENTS}
+        for rule, enabled, rate, stats in self._rules.values():
+            if not enabled:
+                continue
+            for event in rule.events:
+                dispatch[event].append((getattr(rule, "on_" + event), stats, rate))
+        self._dispatch = {event: tuple(handlers) for event, handlers in dispatch.items()}
+        return self._dispatch
+
+    def is_sampling(self, events=(EVENT_FILTER, EVENT_SNAPSHOT)):
+        """
+        Bu olayların sonucu rastgele örneklemeye bağlı mı? Oranı 1'in altında etkin bir kural
+        varsa veya bütçe (oranları çalışırken düşürebilir) ayarlıysa aynı tablo farklı bulgular
+        verebilir; sonuçlar önbelleğe alınmamalıdır.
+
+        Returns:
+            bool: Sonuçlar örneklemeye bağlıysa True
+        """
+        if self.budget_us is not None:
+            return True
+        dispatch = self._dispatch or self.compile()
+        return any(rate < 1.0 for event in events for _, _, rate in dispatch[event])
+
+    def wants(self, event):
+        """Bu olay için etkin kural var mı? (Olay üretmek pahalıysa önce sorulur.)"""
+        return bool((self._dispatch or self.compile())[event])
+
+    # ---- Çalıştırma ----
+
+    def dispatch(self, event, payload, context=None):
+        """
+        Olayı kayıtlı kurallara iletir.
+
+        Returns:
+            list: Kuralların ürettiği bulgular (kayıt sırasıyla)
+        """
+        handlers = (self._dispatch or self.compile())[event]
+        findings = []
+        rng = self.rng
+        cpu_clock = self.cpu_clock
+        for handler, stats, rate in handlers:
+            if rate < 1.0 and rng() >= rate:
+                stats.skipped += 1
+                continue
+            started = cpu_clock()
+            result = handler(payload, context)
+            stats.cpu_ns += cpu_clock() - started
+            stats.calls += 1
+            if not result:
+                continue
+            if isinstance(result, int):  # Filtre: işaretlenen kayıt sayısı
+                stats.hits += result
+            else:
+                stats.hits += len(result)
+                findings.extend(result)
+        return findings
+
+    def observe_table(self, arp_table, context=None):
+        """
+        Canlı taramadan gelen tabloyu bir öncekiyle karşılaştırır ve farkı delta kurallarına
+        iletir. Delta kuralı yoksa fark hiç hesaplanmaz.
+
+        Returns:
+            list: Delta kurallarının bulguları
+        """
+        if not self.wants(EVENT_DELTA):
+            self._previous_bindings = None
+            return []
+        current = {}
+        for entry in arp_table:
+            current.setdefault(entry["ip"], set()).add(entry["mac"].lower())
+        previous, self._previous_bindings = self._previous_bindings, current
+        if previous is None:
+            return []
+        delta = {
+            "added": [(ip, macs) for ip, macs in current.items() if ip not in previous],
+            "removed": [(ip, macs) for ip, macs in previous.items() if ip not in current],
+            "changed": [(ip, previous[ip], macs) for ip, macs in current.items()
+                        if ip in previous and previous[ip] != macs],
+        }
+        if not (delta["added"] or delta["removed"] or delta["changed"]):
+            return []
+        return self.dispatch(EVENT_DELTA, delta, context)
+
+    def bindings(self):
+        """
+        Bir sonraki taramanın karşılaştırılacağı bağlamalar (arp_state kontrol noktası için).
+        Dönen eşleme değiştirilmez; her tarama yeni bir eşleme atar.
+
+        Returns:
+            Mapping: IP -> MAC kümesi; henüz tarama yoksa None
+        """
+        return self._previous_bindings
+
+    def restore_bindings(self, bindings):
+        """Önceki çalışmadan kalan bağlamaları yükler; ilk tarama bunlarla karşılaştırılır."""
+        self._previous_bindings = bindings
+
+    # ---- Maliyet ----
+
+    def enforce_budget(self, budget_us=None, min_rate=0.01, min_calls=10):
+        """
+        Çağrı başına ortalama CPU süresi bütçeyi aşan kritik olmayan kuralları örneklemeye alır:
+        oran, beklenen maliyet bütçeye inecek şekilde düşürülür.
+
+        Args:
+            budget_us (float): Kural çağrısı başına izin verilen CPU süresi (mikrosaniye);
+                None ise motorun budget_us değeri kullanılır
+            min_rate (float): En düşük örnekleme oranı
+            min_calls (int): Karar için gereken en az ölçüm
+
+        Returns:
+            list: (kural adı, yeni oran) çiftleri
+        """
+        budget_us = self.budget_us if budget_us is None else budget_us
+        changes = []
+        for name, (rule, enabled, rate, stats) in self._rules.items():
+            if not enabled or rule.critical or stats.calls < min_calls:
+                continue
+            new_rate = max(min_rate, min(1.0, budget_us / stats.mean_us)) if stats.mean_us else 1.0
+            if new_rate < rate:
+                self._rules[name][2] = new_rate
+                changes.append((name, new_rate))
+        if changes:
+            self._invalidate()
+        return changes
+
+    def stats(self):
+        """
+        Kural başına sayaçlar, toplam CPU süresine göre azalan sırada.
+
+        Returns:
+            list: Sözlükler (name, enabled, sample_rate, calls, skipped, hits, cpu_ms, mean_us)
+        """
+        rows = [{
+            "name": name,
+            "enabled": enabled,
+            "sample_rate": rate,
+            "calls": stats.calls,
+            "skipped": stats.skipped,
+            "hits": stats.hits,
+            "cpu_ms": stats.cpu_ns / 1e6,
+            "mean_us": stats.mean_us,
+        } for name, (_, enabled, rate, stats) in self._rules.items()]
+        return sorted(rows, key=lambda row: row["cpu_ms"], reverse=True)
+
+    def format_stats(self):
+        """Maliyet tablosunu yazdırılabilir satırlar olarak döndürür."""
+        lines = [f"{'Kural':<22} {'Durum':<8} {'Oran':>5} {'Çağrı':>8} {'İsabet':>7} {'CPU ms':>9} {'µs/çağrı':>9}"]
+        for row in self.stats():
+            state = "açık" if row["enabled"] else "kapalı"
+            lines.append(f"{row['name']:<22} {state:<8} {row['sample_rate']:>5.2f} {row['calls']:>8} "
+                         f"{row['hits']:>7} {row['cpu_ms']:>9.2f} {row['mean_us']:>9.1f}")
+        return lines
+
+    def configure(self, disabled=(), sample_rates=(), budget_us=None):
+        """
+        Komut satırı ayarlarını uygular.
+
+        Args:
+            disabled (iterable): Kapatılacak kural adları
+            sample_rates (iterable): "ad=oran" biçiminde örnekleme ayarları
+            budget_us (float): Kural çağrısı başına CPU bütçesi (None: sınırsız)
+
+        Raises:
+            KeyError, ValueError: Bilinmeyen kural veya geçersiz oran
+        """
+        self.budget_us = budget_us
+        for name in disabled:
+            self.disable(name)
+        for setting in sample_rates:
+            name, _, rate = setting.partition("=")
+            self.set_sample_rate(name, float(rate))
+
+
+# ============= YERLEŞİK KURALLAR =============
+
+class FilterRule(Rule):
+    """
+    Dizinlemeden önce çalışan filtre. on_filter(), eşleşen kayıtların snapshot["flags"]
+    baytına 'flag' işaretini ekler ve eşleşme sayısını döndürür. snapshot["macs"], tablodaki
+    MAC'lerin normalize edilmiş (küçük harf, sıfır dolgulu) hallerini aynı sırada içerir.
+
+    Filtreler kritik sayılır: bütçe aşımında örneklenirlerse güvenli adresler bulgu üretirdi.
+    Yine de --disable-rule ile kapatılabilir, --rule-sample ile elle örneklenebilirler.
+    """
+
+    events = (EVENT_FILTER,)
+    critical = True
+    flag = 0
+
+    @staticmethod
+    def _mark(flags, indexes, flag):
+        count = 0
+        for index in indexes:
+            flags[index] |= flag
+            count += 1
+        return count
+
+
+class SafeMacFilter(FilterRule):
+    """Multicast, broadcast ve geçersiz MAC adresleri hiçbir dizine girmez."""
+
+    name = "safe_mac"
+    flag = FILTER_SAFE_MAC
+
+    def __init__(self, prefixes=SAFE_MAC_PREFIXES, addresses=SAFE_MAC_ADDRESSES):
+        self.prefixes = tuple(prefixes)
+        self.addresses = frozenset(addresses)
+
+    def on_filter(self, snapshot, context):
+        prefixes, addresses = self.prefixes, self.addresses
+        return self._mark(snapshot["flags"], (index for index, mac in enumerate(snapshot["macs"])
+                                              if mac in addresses or mac.startswith(prefixes)), self.flag)
+
+
+class ReservedMacFilter(FilterRule):
+    """Standart protokoller için ayrılmış MAC'ler (01:00:xx)."""
+
+    name = "reserved_mac"
+    flag = FILTER_SAFE_MAC
+
+    def __init__(self, prefixes=RESERVED_MAC_PREFIXES):
+        self.prefixes = tuple(prefixes)
+
+    def on_filter(self, snapshot, context):
+        prefixes = self.prefixes
+        return self._mark(snapshot["flags"], (index for index, mac in enumerate(snapshot["macs"])
+                                              if mac.startswith(prefixes)), self.flag)
+
+
+class PrivateMulticastFilter(FilterRule):
+    """Özel ağlardaki (192.168/16) broadcast ve IPv4 multicast MAC'li kayıtlar."""
+
+    name = "private_multicast"
+    flag = FILTER_SAFE_MAC
+
+    def __init__(self, ip_prefixes=PRIVATE_NETWORK_PREFIXES, mac_prefixes=PRIVATE_MULTICAST_MAC_PREFIXES):
+        self.ip_prefixes = tuple(ip_prefixes)
+        self.mac_prefixes = tuple(mac_prefixes)
+
+    def on_filter(self, snapshot, context):
+        ip_prefixes, mac_prefixes = self.ip_prefixes, self.mac_prefixes
+        pairs = enumerate(zip(snapshot["arp_table"], snapshot["macs"]))
+        return self._mark(snapshot["flags"], (index for index, (entry, mac) in pairs
+                                              if mac.startswith(mac_prefixes)
+                                              and entry["ip"].startswith(ip_prefixes)), self.flag)
+
+
+class SafeIpFilter(FilterRule):
+    """Loopback, link-local, broadcast ve yerel multicast IP'leri sezgisel kontrollere girmez."""
+
+    name = "safe_ip"
+    flag = FILTER_SAFE_IP
+
+    def __init__(self, prefixes=SAFE_IP_PREFIXES):
+        self.prefixes = tuple(prefixes)
+
+    def on_filter(self, snapshot, context):
+        prefixes = self.prefixes
+        return self._mark(snapshot["flags"], (index for index, entry in enumerate(snapshot["arp_table"])
+                                              if entry["ip"].startswith(prefixes)), self.flag)
+
+
+class RouterIpFilter(FilterRule):
+    """Router/ağ geçidi olabilecek adresler (.1/.254) MAC başına çok IP kontrolüne girmez."""
+
+    name = "router_ip"
+    flag = FILTER_ROUTER
+
+    def __init__(self, suffixes=ROUTER_IP_SUFFIXES):
+        self.suffixes = tuple(suffixes)
+
+    def on_filter(self, snapshot, context):
+        suffixes = self.suffixes
+        return self._mark(snapshot["flags"], (index for index, entry in enumerate(snapshot["arp_table"])
+                                              if entry["ip"].endswith(suffixes)), self.flag)
+
+
+class MultipleIpsRule(Rule):
+    """Bir MAC'in birden fazla IP'si: az sayıda ise bilgi (router olabilir), fazlaysa şüpheli."""
+
+    name = "mac_multiple_ips"
+    events = (EVENT_SNAPSHOT,)
+
+    def __init__(self, max_allowed_ips=MAX_ALLOWED_IPS):
+        self.max_allowed_ips = max_allowed_ips
+
+    def on_snapshot(self, snapshot, context):
+        findings = []
+        for mac, ips in snapshot["mac_to_ips"].items():
+            if len(ips) < 2:
+                continue
+            if len(ips) <= self.max_allowed_ips:
+                findings.append({
+                    "type": "info_other",  # Bilgi olarak işaretle, filtrele
+                    "mac": mac,
+                    "ips": ips,
+                    "message": f"📌 Bilgi: {mac} MAC adresine sahip {len(ips)} farklı IP var: {', '.join(ips)} - Router olabilir"
+                })
+            else:
+                findings.append({
+                    "type": "multiple_ips",
+                    "mac": mac,
+                    "ips": ips,
+                    "message": f"⚠️ Şüpheli: {mac} MAC adresine sahip {len(ips)} farklı IP adresi var: {', '.join(ips)}"
+                })
+        return findings
+
+
+class FloodSketchRule(Rule):
+    """Sınırlı bellek modunda en çok IP talep eden MAC'ler ve MAC/ARP flood."""
+
+    name = "mac_flood"
+    events = (EVENT_SNAPSHOT,)
+
+    def __init__(self, max_allowed_ips=MAX_ALLOWED_IPS, flood_threshold=MAC_FLOOD_THRESHOLD):
+        self.max_allowed_ips = max_allowed_ips
+        self.flood_threshold = flood_threshold
+
+    def on_snapshot(self, snapshot, context):
+        flood_sketch = snapshot["flood_sketch"]
+        if flood_sketch is None:
+            return None
+        findings = []
+        for mac, _, ip_count, sample_ips in flood_sketch.top_offenders(self.max_allowed_ips + 1):
+            findings.append({
+                "type": "multiple_ips",
+                "mac": mac,
+                "ips": sample_ips,
+                "ip_count": ip_count,
+                "message": f"⚠️ Şüpheli: {mac} MAC adresine sahip yaklaşık {ip_count} farklı IP adresi var (örnek: {', '.join(sample_ips)})"
+            })
+        mac_count = flood_sketch.distinct_macs.count()
+        if mac_count > self.flood_threshold:
+            findings.append({
+                "type": "mac_flood",
+                "mac_count": mac_count,
+                "ip_count": flood_sketch.distinct_ips.count(),
+                "message": f"⚠️ Şüpheli: Olası MAC/ARP flood - yaklaşık {mac_count} farklı MAC adresi görüldü"
+            })
+        return findings
+
+
+class DuplicateIpRule(Rule):
+    """Aynı IP için birden fazla MAC: ağ geçidi ve kritik hostlarda tehlike, diğerlerinde şüpheli."""
+
+    name = "duplicate_ip"
+    events = (EVENT_SNAPSHOT,)
+    critical = True
+
+    def on_snapshot(self, snapshot, context):
+        gateway = context["gateway"]
+        gateway_ip = gateway["ip"] if gateway["mac"] != "Bilinmiyor" else None
+        watched_ips = context.get("watched_ips") or ()
+        trusted_bindings = context.get("trusted_bindings") or {}
+        findings = []
+        ip_to_macs = snapshot["ip_to_macs"]
+        for ip, macs in ip_to_macs.items():
+            if len(macs) < 2:
+                continue
+            if ip in trusted_bindings and ip != gateway_ip:
+                continue  # Sapma temel çizgi bulgusu olarak raporlandı
+            macs = sorted(macs)
+            if ip == gateway_ip:
+                findings.append({
+                    "type": "gateway_multiple_macs",
+                    "ip": ip,
+                    "macs": macs,
+                    "message": f"❌ TEHLİKE: Ağ geçidi {ip} için birden fazla MAC adresi var!"
+                })
+            elif ip in watched_ips:
+                findings.append({
+                    "type": "duplicate_ip",
+                    "ip": ip,
+                    "macs": macs,
+                    "watched": True,
+                    "message": f"❌ TEHLİKE: Kritik host {ip} için {len(macs)} farklı MAC adresi var: {', '.join(macs)}"
+                })
+            else:
+                findings.append({
+                    "type": "duplicate_ip",
+                    "ip": ip,
+                    "macs": macs,
+                    "message": f"⚠️ Şüpheli: {ip} IP adresi için {len(macs)} farklı MAC adresi var: {', '.join(macs)}"
+                })
+        # Sınırlı bellek modunda dizine sığmayan gözlemler kontrol edilemedi
+        dropped = getattr(ip_to_macs, "dropped", 0)
+        if dropped:
+            findings.append({
+                "type": "info_duplicate_ip_capped",
+                "ip_count": len(ip_to_macs),
+                "message": f"📌 Bilgi: Sınırlı bellek modu: çift MAC kontrolü {len(ip_to_macs)} IP ile sınırlandı, "
+                           f"{dropped} kayıt kontrol edilemedi"
+            })
+        return findings
+
+
+class SpecialAddressRule(Rule):
+    """Broadcast/multicast MAC ve özel IP kayıtları için bilgi girdileri (saldırı değil)."""
+
+    name = "special_addresses"
+    events = (EVENT_SNAPSHOT,)
+
+    def on_snapshot(self, snapshot, context):
+        findings = []
+        for entry, mac in zip(snapshot["arp_table"], snapshot["macs"]):
+            ip = entry["ip"]
+            if mac in SAFE_MAC_ADDRESSES:
+                findings.append({
+                    "type": "info_broadcast",
+                    "ip": ip,
+                    "mac": mac,
+                    "message": f"📌 Bilgi: Broadcast MAC adresi: IP={ip}, MAC={mac}"
+                })
+            elif mac.startswith(SAFE_MAC_PREFIXES):
+                findings.append({
+                    "type": "info_multicast",
+                    "ip": ip,
+                    "mac": mac,
+                    "message": f"📌 Bilgi: Özel MAC adresi: IP={ip}, MAC={mac}"
+                })
+            elif ip.startswith(SAFE_IP_PREFIXES):
+                findings.append({
+                    "type": "info_special_ip",
+                    "ip": ip,
+                    "mac": mac,
+                    "message": f"📌 Bilgi: Özel IP adresi: IP={ip}, MAC={mac}"
+                })
+        return findings
+
+
+class BindingChangeRule(Rule):
+    """Ardışık taramalar arasında tek MAC'li bir IP'nin MAC'i değişti."""
+
+    name = "binding_change"
+    events = (EVENT_DELTA,)
+
+    def on_delta(self, delta, context):
+        gateway_ip = (context or {}).get("gateway", {}).get("ip")
+        findings = []
+        for ip, old_macs, new_macs in delta["changed"]:
+            if len(old_macs) != 1 or len(new_macs) != 1:
+                continue  # Çift MAC durumu duplicate_ip kuralının işi
+            old_mac, new_mac = next(iter(old_macs)), next(iter(new_macs))
+            prefix = "❌ TEHLİKE: Ağ geçidi" if ip == gateway_ip else "⚠️ Şüpheli:"
+            findings.append({
+                "type": "binding_changed",
+                "ip": ip,
+                "mac": new_mac,
+                "old_mac": old_mac,
+                "message": f"{prefix} {ip} MAC adresi taramalar arasında değişti: {old_mac} -> {new_mac}"
+            })
+        return findings
+
+
+class GatewayClaimRule(Rule):
+    """Kablodaki bir ARP paketi ağ geçidi IP'sini başka bir MAC ile iddia ediyor."""
+
+    name = "gateway_claim"
+    events = (EVENT_PACKET,)
+    critical = True
+
+    def on_packet(self, packet, context):
+        gateway_ip, gateway_mac = (context or {}).get("gateway") or (None, None)
+        if not gateway_mac or packet["sender_ip"] != gateway_ip or packet["sender_mac"] == gateway_mac:
+            return None
+        return [{
+            "type": "gateway_claim",
+            "ip": gateway_ip,
+            "mac": packet["sender_mac"],
+            "expected_mac": gateway_mac,
+            "message": f"❌ TEHLİKE: {packet['sender_mac']} ağ geçidi {gateway_ip} adresini iddia ediyor "
+                       f"(beklenen: {gateway_mac})"
+        }]
+
+
+def default_filters():
+    """Dizinlemeden önce güvenli kayıtları işaretleyen yerleşik filtreler."""
+    return [SafeMacFilter(), ReservedMacFilter(), PrivateMulticastFilter(), SafeIpFilter(),
+            RouterIpFilter()]
+
+
+def default_rules():
+    """
+    Tablo taraması için yerleşik kurallar: filtreler, snapshot kuralları (bulgu sırasıyla),
+    ardından delta.
+    """
+    return default_filters() + [MultipleIpsRule(), FloodSketchRule(), DuplicateIpRule(),
+                                SpecialAddressRule(), BindingChangeRule()]
+
+
+def packet_rules():
+    """Kablo izleyicisi için yerleşik paket kuralları."""
+    return [GatewayClaimRule()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kural motoru maliyet ölçümü")
+    parser.add_argument("--benchmark", type=int, default=20000, metavar="N",
+                        help="N kayıtlık sentetik tabloyla her kuralın maliyetini ölç")
+    parser.add_argument("--rounds", type=int, default=20, help="Tekrar sayısı")
+    parser.add_argument("--budget-us", type=float, default=None,
+                        help="Ölçümden sonra bu bütçeyi aşan kuralları örneklemeye al")
+    args = parser.parse_args(argv)
+
+    from arp_spoofing_detector import detect_arp_spoofing
+
+    gateway = {"ip": "10.0.0.1", "mac": "02:00:00:00:00:01"}
+    table = []
+    for index in range(args.benchmark):
+        # Her 50 hosttan biri çift MAC'li, her 10 MAC'ten biri birden fazla IP'li
+        ip = f"10.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}"
+        mac = "02:00:" + ":".join(f"{byte:02x}" for byte in (index // 10).to_bytes(4, "big"))
+        table.append({"ip": ip, "mac": mac, "interface": "eth0"})
+        if index % 50 == 0:
+            table.append({"ip": ip, "mac": "06:00:00:00:%02x:%02x" % ((index >> 8) & 255, index & 255),
+                          "interface": "eth0"})
+
+    engine = RuleEngine(default_rules())
+    for _ in range(args.rounds):
+        detect_arp_spoofing(table, gateway=gateway, engine=engine)
+        engine.observe_table(table, {"gateway": gateway})
+    for line in engine.format_stats():
+        print(line)
+    if args.budget_us is not None:
+        for name, rate in engine.enforce_budget(args.budget_us):
+            print(f"📌 {name}: örnekleme oranı {rate:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
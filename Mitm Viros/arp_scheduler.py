@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Katmanlı Tarama Zamanlayıcısı
+Her taramayı tam tablo taraması olarak yapmak yerine kayıtları öncelik katmanlarına ayırır:
+
+- Sıcak (hot): ağ geçidi ve kritik hostlar (DNS, dosya sunucuları) - yüksek sıklıkta
+- Ilık (warm): yakın zamanda değişen kayıtlar - orta sıklıkta
+- Tam (full): tüm tablo - seçilen uzun periyotta
+
+Sıcak ve ılık katmanların harcayabileceği CPU süresi dakika başına bir bütçe ile sınırlanır.
+
+Uyarlamalı modda tam tarama aralığı sabit değildir (AdaptiveInterval): tablo veya ağ geçidi
+değişiyorsa ya da yeni bir tehlike bulgusu ortaya çıktıysa kısalır, tablo aynı kaldıkça üstel
+olarak uzar. Süregelen bir bulgu aralığı tabanda tutmaz (bkz. new_findings).
+"""
+
+import threading
+import time
+from collections import deque
+
+TIER_HOT = "hot"
+TIER_WARM = "warm"
+TIER_FULL = "full"
+
+# Uyarlamalı aralığın son değişiklik nedeni
+REASON_START = "başlangıç"
+REASON_ALARM = "tehlike"
+REASON_CHURN = "değişim"
+REASON_STABLE = "durağan"
+REASON_CPU = "CPU bütçesi"
+
+
+def format_interval(seconds):
+    """Süreyi '45 sn', '12 dk', '3 sa 20 dk' biçiminde yazar."""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds} sn"
+    if seconds < 3600:
+        minutes, rest = divmod(seconds, 60)
+        return f"{minutes} dk {rest} sn" if rest else f"{minutes} dk"
+    hours, rest = divmod(seconds, 3600)
+    return f"{hours} sa {rest // 60} dk" if rest >= 60 else f"{hours} sa"
+
+
+def new_findings(findings, previous_keys, key):
+    """
+    Bir önceki taramada bulunmayan bulguları ayırır. Uyarlamalı aralık yalnızca bunlarla
+    tabana iner; her taramada tekrar görülen bir bulgu aralığı tabanda tutmaz.
+
+    Args:
+        findings (iterable): Bu taramanın bulguları
+        previous_keys (set): Önceki çağrının döndürdüğü anahtar kümesi (ilk taramada boş)
+        key (callable): Bulgudan karşılaştırma anahtarı üreten fonksiyon
+
+    Returns:
+        tuple: (yeni bulgular listesi, sonraki çağrıya verilecek anahtar kümesi)
+    """
+    current, fresh = set(), []
+    for finding in findings:
+        finding_key = key(finding)
+        current.add(finding_key)
+        if finding_key not in previous_keys:
+            fresh.append(finding)
+    return fresh, current
+
+
+class AdaptiveInterval:
+    """
+    Gözlenen değişim hızına göre tam tarama aralığını belirler.
+
+    - Tehdit (❌) bulgusu veya ağ geçidi değişikliği varsa aralık hemen tabana (floor) iner,
+    - Tablo değiştiyse aralık 'shrink' oranında kısalır (ilk değişiklikte bile hızlı tepki),
+    - Tablo aynı kaldıysa aralık 'backoff' oranında uzar (üstel geri çekilme).
+
+    Taramanın ölçülen CPU süresi (üstel ortalama) ile CPU bütçesi en kısa aralığı belirler:
+    bütçe %1 ve tarama 0,2 sn CPU ise aralık 20 sn'nin altına inmez. Bütçe tabandan önce
+    gelir, tavan (ceiling) ise her zaman uygulanır.
+    """
+
+    def __init__(self, floor=30.0, ceiling=86400.0, cpu_budget=0.01, backoff=2.0, shrink=8.0,
+                 initial=None, smoothing=0.3):
+        """
+        Args:
+            floor (float): En kısa aralık (saniye)
+            ceiling (float): En uzun aralık (saniye)
+            cpu_budget (float): Taramaların kullanabileceği bir çekirdek oranı (0.01: %1)
+            backoff (float): Değişiklik olmayan her taramadan sonra uzatma oranı
+            shrink (float): Tablo değişen her taramadan sonra kısaltma oranı
+            initial (float): Başlangıç aralığı (varsayılan: taban; ağ tanınana kadar sık bakılır)
+            smoothing (float): CPU ortalamasında son taramanın ağırlığı
+
+        Raises:
+            ValueError: Geçersiz sınırlar
+        """
+        if not 0 < floor <= ceiling:
+            raise ValueError(f"Aralık sınırları geçersiz: taban {floor}, tavan {ceiling}")
+        if not 0 < cpu_budget <= 1:
+            raise ValueError(f"CPU bütçesi (0, 1] aralığında olmalı: {cpu_budget}")
+        if backoff <= 1 or shrink <= 1:
+            raise ValueError(f"Çarpanlar 1'den büyük olmalı: {backoff}, {shrink}")
+        self.floor = floor
+        self.ceiling = ceiling
+        self.cpu_budget = cpu_budget
+        self.backoff = backoff
+        self.shrink = shrink
+        self.smoothing = smoothing
+        self.base = min(ceiling, max(floor, initial or floor))  # Bütçe uygulanmadan önceki aralık
+        self.scan_cpu = 0.0  # Tarama başına CPU süresi (saniye, üstel ortalama)
+        self.reason = REASON_START
+
+    @property
+    def interval(self):
+        """Etkin aralık (saniye): değişim politikası, CPU bütçesi ve sınırlar uygulanmış."""
+        return min(self.ceiling, max(self.floor, self.base, self.scan_cpu / self.cpu_budget))
+
+    def observe(self, changed, alarming=False, cpu_seconds=None):
+        """
+        Tamamlanan bir tam taramanın sonucunu bildirir.
+
+        Args:
+            changed (bool): Tablo önceki taramaya göre değişti mi
+            alarming (bool): Yeni bir tehlike bulgusu çıktı mı veya ağ geçidi değişti mi
+            cpu_seconds (float): Taramanın harcadığı CPU süresi (bilinmiyorsa None)
+
+        Returns:
+            float: Yeni etkin aralık (saniye)
+        """
+        if cpu_seconds is not None:
+            self.scan_cpu = (cpu_seconds if not self.scan_cpu else
+                             self.smoothing * cpu_seconds + (1 - self.smoothing) * self.scan_cpu)
+        if alarming:
+            self.base, self.reason = self.floor, REASON_ALARM
+        elif changed:
+            self.base, self.reason = max(self.floor, self.base / self.shrink), REASON_CHURN
+        else:
+            self.base, self.reason = min(self.ceiling, self.base * self.backoff), REASON_STABLE
+        if self.interval > self.base:
+            self.reason = REASON_CPU
+        return self.interval
+
+
+class TieredScanScheduler:
+    """
+    Katmanlara göre hangi kontrolün ne zaman yapılacağını belirler ve çalıştırır.
+
+    Sıcak ve ılık katmanlarda yalnızca ilgili IP'lerin komşu kaydı `lookup` ile okunur.
+    Tam katmanda `full_scan` çağrılır; bu fonksiyon tabloyu döndürürse bağlamalar hemen
+    güncellenir, None döndürürse (ör. GUI'de asenkron tarama) sonuç daha sonra
+    `update_bindings()` ile bildirilmelidir.
+
+    update_bindings() ve record_full_scan() başka bir thread'den (tarama thread'i) çağrılabilir;
+    bağlama ve katman durumu bir kilitle korunur. Okuma (lookup), tam tarama ve on_change
+    çağrıları kilit dışında yapılır.
+    """
+
+    def __init__(self, full_interval, lookup, full_scan, on_change=None,
+                 hot_interval=1.0, warm_interval=10.0, warm_ttl=300.0,
+                 cpu_budget_ms=500.0, clock=time.monotonic, cpu_clock=time.thread_time, adaptive=None):
+        """
+        Args:
+            full_interval (float): Tam tablo taramaları arası süre (saniye)
+            lookup (callable): IP -> MAC (veya None) okuma fonksiyonu
+            full_scan (callable): Tam taramayı başlatan fonksiyon
+            on_change (callable): (ip, eski_mac, yeni_mac, katman) ile çağrılır
+            hot_interval (float): Sıcak katman kontrol aralığı (saniye)
+            warm_interval (float): Ilık katman kontrol aralığı (saniye)
+            warm_ttl (float): Değişen bir kaydın ılık katmanda kalma süresi (saniye)
+            cpu_budget_ms (float): Sıcak/ılık katmanlar için dakika başına CPU bütçesi (ms)
+            adaptive (AdaptiveInterval): Verilirse tam tarama aralığı buna göre değişir
+                (full_interval yok sayılır; sonuçlar record_full_scan() ile bildirilir)
+        """
+        self.adaptive = adaptive
+        if adaptive is not None:
+            full_interval = adaptive.interval
+        self.intervals = {
+            TIER_HOT: hot_interval,
+            TIER_WARM: warm_interval,
+            TIER_FULL: full_interval,
+        }
+        self.lookup = lookup
+        self.full_scan = full_scan
+        self.on_change = on_change
+        self.warm_ttl = warm_ttl
+        self.cpu_budget = cpu_budget_ms / 1000.0
+        self.clock = clock
+        self.cpu_clock = cpu_clock
+
+        now = clock()
+        self.hot_hosts = []
+        self.warm_hosts = {}  # ip -> ılık katmandan çıkış zamanı
+        self.bindings = {}  # ip -> son bilinen MAC
+        # İlk tarama zaten yapılmış kabul edilir; tam katman bir periyot sonra çalışır
+        self.next_run = {TIER_HOT: now, TIER_WARM: now, TIER_FULL: now + full_interval}
+        self.runs = {TIER_HOT: 0, TIER_WARM: 0, TIER_FULL: 0}
+        self.skipped = {TIER_HOT: 0, TIER_WARM: 0, TIER_FULL: 0}
+        self._cpu_window = deque()  # (zaman, harcanan CPU saniyesi)
+        self._lock = threading.Lock()
+
+    def set_hot_hosts(self, ips):
+        """Sıcak katmandaki IP'leri (ağ geçidi, kritik hostlar) ayarlar."""
+        hosts = [ip for ip in dict.fromkeys(ips) if ip]
+        with self._lock:
+            self.hot_hosts = hosts
+
+    def update_bindings(self, arp_table, tier=TIER_FULL):
+        """
+        Tam tarama sonucunu bilinen bağlamalarla karşılaştırır.
+        Değişen kayıtlar ılık katmana alınır.
+
+        Args:
+            arp_table (list): ARP tablosu kayıtları; liste değilse (ör. asenkron taramanın
+                döndürdüğü değer) yok sayılır
+        """
+        if not isinstance(arp_table, list):
+            return
+        self._observe([(entry["ip"], entry["mac"].lower()) for entry in arp_table], tier)
+
+    def _observe(self, observations, tier):
+        changes = []
+        with self._lock:
+            for ip, mac in observations:
+                old_mac = self.bindings.get(ip)
+                self.bindings[ip] = mac
+                if old_mac is not None and old_mac != mac:
+                    self.warm_hosts[ip] = self.clock() + self.warm_ttl
+                    changes.append((ip, old_mac, mac))
+        if self.on_change:
+            for ip, old_mac, mac in changes:
+                self.on_change(ip, old_mac, mac, tier)
+
+    def record_full_scan(self, changed, alarming=False, cpu_seconds=None):
+        """
+        Tamamlanan tam taramayı uyarlamalı aralığa bildirir ve sonraki tam taramayı yeni
+        aralığa göre yeniden planlar (uyarlamalı mod kapalıysa bir şey yapmaz).
+
+        Returns:
+            float: Etkin tam tarama aralığı (saniye)
+        """
+        with self._lock:
+            if self.adaptive is not None:
+                interval = self.adaptive.observe(changed, alarming, cpu_seconds)
+                self.intervals[TIER_FULL] = interval
+                self.next_run[TIER_FULL] = self.clock() + interval
+            return self.intervals[TIER_FULL]
+
+    def effective_interval(self):
+        """Şu anki tam tarama aralığı (saniye)."""
+        return self.intervals[TIER_FULL]
+
+    def cpu_used(self):
+        """Son bir dakikada sıcak/ılık katmanlarda harcanan CPU süresini (saniye) döndürür."""
+        horizon = self.clock() - 60.0
+        while self._cpu_window and self._cpu_window[0][0] < horizon:
+            self._cpu_window.popleft()
+        return sum(cost for _, cost in self._cpu_window)
+
+    def _check_hosts(self, ips, tier):
+        observations = []
+        for ip in ips:
+            mac = self.lookup(ip)
+            if mac:
+                observations.append((ip, mac.lower()))
+        self._observe(observations, tier)
+
+    def run_pending(self):
+        """
+        Zamanı gelmiş katmanları öncelik sırasına göre çalıştırır.
+        CPU bütçesi aşılmışsa önce ılık, sonra sıcak katman ertelenir.
+
+        Returns:
+            list: Bu çağrıda çalıştırılan katmanlar
+        """
+        now = self.clock()
+        executed = []
+
+        # Süresi dolan ılık kayıtları çıkar
+        with self._lock:
+            for ip in [ip for ip, expires in self.warm_hosts.items() if expires <= now]:
+                del self.warm_hosts[ip]
+
+        for tier in (TIER_HOT, TIER_WARM, TIER_FULL):
+            with self._lock:
+                if now < self.next_run[tier]:
+                    continue
+                self.next_run[tier] = now + self.intervals[tier]
+                hosts = list(self.hot_hosts if tier == TIER_HOT else self.warm_hosts)
+
+            if tier == TIER_FULL:
+                self.runs[tier] += 1
+                executed.append(tier)
+                self.update_bindings(self.full_scan())
+                continue
+
+            if not hosts:
+                continue
+            if self.cpu_used() >= self.cpu_budget:
+                self.skipped[tier] += 1
+                continue
+
+            started = self.cpu_clock()
+            self._check_hosts(hosts, tier)
+            self._cpu_window.append((now, self.cpu_clock() - started))
+            self.runs[tier] += 1
+            executed.append(tier)
+
+        return executed
+
+    def seconds_until_next(self):
+        """Bir sonraki katmanın çalışmasına kalan süreyi (saniye) döndürür."""
+        return max(0.0, min(self.next_run.values()) - self.clock())
+
+    def seconds_until_full(self):
+        """Bir sonraki tam taramaya kalan süreyi (saniye) döndürür."""
+        return max(0.0, self.next_run[TIER_FULL] - self.clock())
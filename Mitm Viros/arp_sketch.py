@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Sınırlı Bellek (Sketch) Modülü
+MAC/ARP flood saldırılarında kayıt sayısı sınırsız büyüyebilir. Bu modül, MAC başına
+frekansları Count-Min Sketch ile, MAC başına farklı IP sayısını HyperLogLog ile tahmin eder
+ve en çok görülen MAC'leri (heavy hitter) sabit boyutlu bir tabloda tutar.
+Bellek kullanımı, görülen MAC/IP sayısından bağımsız olarak sabittir.
+"""
+
+import hashlib
+import math
+import struct
+
+
+# 64 bitlik hash değeri üret
+def _hash64(value):
+    """Verilen metnin 64 bitlik hash değerini döndürür."""
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    return struct.unpack("<Q", hashlib.blake2b(value, digest_size=8).digest())[0]
+
+
+class CountMinSketch:
+    """
+    Count-Min Sketch: anahtar başına frekansları sabit bellekle tahmin eder.
+    Tahmin hiçbir zaman gerçek değerin altında kalmaz (yalnızca fazla sayabilir).
+    """
+
+    def __init__(self, width=2048, depth=4):
+        self.width = width
+        self.depth = depth
+        self.rows = [[0] * width for _ in range(depth)]
+
+    def _indexes(self, key):
+        # Çift hash yöntemiyle her satır için ayrı indeks üret
+        h = _hash64(key)
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def add(self, key, count=1):
+        """
+        Anahtarın sayacını artırır.
+
+        Args:
+            key (str): Sayılacak anahtar (ör. MAC adresi)
+            count (int): Artış miktarı
+
+        Returns:
+            int: Anahtarın güncel frekans tahmini
+        """
+        estimate = None
+        for row, index in zip(self.rows, self._indexes(key)):
+            row[index] += count
+            if estimate is None or row[index] < estimate:
+                estimate = row[index]
+        return estimate
+
+    def estimate(self, key):
+        """Anahtarın frekans tahminini döndürür."""
+        return min(row[index] for row, index in zip(self.rows, self._indexes(key)))
+
+
+class HyperLogLog:
+    """
+    HyperLogLog: bir kümedeki farklı eleman sayısını sabit bellekle tahmin eder.
+    2^p kayıt (register) kullanır; standart hata yaklaşık 1.04 / sqrt(2^p) olur.
+    """
+
+    def __init__(self, p=10):
+        self.p = p
+        self.m = 1 << p
+        self.registers = bytearray(self.m)
+        self.alpha = 0.7213 / (1 + 1.079 / self.m)
+
+    def add(self, value):
+        """Kümeye bir eleman ekler."""
+        h = _hash64(value)
+        index = h >> (64 - self.p)
+        rest = (h << self.p) & 0xFFFFFFFFFFFFFFFF
+        # Baştaki sıfır sayısı + 1 (kalan bitlerin tamamı sıfırsa üst sınır)
+        rank = (64 - self.p + 1) if rest == 0 else (64 - rest.bit_length() + 1)
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self):
+        """Farklı eleman sayısının tahminini döndürür."""
+        total = 0.0
+        zeros = 0
+        for register in self.registers:
+            total += 2.0 ** -register
+            if register == 0:
+                zeros += 1
+        estimate = self.alpha * self.m * self.m / total
+        # Küçük kümeler için doğrusal sayım düzeltmesi
+        if estimate <= 2.5 * self.m and zeros:
+            estimate = self.m * math.log(self.m / zeros)
+        return int(round(estimate))
+
+
+class MacFloodSketch:
+    """
+    MAC -> IP gözlemlerini sınırlı bellekle özetler.
+
+    - Tüm MAC'lerin frekansları Count-Min Sketch ile tahmin edilir.
+    - Ağdaki toplam farklı MAC ve IP sayısı HyperLogLog ile tahmin edilir.
+    - En sık görülen `top_k` MAC, Space-Saving yöntemiyle takip edilir; bu MAC'lerin her biri
+      için farklı IP sayısı küçük bir HyperLogLog ile ve birkaç örnek IP ile saklanır.
+    """
+
+    def __init__(self, top_k=64, width=2048, depth=4, hll_precision=8, sample_size=5):
+        self.top_k = top_k
+        self.sample_size = sample_size
+        self.hll_precision = hll_precision
+        self.frequencies = CountMinSketch(width, depth)
+        self.distinct_macs = HyperLogLog()
+        self.distinct_ips = HyperLogLog()
+        # mac -> {"count": int, "ips": HyperLogLog, "sample": list}
+        self.heavy_hitters = {}
+        self.total = 0
+
+    def add(self, mac, ip):
+        """
+        Bir MAC/IP gözlemini ekler.
+
+        Args:
+            mac (str): MAC adresi
+            ip (str): IP adresi
+        """
+        self.total += 1
+        count = self.frequencies.add(mac)
+        self.distinct_macs.add(mac)
+        self.distinct_ips.add(ip)
+
+        tracked = self.heavy_hitters.get(mac)
+        if tracked is None:
+            if len(self.heavy_hitters) >= self.top_k:
+                # Tablo dolu: en az görülen MAC'ten daha sık değilse takip etme
+                weakest = min(self.heavy_hitters, key=lambda key: self.heavy_hitters[key]["count"])
+                if self.heavy_hitters[weakest]["count"] >= count:
+                    return
+                del self.heavy_hitters[weakest]
+            tracked = {"count": count, "ips": HyperLogLog(self.hll_precision), "sample": []}
+            self.heavy_hitters[mac] = tracked
+
+        tracked["count"] = count
+        tracked["ips"].add(ip)
+        if len(tracked["sample"]) < self.sample_size and ip not in tracked["sample"]:
+            tracked["sample"].append(ip)
+
+    def top_offenders(self, min_distinct_ips=2):
+        """
+        En fazla farklı IP ile görülen MAC'leri döndürür.
+
+        Args:
+            min_distinct_ips (int): Listeye alınacak en düşük farklı IP tahmini
+
+        Returns:
+            list: (mac, frekans tahmini, farklı IP tahmini, örnek IP'ler) demetleri,
+                  farklı IP tahminine göre azalan sırada
+        """
+        offenders = []
+        for mac, tracked in self.heavy_hitters.items():
+            # Tahmin, gözlem sayısını ve örnekteki IP sayısını aşmamalı / altında kalmamalı
+            distinct = min(tracked["ips"].count(), tracked["count"])
+            distinct = max(distinct, len(tracked["sample"]))
+            if distinct >= min_distinct_ips:
+                offenders.append((mac, tracked["count"], distinct, list(tracked["sample"])))
+        offenders.sort(key=lambda item: item[2], reverse=True)
+        return offenders
+
+
+class CappedSetIndex(dict):
+    """
+    Anahtar -> değer kümesi dizini (ör. IP -> MAC'ler), sınırlı boyutta.
+
+    En fazla `max_keys` anahtar ve anahtar başına `max_values` değer tutulur; sığmayan
+    gözlemler atılır ve `dropped` sayacında toplanır. `pinned` anahtarlar (ağ geçidi, kritik
+    hostlar) sınır dolsa da her zaman izlenir. Flood sırasında tam bir dizin yerine kullanılır.
+    """
+
+    def __init__(self, max_keys=16384, max_values=16, pinned=()):
+        super().__init__()
+        self.max_keys = max_keys
+        self.max_values = max_values
+        self.pinned = frozenset(pinned)
+        self.dropped = 0
+
+    def add(self, key, value):
+        """
+        Gözlemi ekler.
+
+        Returns:
+            bool: Eklendiyse (veya zaten varsa) True, sınır nedeniyle atıldıysa False
+        """
+        values = self.get(key)
+        if values is None:
+            if len(self) >= self.max_keys and key not in self.pinned:
+                self.dropped += 1
+                return False
+            values = self[key] = set()
+        if len(values) >= self.max_values and value not in values:
+            self.dropped += 1
+            return False
+        values.add(value)
+        return True
@@ -27,9 +27,53 @@ import io
 from contextlib import redirect_stdout
 import platform
 import tempfile
+import argparse
+import signal
+
+from arp_sketch import MacFloodSketch, CappedSetIndex
+from arp_watchdog import watchdog_main, read_default_gateway_ip, read_neighbor_mac
+from arp_command import stream_command, ScanCancelled, COMMAND_TIMEOUT
+from arp_cache import table_fingerprint, LRUCache
+from arp_scheduler import TieredScanScheduler, AdaptiveInterval, TIER_FULL, format_interval, new_findings
+from dhcp_snooping import (DhcpLeaseTable, DhcpSnooper, load_static_bindings, BINDING_LEASED, BINDING_STATIC,
+                           DEFAULT_LEARNING_PERIOD)
+from arp_events import writer_from_args, DEFAULT_SYSLOG_ADDRESS
+from arp_alerts import AlertManager, alert_fingerprint
+from arp_dashboard import DashboardServer
+from arp_oui import default_index, annotate_findings
+from arp_baseline import TrustedBaseline, mismatch_finding, canonical_mac
+from arp_profiling import ScanProfiler, DEFAULT_PROFILE_DIR
+from arp_state import StateCheckpoint, load_checkpoint, DEFAULT_STATE_INTERVAL
+from arp_rules import (RuleEngine, EVENT_FILTER, EVENT_SNAPSHOT, default_rules, is_threat,
+                       FILTER_SAFE_MAC, FILTER_SAFE_IP, FILTER_ROUTER, SAFE_MAC_PREFIXES,
+                       SAFE_MAC_ADDRESSES, SAFE_IP_PREFIXES, ROUTER_IP_SUFFIXES, MAC_FLOOD_THRESHOLD)
 
 # ============= ARP TESPİT MODÜLÜ =============
 
+# Bu sayıdan fazla kayıt içeren tablolar sınırlı bellek (sketch) modunda analiz edilir
+SKETCH_MODE_THRESHOLD = 4096
+
+# Sınırlı bellek modunda IP -> MAC'ler dizininin en fazla IP ve IP başına MAC sayısı
+BOUNDED_MAX_IPS = 16384
+BOUNDED_MAX_MACS_PER_IP = 16
+
+# arp komutu çıktısındaki geçerli MAC adresi (macOS baştaki sıfırları atar: 0:11:22:...)
+MAC_ADDRESS_PATTERN = re.compile(r"[0-9a-fA-F]{1,2}(?:[:-][0-9a-fA-F]{1,2}){5}")
+
+# Tanıtım modunda (--demo) arp komutu çalışmazsa gösterilen örnek tablo. Gerçek taramada
+# kullanılmaz: sahte bağlamalar delta kurallarına, zamanlayıcıya ve durum dosyasına girmemeli.
+DEMO_ARP_TABLE = (
+    {"ip": "192.168.1.1", "mac": "aa:bb:cc:dd:ee:ff", "interface": "eth0"},
+    {"ip": "192.168.1.2", "mac": "11:22:33:44:55:66", "interface": "eth0"},
+)
+demo_mode = False
+
+# Aynı tablo (parmak izi) için önceki analiz sonuçları
+_detection_cache = LRUCache(maxsize=8)
+
+# Tespit kuralları (arp_rules); --disable-rule / --rule-sample ile ayarlanır
+rule_engine = RuleEngine(default_rules())
+
 # MAC adreslerini düzgün formatta gösterme
 def format_mac(mac_bytes):
     """Binary MAC adresini okunabilir formata çevirir."""
@@ -45,47 +89,57 @@ def format_ip(ip_bytes):
     return ip_bytes
 
 # ARP tablosunu alma
-def get_arp_table():
+def get_arp_table(cancel_event=None, timeout=COMMAND_TIMEOUT):
     """
     Sistemin ARP tablosunu alır.
     
+    Komut çıktısı borudan satır satır okunup ayrıştırılır; komut `timeout` saniye içinde
+    bitmezse sonlandırılır. MAC sütunu geçerli bir adres olmayan satırlar (Linux'ta çözümlenmemiş
+    komşu: "IP (incomplete) eth0") atlanır.
+    
+    Args:
+        cancel_event (threading.Event): Ayarlandığında tarama iptal edilir
+        timeout (float): Komut için kesin zaman aşımı (saniye)
+    
     Returns:
-        list: ARP tablosundaki kayıtlar listesi
+        list: ARP tablosundaki kayıtlar listesi; komut çalışmaz, hata verir veya zaman aşımına
+              uğrarsa None (tanıtım modunda DEMO_ARP_TABLE)
+    
+    Raises:
+        ScanCancelled: Tarama iptal edildiğinde
     """
     arp_entries = []
     
     try:
         # Platforma göre uygun komutu belirle
         if os.name == 'nt':  # Windows
-            output = subprocess.check_output(['arp', '-a'], text=True)
             # Windows ARP çıktısını ayrıştır
             pattern = r'(\d+\.\d+\.\d+\.\d+)\s+([0-9a-f-]+)\s+(\w+)'
-            for line in output.split('\n'):
+            for line in stream_command(['arp', '-a'], timeout, cancel_event):
                 match = re.search(pattern, line)
                 if match:
                     ip, mac, interface_type = match.groups()
-                    mac = mac.replace('-', ':')  # Standart formata çevir
-                    arp_entries.append({"ip": ip, "mac": mac, "interface": interface_type})
+                    if MAC_ADDRESS_PATTERN.fullmatch(mac):
+                        mac = mac.replace('-', ':')  # Standart formata çevir
+                        arp_entries.append({"ip": ip, "mac": mac, "interface": interface_type})
         else:  # Linux/Unix
-            output = subprocess.check_output(['arp', '-n'], text=True)
-            # Linux ARP çıktısını ayrıştır
-            for line in output.split('\n')[1:]:  # Başlık satırını atla
+            # Linux ARP çıktısını ayrıştır (-n: ters DNS sorgusu yapma)
+            lines = stream_command(['arp', '-n'], timeout, cancel_event)
+            next(lines, None)  # Başlık satırını atla
+            for line in lines:
                 if line.strip():
                     parts = line.split()
                     if len(parts) >= 3:
                         ip = parts[0]
                         mac = parts[2]
                         interface = parts[-1] if len(parts) > 3 else "unknown"
-                        if mac != "(incomplete)":  # Eksik kayıtları atla
+                        if MAC_ADDRESS_PATTERN.fullmatch(mac):  # Eksik kayıtları atla
                             arp_entries.append({"ip": ip, "mac": mac, "interface": interface})
-    except Exception as e:
+    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, OSError) as e:
         print(f"ARP tablosu alınırken hata oluştu: {e}")
-        # Test verileri oluştur
-        test_entries = [
-            {"ip": "192.168.1.1", "mac": "aa:bb:cc:dd:ee:ff", "interface": "eth0"},
-            {"ip": "192.168.1.2", "mac": "11:22:33:44:55:66", "interface": "eth0"}
-        ]
-        return test_entries
+        if demo_mode:
+            return [dict(entry) for entry in DEMO_ARP_TABLE]
+        return None  # Tablo yok: çağıranlar önceki durumu korur
     
     return arp_entries
 
@@ -98,24 +152,20 @@ def get_default_gateway():
         dict: Ağ geçidi IP ve MAC adresi
     """
     try:
-        if os.name == 'nt':  # Windows
-            output = subprocess.check_output(['ipconfig'], text=True)
-            gateway_ip = None
+        # /proc/net/route, 'ip route', 'route print' veya 'netstat -rn' (bkz. arp_watchdog)
+        gateway_ip = read_default_gateway_ip()
+        if not gateway_ip and os.name == 'nt':  # Windows: yerelleştirilmiş ipconfig çıktısı
+            output = subprocess.check_output(['ipconfig'], text=True, timeout=COMMAND_TIMEOUT)
             for line in output.split('\n'):
                 if 'Default Gateway' in line or 'Varsayılan Ağ Geçidi' in line:
                     match = re.search(r':\s*(\d+\.\d+\.\d+\.\d+)', line)
                     if match:
                         gateway_ip = match.group(1)
                         break
-        else:  # Linux/Unix
-            output = subprocess.check_output(['ip', 'route'], text=True)
-            match = re.search(r'default via (\d+\.\d+\.\d+\.\d+)', output)
-            gateway_ip = match.group(1) if match else None
         
         # Gateway IP'yi bulduktan sonra ARP tablosundan MAC adresini alıyoruz
         if gateway_ip:
-            arp_table = get_arp_table()
-            for entry in arp_table:
+            for entry in get_arp_table() or []:
                 if entry["ip"] == gateway_ip:
                     return {"ip": gateway_ip, "mac": entry["mac"]}
         
@@ -127,187 +177,140 @@ def get_default_gateway():
         return {"ip": "Bilinmiyor", "mac": "Bilinmiyor"}
 
 # ARP spoofing tespiti
-def detect_arp_spoofing(arp_table):
+def detect_arp_spoofing(arp_table, bounded=None, gateway=None, lease_table=None, watched_ips=None,
+                        baseline=None, engine=None):
     """
     ARP tablosunu inceleyerek olası ARP spoofing saldırılarını tespit eder.
     
+    Önce filtre kuralları güvenli kayıtları (multicast/broadcast MAC, özel IP, router adresleri)
+    işaretler; ardından tablo tek geçişte dizinlenir (MAC -> IP'ler, IP -> MAC'ler) ve bulguları
+    bu dizinleri kullanan kurallar üretir (bkz. arp_rules). Filtreler de kural olduğu için
+    kapatılabilir, örneklenebilir ve maliyetleri ölçülür.
+    
     Args:
         arp_table (list): ARP tablosu kayıtları
+        bounded (bool): Sınırlı bellek (sketch) modunu zorla. None ise tablo boyutuna
+            göre (SKETCH_MODE_THRESHOLD) otomatik seçilir. Bu modda IP -> MAC'ler dizini de
+            sınırlıdır (BOUNDED_MAX_IPS); ağ geçidi ve kritik hostlar her zaman izlenir.
+        gateway (dict): Önceden bulunmuş ağ geçidi. None ise yeniden aranır.
+        lease_table (DhcpLeaseTable): DHCP snooping kira tablosu. Verilirse her bağlama
+            kira tablosuna göre doğrulanır; kiralı/statik bağlamalar sezgisel kontrollere girmez.
+        watched_ips (set): Kritik hostlar (DNS, dosya sunucusu vb.). Bu IP'lerde birden fazla
+            MAC görülmesi şüpheli değil tehlike olarak raporlanır.
+        baseline (TrustedBaseline): Güvenilir bağlamalar. Uyan kayıtlar sezgisel kontrollere
+            girmez, uymayanlar hemen tehlike olarak raporlanır.
+        engine (RuleEngine): Çalıştırılacak kurallar (varsayılan: modüldeki rule_engine)
         
     Returns:
         list: Tespit edilen şüpheli durumlar
     """
     suspicious_entries = []
     mac_to_ips = defaultdict(list)
+    # Tarama boyunca tutarlı kalması için temel çizgi dizinleri bir kez alınır
+    trusted_bindings, trusted_multi_ip_macs = baseline.snapshot() if baseline is not None else ({}, ())
+    if gateway is None:
+        gateway = get_default_gateway()
+    
+    # Flood sırasında MAC -> IP sözlüğü sınırsız büyümesin diye sketch kullan; sahte IP'lerle
+    # yapılan flood'da IP -> MAC'ler dizini de sınırsız büyümesin diye üst sınırlı tutulur
+    if bounded is None:
+        bounded = len(arp_table) > SKETCH_MODE_THRESHOLD
+    flood_sketch = MacFloodSketch() if bounded else None
+    if bounded:
+        ip_to_macs = CappedSetIndex(BOUNDED_MAX_IPS, BOUNDED_MAX_MACS_PER_IP,
+                                    pinned={gateway["ip"], *(watched_ips or ())})
+        index_binding = ip_to_macs.add
+    else:
+        ip_to_macs = defaultdict(set)  # Aynı geçişte doldurulur: her host için çift IP kontrolü
+        index_binding = lambda ip, mac: ip_to_macs[ip].add(mac)
     
-    # Güvenli MAC adresleri ve öneklerini tanımla
-    safe_mac_prefixes = [
-        "01:", "03:", "05:", "07:", "09:", "0b:", "0d:", "0f:",  # Multicast
-        "33:33",  # IPv6 multicast
-        "01:00:5e",  # IPv4 multicast
-        "00:00:00"  # Geçersiz veya çözümlenmemiş
-    ]
-    safe_mac_addresses = [
-        "ff:ff:ff:ff:ff:ff",  # Broadcast
-    ]
+    engine = engine or rule_engine
+    context = {
+        "gateway": gateway,
+        "watched_ips": watched_ips or (),
+        "trusted_bindings": trusted_bindings,
+    }
     
-    # Güvenli IP adres aralıkları
-    safe_ip_prefixes = [
-        "224.0.0.",  # Local Network Control Block
-        "239.255.255.",  # Local Scope
-        "127.",  # Loopback
-        "255.255.255.",  # Broadcast
-        "169.254.",  # Link-local
-        "0.0.0."  # Geçersiz
-    ]
+    # Küçük harf ve sıfır dolgulu MAC'ler (macOS 'arp -a' baştaki sıfırları atar: 0:11:22:...);
+    # filtreler her kayıt için bir bayta işaret koyar
+    macs = [canonical_mac(entry["mac"]) for entry in arp_table]
+    flags = bytearray(len(arp_table))
+    engine.dispatch(EVENT_FILTER, {"arp_table": arp_table, "macs": macs, "flags": flags}, context)
     
     # Her MAC adresine bağlı IP'leri topla (güvenli olmayanları)
-    for entry in arp_table:
-        mac = entry["mac"].lower()  # Büyük/küçük harf duyarlılığını kaldır
+    for entry, mac, flag in zip(arp_table, macs, flags):
         ip = entry["ip"]
         
-        # MAC adresi güvenli mi kontrol et
-        safe_mac = False
-        for prefix in safe_mac_prefixes:
-            if mac.startswith(prefix):
-                safe_mac = True
-                break
-        
-        if mac in safe_mac_addresses:
-            safe_mac = True
-            
-        # IP adresi güvenli mi kontrol et
-        safe_ip = False
-        for prefix in safe_ip_prefixes:
-            if ip.startswith(prefix):
-                safe_ip = True
-                break
-                
-        # Özel IP adresleri için ek kontroller - genellikle güvenli
-        if ip.startswith("192.168.") and mac.startswith(("ff:ff:ff", "01:00:5e")):
-            safe_mac = True
-            
-        # Özel durum: Bazı standard network cihazları için güvenlik
-        if ":" in mac or "-" in mac:  # MAC adresi doğru formatta ise
-            parts = mac.replace("-", ":").split(":")
-            if len(parts) == 6 and parts[0] == "01" and parts[1] == "00":
-                safe_mac = True  # Standard protokoller için ayrılmış MAC'ler
-        
-        # Router/gateway için özel kontrol - birden fazla IP'si olabilir
-        if ip.endswith(".1") or ip.endswith(".254"):  # Gateway IP'leri genellikle
-            # Bu bir router olabilir, dikkatli değerlendir
-            # Router'lar normal şartlarda birden fazla IP'ye sahip olabilir
+        # Hızlı yol: temel çizgideki bağlamalar O(1) aramayla doğrulanır
+        expected_mac = trusted_bindings.get(ip)
+        if expected_mac == mac or (expected_mac is None and mac in trusted_multi_ip_macs):
+            index_binding(ip, mac)
+            continue
+        if expected_mac is not None:
+            suspicious_entries.append(mismatch_finding(ip, mac, expected_mac))
+        
+        # Filtrelerin güvenli saydığı MAC'ler hiçbir dizine, IP'ler sezgisel kontrollere girmez
+        safe_mac = flag & FILTER_SAFE_MAC
+        safe_ip = flag & FILTER_SAFE_IP
+        
+        # IP -> MAC dizini router'lar dahil tüm hostları kapsar (aşağıdaki atlamalardan önce)
+        if not safe_mac:
+            index_binding(ip, mac)
+        
+        # DHCP kira tablosu varsa bağlamayı doğrudan doğrula (O(1) arama)
+        if lease_table is not None and not safe_mac and not safe_ip:
+            lease_finding = lease_table.check_binding(ip, mac)
+            if lease_finding is not None:
+                suspicious_entries.append(lease_finding)
+            elif lease_table.validate(ip, mac) in (BINDING_LEASED, BINDING_STATIC):
+                continue  # Kiralı veya statik bağlama: sezgisel kontrollere gerek yok
+        
+        # Router/gateway olabilecek adresler birden fazla IP'ye sahip olabilir
+        if flag & FILTER_ROUTER:
             continue
             
         # Sadece şüpheli olabilecek girdileri ekle (safe_mac veya safe_ip değilse)
         if not safe_mac and not safe_ip:
-            mac_to_ips[mac].append(ip)
-    
-    # İzin verilen maksimum IP sayısı - router'lar için daha yüksek
-    max_allowed_ips = 3  # En fazla 3 IP normal kabul edilsin
-    
-    # Bir MAC'in birden fazla IP'si varsa (şüpheli bir durum olabilir)
-    for mac, ips in mac_to_ips.items():
-        if len(ips) > 1:
-            # Az sayıda IP sadece bilgi olarak göster
-            if len(ips) <= max_allowed_ips:
-                suspicious_entries.append({
-                    "type": "info_other",  # Bilgi olarak işaretle, filtrele
-                    "mac": mac,
-                    "ips": ips,
-                    "message": f"📌 Bilgi: {mac} MAC adresine sahip {len(ips)} farklı IP var: {', '.join(ips)} - Router olabilir"
-                })
+            if flood_sketch is not None:
+                flood_sketch.add(mac, ip)
             else:
-                # Çok sayıda IP gerçekten şüpheli
-                suspicious_entries.append({
-                    "type": "multiple_ips",
-                    "mac": mac,
-                    "ips": ips,
-                    "message": f"⚠️ Şüpheli: {mac} MAC adresine sahip {len(ips)} farklı IP adresi var: {', '.join(ips)}"
-                })
-    
-    # Ağ geçidinin MAC adresi değişmiş mi kontrol et
-    gateway = get_default_gateway()
-    if gateway["ip"] != "Bilinmiyor" and gateway["mac"] != "Bilinmiyor":
-        gateway_entries = [entry for entry in arp_table if entry["ip"] == gateway["ip"]]
-        if len(gateway_entries) > 0:
-            if len(gateway_entries) > 1:
-                # Aynı IP'ye sahip birden fazla MAC sadece farklı MAC'ler güvenli olmayan MAC'ler değilse
-                unsafe_gateway_macs = []
-                for entry in gateway_entries:
-                    mac = entry["mac"].lower()
-                    
-                    # MAC adresi güvenli mi kontrol et
-                    safe_mac = False
-                    for prefix in safe_mac_prefixes:
-                        if mac.startswith(prefix):
-                            safe_mac = True
-                            break
-                    
-                    if mac in safe_mac_addresses:
-                        safe_mac = True
-                        
-                    if not safe_mac:
-                        unsafe_gateway_macs.append(mac)
-                
-                # Sadece güvenli olmayan MAC'ler varsa uyarı göster
-                if len(unsafe_gateway_macs) > 1:
-                    suspicious_entries.append({
-                        "type": "gateway_multiple_macs",
-                        "ip": gateway["ip"],
-                        "macs": unsafe_gateway_macs,
-                        "message": f"❌ TEHLİKE: Ağ geçidi {gateway['ip']} için birden fazla MAC adresi var!"
-                    })
-    
-    # Bilgi amaçlı özel MAC adreslerini ekle (saldırı değil)
-    info_entries = []
-    for entry in arp_table:
-        mac = entry["mac"].lower()
-        ip = entry["ip"]
-        
-        # Broadcast MAC (ff:ff:ff:ff:ff:ff)
-        if mac == "ff:ff:ff:ff:ff:ff":
-            info_entries.append({
-                "type": "info_broadcast",
-                "ip": ip,
-                "mac": mac,
-                "message": f"📌 Bilgi: Broadcast MAC adresi: IP={ip}, MAC={mac}"
-            })
-        # Multicast MAC
-        elif any(mac.startswith(prefix) for prefix in safe_mac_prefixes):
-            info_entries.append({
-                "type": "info_multicast",
-                "ip": ip,
-                "mac": mac,
-                "message": f"📌 Bilgi: Özel MAC adresi: IP={ip}, MAC={mac}"
-            })
-        # Özel IP adresleri
-        elif any(ip.startswith(prefix) for prefix in safe_ip_prefixes):
-            info_entries.append({
-                "type": "info_special_ip",
-                "ip": ip,
-                "mac": mac,
-                "message": f"📌 Bilgi: Özel IP adresi: IP={ip}, MAC={mac}"
-            })
-    
-    # Bilgi amaçlı girdileri listeye ekle (şüpheli durumlar listesinin sonuna)
-    for entry in info_entries:
-        suspicious_entries.append(entry)
+                mac_to_ips[mac].append(ip)
     
+    snapshot = {
+        "arp_table": arp_table,
+        "macs": macs,
+        "mac_to_ips": mac_to_ips,
+        "ip_to_macs": ip_to_macs,
+        "flood_sketch": flood_sketch,
+    }
+    suspicious_entries.extend(engine.dispatch(EVENT_SNAPSHOT, snapshot, context))
     return suspicious_entries
 
 # Ana ARP tarama fonksiyonu
-def arp_kontrol_et():
+def arp_kontrol_et(cancel_event=None, lease_table=None, event_writer=None, watched_ips=None,
+                   baseline=None, findings=None):
     """
     ARP tablosunu kontrol ederek olası ARP spoofing saldırılarını tespit eder.
     Bu fonksiyon GUI tarafından çağrılır.
+    
+    Args:
+        cancel_event (threading.Event): Ayarlandığında tarama iptal edilir
+        lease_table (DhcpLeaseTable): DHCP snooping kira tablosu (isteğe bağlı)
+        event_writer (EventWriter): Bulguları JSON Lines/syslog olarak yazan yazıcı (isteğe bağlı)
+        watched_ips (list): Çift MAC'i tehlike sayılacak kritik hostlar (isteğe bağlı)
+        baseline (TrustedBaseline): Güvenilir bağlama dosyası; değiştiyse bu taramada yeniden yüklenir
+        findings (list): Verilirse bu taramanın bulguları listeye eklenir (çıktı metnini
+            ayrıştırmadan uyarlamalı aralık kararı için)
+    
+    Returns:
+        list: Taranan ARP tablosu kayıtları (tablo alınamazsa None)
     """
     print("=" * 60)
     print("🔍 ARP Tablosu Taraması Başlatılıyor...")
     print("=" * 60)
     
     # ARP tablosunu al
-    arp_table = get_arp_table()
+    arp_table = get_arp_table(cancel_event)
     
     if not arp_table:
         print("❌ ARP tablosu alınamadı veya boş.")
@@ -322,20 +325,68 @@ def arp_kontrol_et():
     # ARP tablosunu göster
     print("\n📋 ARP Tablosu:")
     print("-" * 60)
-    print(f"{'IP Adresi':<15} {'MAC Adresi':<20} {'Arayüz':<10}")
+    # Derlenmiş OUI indeksi (oui.bin) varsa üretici sütunu da gösterilir
+    oui_index = default_index()
+    if oui_index is not None:
+        print(f"{'IP Adresi':<15} {'MAC Adresi':<20} {'Arayüz':<10} {'Üretici'}")
+    else:
+        print(f"{'IP Adresi':<15} {'MAC Adresi':<20} {'Arayüz':<10}")
     print("-" * 60)
     for entry in arp_table:
-        print(f"{entry['ip']:<15} {entry['mac']:<20} {entry['interface']:<10}")
+        if oui_index is not None:
+            vendor = oui_index.lookup(entry['mac']) or "-"
+            print(f"{entry['ip']:<15} {entry['mac']:<20} {entry['interface']:<10} {vendor}")
+        else:
+            print(f"{entry['ip']:<15} {entry['mac']:<20} {entry['interface']:<10}")
     
     # ARP spoofing tespiti
     print("\n🔍 ARP Spoofing Analizi:")
     print("-" * 60)
     
-    suspicious_entries = detect_arp_spoofing(arp_table)
+    # Tablo ve ağ geçidi önceki taramalardan biriyle aynıysa analizi tekrarlama.
+    # Kira tablosu zamanla değiştiği için DHCP snooping açıkken, örneklenen kurallar her
+    # taramada farklı sonuç verebileceği için de örnekleme/bütçe ayarlıyken önbellek kullanılmaz.
+    watched_ips = frozenset(watched_ips or ())
+    if baseline is not None:
+        failed_reloads = baseline.failed_reloads
+        if baseline.reload_if_changed():
+            print(f"📌 Bilgi: Temel çizgi yeniden yüklendi ({baseline.path})")
+        elif baseline.failed_reloads != failed_reloads:
+            # Her başarısız yükleme bir kez bildirilir (dosya düzeltilene kadar her taramada değil)
+            print(f"📌 Bilgi: Temel çizgi güncellenemedi, önceki sürüm kullanılıyor: {baseline.last_error}")
+    if lease_table is not None or rule_engine.is_sampling():
+        suspicious_entries = detect_arp_spoofing(arp_table, gateway=gateway, lease_table=lease_table,
+                                                 watched_ips=watched_ips, baseline=baseline)
+    else:
+        # Temel çizgi ve kural kümesi sürümü anahtarda: biri değişince eski sonuçlar kullanılmaz
+        fingerprint = (table_fingerprint(arp_table, gateway["ip"], gateway["mac"]), watched_ips,
+                       baseline.version if baseline is not None else 0, rule_engine.generation)
+        suspicious_entries = _detection_cache.get(fingerprint)
+        if suspicious_entries is None:
+            suspicious_entries = detect_arp_spoofing(arp_table, gateway=gateway, watched_ips=watched_ips,
+                                                     baseline=baseline)
+            _detection_cache.put(fingerprint, suspicious_entries)
+    
+    # Önceki taramaya göre değişen bağlamalar (delta kuralları); önbellekteki liste değiştirilmez
+    delta_findings = rule_engine.observe_table(arp_table, {"gateway": gateway})
+    if delta_findings:
+        suspicious_entries = suspicious_entries + delta_findings
+    
+    # Ölçülen maliyeti bütçeyi aşan kurallar örneklemeye alınır (--rule-budget-us)
+    if rule_engine.budget_us is not None:
+        for name, rate in rule_engine.enforce_budget():
+            print(f"📌 Bilgi: '{name}' kuralı bütçeyi aştı, örnekleme oranı {rate:.2f}")
+    
+    # Ağ geçidi MAC'lerinin farklı üreticilere ait olması güçlü bir saldırı işaretidir
+    annotate_findings(suspicious_entries, oui_index)
+    if findings is not None:
+        findings.extend(suspicious_entries)
     
     if suspicious_entries:
         for entry in suspicious_entries:
             print(entry["message"])
+            if event_writer is not None:
+                event_writer.emit(entry, arp_table)
     else:
         print("✅ Herhangi bir şüpheli durum tespit edilmedi.")
     
@@ -354,6 +405,12 @@ def arp_kontrol_et():
             tip_açıklamaları = {
                 "multiple_ips": "Birden fazla IP'ye sahip MAC adresleri",
                 "gateway_multiple_macs": "Birden fazla MAC'e sahip ağ geçidi",
+                "duplicate_ip": "Birden fazla MAC'e sahip IP adresleri",
+                "baseline_mismatch": "Temel çizgiden sapan bağlamalar",
+                "binding_changed": "Taramalar arasında MAC'i değişen IP'ler",
+                "mac_flood": "Olası MAC/ARP flood",
+                "dhcp_lease_mismatch": "DHCP kirasıyla uyuşmayan bağlamalar",
+                "dhcp_no_lease": "DHCP kirası olmayan bağlamalar",
                 "broadcast_mac": "Broadcast MAC adresleri",
                 "multicast_mac": "Multicast MAC adresleri"
             }
@@ -368,6 +425,8 @@ def arp_kontrol_et():
     print("\n" + "=" * 60)
     print("🏁 Tarama Tamamlandı")
     print("=" * 60)
+    
+    return arp_table
 
 
 # ============= GRAFİK KULLANICI ARAYÜZÜ =============
@@ -516,7 +575,9 @@ class ARP_GUI:
         
         self.periodic_var = tk.BooleanVar()
         self.startup_var = tk.BooleanVar()
+        self.dhcp_var = tk.BooleanVar()
         self.period_hours = tk.IntVar(value=24)  # Varsayılan 24 saat
+        self.adaptive_var = tk.BooleanVar()  # Uyarlamalı aralık: seçilen periyot üst sınır olur
         
         # Sol seçenekler
         left_options = tk.Frame(settings_content, bg=self.card_bg)
@@ -548,7 +609,7 @@ class ARP_GUI:
         
         # Periyod gösterme etiketi
         self.period_label = tk.Label(periodic_frame, 
-                                  text=f"({self.period_hours.get()} saat)", 
+                                  text=self._period_label_text(), 
                                   bg=self.card_bg, fg=self.secondary_text, 
                                   font=("Segoe UI", 9))
         self.period_label.pack(side=tk.LEFT, padx=(2, 0))
@@ -566,6 +627,20 @@ class ARP_GUI:
                                          activeforeground=self.text_color)
         self.startup_check.pack(side=tk.LEFT)
         
+        # DHCP snooping seçeneği (ham soket için yönetici yetkisi gerekir)
+        dhcp_frame = tk.Frame(left_options, bg=self.card_bg)
+        dhcp_frame.pack(anchor="w", pady=5)
+        
+        self.dhcp_check = tk.Checkbutton(dhcp_frame, text="DHCP snooping (yönetici yetkisi gerekir)",
+                                      variable=self.dhcp_var,
+                                      command=self.toggle_dhcp_snooping,
+                                      bg=self.card_bg, fg=self.text_color, 
+                                      selectcolor=self.surface_color,
+                                      font=("Segoe UI", 10),
+                                      activebackground=self.card_bg,
+                                      activeforeground=self.text_color)
+        self.dhcp_check.pack(side=tk.LEFT)
+        
         # Sağ butonlar
         right_buttons = tk.Frame(settings_content, bg=self.card_bg)
         right_buttons.pack(side=tk.RIGHT)
@@ -593,73 +668,136 @@ class ARP_GUI:
         self.periodic_running = False
         self.periodic_thread = None
         self.warning_window = None
+        self.scan_in_progress = False
+        self.cancel_event = threading.Event()
+        self.last_fingerprint = None  # Son çizilen sonucun anahtarı: (tablo parmak izi, bulgu mesajları)
+        
+        # Katmanlı zamanlayıcı ayarları (ağ geçidine ek olarak sık kontrol edilecek hostlar)
+        self.critical_hosts = []  # Örn: ["192.168.1.53", "192.168.1.10"] (DNS, dosya sunucusu)
+        self.scan_cpu_budget_ms = 500  # Sık kontroller için dakika başına CPU bütçesi
+        self.scheduler = None
+        
+        # Uyarlamalı tam tarama aralığı (adaptive_var açıkken): en kısa aralık, en uzun aralık
+        # (None: seçilen periyot) ve tam taramaların kullanabileceği çekirdek oranı
+        self.poll_floor = 30.0
+        self.poll_ceiling = None
+        self.poll_cpu_budget = 0.01
+        self.adaptive_interval = None  # Periyodik tarama sırasında etkin AdaptiveInterval
+        self.last_gateway_ip = None
+        self.last_finding_keys = set()  # Son başarılı taramanın bulgu parmak izleri (yeni bulgu tespiti)
+        self.binding_changes = []
+        
+        # DHCP snooping kira tablosu (etkinleştirildiğinde), "kira yok" uyarılarından önceki
+        # öğrenme süresi ve statik izin listesi (None: varsa temel çizgideki bağlamalar)
+        self.lease_table = None
+        self.dhcp_snooper = None
+        self.dhcp_learning_period = DEFAULT_LEARNING_PERIOD
+        self.dhcp_static = None
+        
+        # Makine tarafından okunabilir olay çıktısı (--jsonl / --syslog)
+        self.event_writer = None
+        self.dashboard = None  # Canlı pano (--dashboard)
+        self.baseline = None  # Güvenilir bağlamalar (--baseline), değiştiğinde yeniden yüklenir
+        
+        # Uyarı penceresi için tekilleştirme ve hız sınırı (aynı durum her taramada açılmasın)
+        self.alert_manager = AlertManager()
+        
+        # İsteğe bağlı profil çıkarma (--profile-scans / --trace-memory / SIGUSR1-2); kapalıyken maliyetsiz
+        self.profiler = ScanProfiler()
     
     def start_scan(self):
         """Tarama işlemini başlatır"""
+        # Devam eden bir tarama varsa yenisini başlatma
+        if self.scan_in_progress:
+            return
+        self.scan_in_progress = True
+        self.cancel_event.clear()
+        
         # Arayüzü güncelle
         self.status_var.set("Ağınız taranıyor...")
         self.scan_button.config(state=tk.DISABLED)
+        self.stop_button.config(state=tk.NORMAL)  # Devam eden tarama iptal edilebilir
         self.progress.pack(fill=tk.X, pady=10)
         self.progress.start()
         
-        # Sonuç alanını temizle
-        self.result_text.config(state=tk.NORMAL)
-        self.result_text.delete(1.0, tk.END)
-        self.result_text.config(state=tk.DISABLED)
-        
         # Arka planda tarama yap
         threading.Thread(target=self._scan_thread, daemon=True).start()
     
     def _scan_thread(self):
         """Arka planda tarama işlemini yapar"""
+        with self.profiler.scan():
+            self._run_scan()
+    
+    def _run_scan(self):
+        """Taramayı yapar, sonuçları sınıflandırır ve arayüz güncellemesini planlar"""
         try:
-            # Çıktıyı yakala
+            # Konsol çıktısı yalnızca yutulur; sonuçlar yapılandırılmış 'findings' listesinden gelir
             output = io.StringIO()
+            findings = []
+            started_cpu = time.thread_time()
             with redirect_stdout(output):
-                arp_kontrol_et()
+                arp_table = arp_kontrol_et(self.cancel_event, self.lease_table, self.event_writer,
+                                           self.critical_hosts, self.baseline, findings)
+            scan_cpu = time.thread_time() - started_cpu
+            
+            # Tablo alınamadıysa (komut hatası/zaman aşımı) önceki sonuçlar ve bağlamalar korunur
+            table_missing = arp_table is None
+            
+            # Panodaki izleyicilere yalnızca bağlama farkları gönderilir
+            if self.dashboard is not None:
+                self.dashboard.publish_table(arp_table)
+            
+            # Katmanlı zamanlayıcının bildiği bağlamaları güncelle
+            scheduler = self.scheduler
+            if scheduler is not None:
+                scheduler.update_bindings(arp_table)
             
-            scan_output = output.getvalue()
+            # Tablo ve bulgular önceki taramayla aynıysa yeniden çizim atlanır
+            # Anahtar bulguları da içerir: tablo aynıyken temel çizgi yeniden yüklenmesi, DHCP öğrenme
+            # süresinin bitmesi veya kural ayarı/örneklemesi sonucu değiştirebilir
+            fingerprint = ((table_fingerprint(arp_table), tuple(entry["message"] for entry in findings))
+                           if arp_table else None)
+            unchanged = table_missing or (fingerprint is not None and fingerprint == self.last_fingerprint
+                                          and not self.binding_changes)
+            # Uyarlamalı aralık için yalnızca tablonun kendisi sayılır (örneklenen kurallar her
+            # taramada farklı bulgu verebilir; bu aralığı kısaltmamalı)
+            table_changed = not table_missing and (self.last_fingerprint is None or
+                                                   fingerprint is None or fingerprint[0] != self.last_fingerprint[0])
+            if not table_missing:
+                self.last_fingerprint = fingerprint
             
-            # Şüpheli durumları tespit et
-            suspicious_entries = []
-            is_safe = True
-            important_lines = []
+            # Uyarlamalı aralık: yeni tehdit bulgusu, ağ geçidi veya kritik host değişikliği aralığı
+            # tabana indirir. Tablo alınamadıysa önceki bulgular unutulmaz (tekrar "yeni" sayılmaz).
+            if scheduler is not None:
+                gateway_ip = read_default_gateway_ip()
+                fresh = []
+                if arp_table:
+                    fresh, self.last_finding_keys = new_findings(findings, self.last_finding_keys,
+                                                                 alert_fingerprint)
+                alarming = (any(is_threat(entry) for entry in fresh) or bool(self.binding_changes) or
+                            (self.last_gateway_ip is not None and gateway_ip != self.last_gateway_ip))
+                self.last_gateway_ip = gateway_ip
+                interval = scheduler.record_full_scan(table_changed or bool(self.binding_changes),
+                                                     alarming, scan_cpu)
+                if self.dashboard is not None and scheduler.adaptive is not None:
+                    self.dashboard.publish_metrics({"tarama_aralığı": format_interval(interval)})
             
-            for line in scan_output.split('\n'):
-                # Tehlikeli durumlar
-                if "⚠️" in line:
-                    suspicious_entries.append({
-                        "message": line,
-                        "type": "other"
-                    })
-                    important_lines.append(line)
-                    is_safe = False
-                elif "❌" in line:
-                    suspicious_entries.append({
-                        "message": line,
-                        "type": "gateway_multiple_macs"
-                    })
-                    important_lines.append(line)
-                    is_safe = False
-                # Bilgi satırları
-                elif "📌" in line:
-                    if "Broadcast MAC adresi" in line or "Multicast MAC adresi" in line:
-                        suspicious_entries.append({
-                            "message": line,
-                            "type": "info_broadcast_multicast"
-                        })
-                    else:
-                        suspicious_entries.append({
-                            "message": line,
-                            "type": "info_other"
-                        })
-                    important_lines.append(line)
-                # Başarı durumları
-                elif "✅" in line:
-                    important_lines.append(line)
+            if not unchanged:
+                # Sonuçlar arp_kontrol_et'in yapılandırılmış bulgularından çizilir (tür, ip, mac
+                # alanlarıyla; uyarı tekilleştirme ve yükseltme bunlara dayanır)
+                suspicious_entries = list(findings)
             
-            # Arayüzü güncelle
-            self.root.after(0, lambda: self._update_ui(is_safe, important_lines, suspicious_entries))
+                # Sık kontrollerde görülen bağlama değişikliklerini sonuçlara ekle; doğrulama
+                # taramasında delta kuralı aynı değişikliği raporladıysa bir kez gösterilir
+                reported = {(entry.get("ip"), entry.get("mac")) for entry in findings
+                            if entry["type"] == "binding_changed"}
+                while self.binding_changes:
+                    change = self.binding_changes.pop(0)
+                    if (change["ip"], change["mac"]) not in reported:
+                        suspicious_entries.append(change)
+            
+                # Arayüzü güncelle
+                self.root.after(0, lambda: self._update_ui(suspicious_entries))
             
             # Periyodik tarama başlatılacak mı?
             if self.periodic_var.get() and not self.periodic_running:
@@ -669,56 +807,61 @@ class ARP_GUI:
                 self.root.after(0, self.progress.stop)
                 self.root.after(0, self.progress.pack_forget)
                 self.root.after(0, lambda: self.scan_button.config(state=tk.NORMAL))
-                self.root.after(0, lambda: self.status_var.set("Tarama tamamlandı"))
+                if table_missing:
+                    status = "Tarama tamamlandı (ARP tablosu alınamadı)"
+                else:
+                    status = "Tarama tamamlandı (değişiklik yok)" if unchanged else "Tarama tamamlandı"
+                self.root.after(0, lambda: self.status_var.set(status))
+                if not self.periodic_running:
+                    self.root.after(0, lambda: self.stop_button.config(state=tk.DISABLED))
                 
+        except ScanCancelled:
+            self.root.after(0, self.progress.stop)
+            self.root.after(0, self.progress.pack_forget)
+            self.root.after(0, lambda: self.scan_button.config(state=tk.NORMAL))
+            self.root.after(0, lambda: self.status_var.set("Tarama iptal edildi"))
         except Exception as e:
             self.root.after(0, lambda: messagebox.showerror("Hata", f"Tarama sırasında hata: {str(e)}"))
             self.root.after(0, self.progress.stop)
             self.root.after(0, self.progress.pack_forget)
             self.root.after(0, lambda: self.scan_button.config(state=tk.NORMAL))
             self.root.after(0, lambda: self.status_var.set("Tarama hatası"))
+        finally:
+            self.scan_in_progress = False
+    
+    def toggle_dhcp_snooping(self):
+        """DHCP snooping dinleyicisini başlatır veya durdurur"""
+        if self.dhcp_var.get():
+            static = self.dhcp_static
+            if static is None and self.baseline is not None:
+                static = self.baseline.snapshot()[0]
+            lease_table = DhcpLeaseTable(static, self.dhcp_learning_period)
+            snooper = DhcpSnooper(lease_table)
+            try:
+                # Yetki/platform hatası başlatmadan önce görülsün diye soketi deneyerek aç
+                snooper.run_check()
+            except OSError as e:
+                self.dhcp_var.set(False)
+                messagebox.showerror("DHCP Snooping", f"DHCP snooping başlatılamadı: {e}")
+                return
+            snooper.start()
+            self.lease_table, self.dhcp_snooper = lease_table, snooper
+            self.status_var.set("DHCP snooping aktif - kiralar öğreniliyor")
+        else:
+            if self.dhcp_snooper is not None:
+                self.dhcp_snooper.stop()
+            self.lease_table, self.dhcp_snooper = None, None
+            self.status_var.set("DHCP snooping kapatıldı")
     
-    def _update_ui(self, is_safe, important_lines, suspicious_entries):
+    def _update_ui(self, suspicious_entries):
         """Tarama sonuçlarına göre arayüzü günceller"""
-        # Gerçekten tehlikeli durumları filtrele - sadece gerçek tehditler için
-        real_threats = []
-        
-        # Tüm bilgi ve yanlış alarmlar için genişletilmiş liste 
-        safe_types = [
-            "info_broadcast", "info_multicast", "info_special_ip", 
-            "info_other", "info_broadcast_multicast", 
-            "broadcast_mac", "multicast_mac"
-        ]
-        
-        for entry in suspicious_entries:
-            # entry tipini al
-            entry_type = entry.get("type", "")
-            
-            # Bilgi mesajlarını atla - tüm "info_" ile başlayan tipler
-            if entry_type.startswith("info_"):
-                continue
-                
-            # Diğer güvenli MAC/IP tiplerini atla 
-            if entry_type in safe_types:
-                continue
-                
-            # Mesaj içeriğini kontrol et - bazı durumlarda mesaj içeriği önemli olabilir
-            message = entry.get("message", "").lower()
-            
-            # "01:00:5e" gibi multicast MAC adresleri güvenlidir
-            if "01:00:5e" in message or "33:33" in message or "ff:ff:ff" in message:
-                continue
-                
-            # "224.0.0" gibi özel IP'leri içeren mesajlar güvenlidir 
-            if "224.0.0" in message or "239.255.255" in message:
-                continue
-                
-            # "normal" ibaresi olan mesajları atla
-            if "normal" in message or "bilgi" in message:
-                continue
-                
-            # Geriye kalan girdiler gerçek tehdit olarak kabul edilir
-            real_threats.append(entry)
+        with self.profiler.section("update_ui"):
+            self._render_results(suspicious_entries)
+    
+    def _render_results(self, suspicious_entries):
+        """Sonuç kartını, uyarı penceresini ve sonuç metnini çizer"""
+        # Gerçekten tehlikeli durumları filtrele - bilgi türleri ve 📌 satırları tehdit değildir
+        real_threats = [entry for entry in suspicious_entries if is_threat(entry)]
         
         # Gerçekten tehlike var mı kontrol et (sadece gerçek tehdit olduğunda)
         is_truly_safe = len(real_threats) == 0
@@ -735,24 +878,26 @@ class ARP_GUI:
             self.status_text.config(text="Ağınızda şüpheli ARP etkinliği tespit edildi! Detaylar için aşağıya bakın.")
             self.status_card.config(bg=self.card_bg)  # Tehlikeli durum rengi
             
-            # Gerçek şüpheli durum varsa uyarı penceresi göster
-            if len(real_threats) > 0:
-                self.root.after(500, lambda: self.show_warning(real_threats))
+            # Yalnızca yeni veya kötüleşen durumlar için uyarı penceresi göster
+            alerts = self.alert_manager.filter(real_threats)
+            if len(alerts) > 0:
+                self.root.after(500, lambda: self.show_warning(alerts))
         
         # Sonuç metnini güncelle
         self.result_text.config(state=tk.NORMAL)
+        self.result_text.delete(1.0, tk.END)
         
-        for line in important_lines:
-            if "⚠️" in line or "❌" in line:
-                self.result_text.insert(tk.END, line + "\n", "warning")
+        for entry in suspicious_entries:
+            if is_threat(entry):
+                self.result_text.insert(tk.END, entry["message"] + "\n", "warning")
                 if "warning" not in self.result_text.tag_names():
                     self.result_text.tag_configure("warning", foreground=self.warning_color)
-            elif "✅" in line:
-                self.result_text.insert(tk.END, line + "\n", "success")
-                if "success" not in self.result_text.tag_names():
-                    self.result_text.tag_configure("success", foreground=self.success_color)
             else:
-                self.result_text.insert(tk.END, line + "\n")
+                self.result_text.insert(tk.END, entry["message"] + "\n")
+        if is_truly_safe:
+            self.result_text.insert(tk.END, "✅ Herhangi bir şüpheli durum tespit edilmedi.\n", "success")
+            if "success" not in self.result_text.tag_names():
+                self.result_text.tag_configure("success", foreground=self.success_color)
         
         self.result_text.see(tk.END)
         self.result_text.config(state=tk.DISABLED)
@@ -817,6 +962,10 @@ class ARP_GUI:
             for entry in suspicious_entries:
                 threat_text = entry.get("message", "Bilinmeyen tehdit")
                 threat_text = threat_text.replace("⚠️", "").replace("❌", "").strip()
+                if entry.get("escalated"):
+                    threat_text += " (durum kötüleşti)"
+                if entry.get("suppressed_count"):
+                    threat_text += f" (+{entry['suppressed_count']} uyarı bastırıldı)"
                 
                 threat_frame = tk.Frame(threats_card, bg=self.card_bg, pady=5)
                 threat_frame.pack(fill=tk.X)
@@ -889,9 +1038,20 @@ class ARP_GUI:
         
         # Seçilen periyot
         hours = self.period_hours.get()
+        interval = hours * 3600
+        self.adaptive_interval = None
+        if self.adaptive_var.get():
+            ceiling = self.poll_ceiling or interval
+            self.adaptive_interval = AdaptiveInterval(min(self.poll_floor, ceiling), ceiling,
+                                                      self.poll_cpu_budget)
+            interval = self.adaptive_interval.interval
+            schedule = (f"Ağınız değişim hızına göre {format_interval(self.adaptive_interval.floor)} ile "
+                        f"{format_interval(ceiling)} arasında değişen aralıklarla kontrol edilecek.")
+        else:
+            schedule = f"Ağınız {hours} saatte bir kontrol edilecek."
         
         # Arka planda çalışma uyarısı göster
-        message = f"Periyodik tarama başlatıldı. Ağınız {hours} saatte bir kontrol edilecek.\n\n" + \
+        message = f"Periyodik tarama başlatıldı. {schedule}\n\n" + \
                  "⚠️ Uygulama arka planda çalışmaya devam edecektir. Uygulama penceresi " + \
                  "kapatılmadığı sürece periyodik kontroller devam edecek.\n\n" + \
                  "Bilgisayarınızın yeniden başlatılması durumunda, uygulamayı " + \
@@ -904,7 +1064,7 @@ class ARP_GUI:
         self.periodic_thread.start()
         
         # Periyodik tarama yapılacak bir sonraki zamanı hesapla
-        next_time = time.localtime(time.time() + (hours * 3600))
+        next_time = time.localtime(time.time() + interval)
         next_time_str = time.strftime("%H:%M:%S", next_time)
         self.status_var.set(f"Periyodik tarama aktif - Sonraki tarama: {next_time_str}")
     
@@ -913,7 +1073,7 @@ class ARP_GUI:
         # Yeni pencere oluştur - koyu tema
         settings_window = Toplevel(self.root)
         settings_window.title("Periyodik Tarama Ayarları")
-        settings_window.geometry("350x280")
+        settings_window.geometry("350x330")
         settings_window.configure(bg=self.bg_color)
         settings_window.resizable(False, False)
         settings_window.transient(self.root)
@@ -977,6 +1137,17 @@ class ARP_GUI:
                              font=("Segoe UI", 12))
         hours_suffix.pack(side=tk.LEFT, padx=(5, 0))
         
+        # Uyarlamalı aralık: ağ değiştikçe sıklaşır, durgunken seçilen süreye kadar seyrekleşir
+        adaptive_var = tk.BooleanVar(value=self.adaptive_var.get())
+        adaptive_check = tk.Checkbutton(hours_card, text="Uyarlamalı (seçilen süre üst sınır olur)",
+                                        variable=adaptive_var,
+                                        bg=self.card_bg, fg=self.text_color,
+                                        selectcolor=self.surface_color,
+                                        font=("Segoe UI", 10),
+                                        activebackground=self.card_bg,
+                                        activeforeground=self.text_color)
+        adaptive_check.pack(anchor="w", pady=(10, 0))
+        
         # Butonlar
         button_frame = tk.Frame(content, bg=self.bg_color)
         button_frame.pack(fill=tk.X, pady=(15, 0))
@@ -994,7 +1165,8 @@ class ARP_GUI:
             try:
                 hours = int(hour_combobox.get())
                 self.period_hours.set(hours)
-                self.period_label.config(text=f"({hours} saat)")
+                self.adaptive_var.set(adaptive_var.get())
+                self.period_label.config(text=self._period_label_text())
                 settings_window.destroy()
             except ValueError:
                 messagebox.showerror("Hata", "Geçerli bir saat değeri giriniz.")
@@ -1015,43 +1187,98 @@ class ARP_GUI:
         y = (settings_window.winfo_screenheight() // 2) - (height // 2)
         settings_window.geometry('{}x{}+{}+{}'.format(width, height, x, y))
     
+    def _period_label_text(self):
+        """Ayarlar kartındaki periyot etiketi"""
+        hours = self.period_hours.get()
+        if self.adaptive_var.get():
+            return f"(uyarlamalı, en fazla {hours} saat)"
+        return f"({hours} saat)"
+    
+    def effective_interval(self):
+        """
+        Periyodik taramanın şu anki tam tarama aralığı.
+        
+        Returns:
+            float: Saniye; periyodik tarama çalışmıyorsa None
+        """
+        scheduler = self.scheduler
+        return scheduler.effective_interval() if scheduler is not None else None
+    
     def _periodic_thread(self):
         """Periyodik tarama arka plan thread'i"""
         # Seçilen saat değerine göre saniye hesapla
         hours = self.period_hours.get()
         interval = hours * 3600  # Saat başına 3600 saniye
         
-        # Test için daha kısa interval
-        #interval = 60  # 1 dakika
-        
+        # Katmanlı zamanlayıcı: ağ geçidi ve kritik hostlar sık, değişen kayıtlar orta
+        # sıklıkta, tam tablo ise seçilen periyotta (uyarlamalı modda değişime göre) taranır
+        self.scheduler = TieredScanScheduler(
+            full_interval=interval,
+            lookup=read_neighbor_mac,
+            full_scan=self._request_full_scan,
+            on_change=self._on_binding_change,
+            cpu_budget_ms=self.scan_cpu_budget_ms,
+            adaptive=self.adaptive_interval)
+        gateway_ip = read_default_gateway_ip()
+        if not gateway_ip:
+            self.root.after(0, lambda: self.status_var.set(
+                "⚠️ Varsayılan ağ geçidi bulunamadı; sıcak katman yalnızca kritik hostları izliyor"))
+        self.scheduler.set_hot_hosts([gateway_ip] + self.critical_hosts)
+        
+        last_status = None
         while self.periodic_running:
-            # Zaman sayacı ve durum gösterimi
-            for i in range(interval):
-                if not self.periodic_running:
-                    return
-                
-                # Her dakikada bir durum metnini güncelle
-                if i % 60 == 0:
-                    remaining = interval - i
-                    hours, remainder = divmod(remaining, 3600)
-                    minutes, _ = divmod(remainder, 60)
-                    self.root.after(0, lambda h=hours, m=minutes: 
-                                  self.status_var.set(f"Sonraki taramaya: {h} saat {m} dakika"))
-                
-                time.sleep(1)
+            try:
+                self.scheduler.run_pending()
+            except Exception as e:
+                # Tek bir kontrol hatası (ör. okunamayan komşu kaydı) periyodik izlemeyi bitirmesin
+                self.root.after(0, lambda error=e: self.status_var.set(f"Periyodik kontrol hatası: {error}"))
             
-            # Süre dolduğunda tarama yap
-            if not self.periodic_running:
-                return
-                
-            # Tarama yap (ana thread'de güvenli çağrı)
-            self.root.after(0, self.start_scan)
+            # Durum metnini güncelle: bir saatten uzun beklemelerde dakikada, kısa olanlarda saniyede bir
+            remaining = int(self.scheduler.seconds_until_full())
+            step = 60 if remaining >= 3600 else 1
+            if last_status is None or last_status - remaining >= step or remaining > last_status:
+                last_status = remaining
+                status = f"Sonraki taramaya: {format_interval(remaining)}"
+                adaptive = self.scheduler.adaptive
+                if adaptive is not None:
+                    status += f" (uyarlamalı aralık: {format_interval(adaptive.interval)}, {adaptive.reason})"
+                self.root.after(0, lambda text=status: self.status_var.set(text))
             
-            # Taramanın tamamlanmasını bekle
-            time.sleep(5)
+            # Durdurma isteğine en geç 1 saniyede yanıt ver
+            time.sleep(min(1.0, max(0.05, self.scheduler.seconds_until_next())))
+        
+        self.scheduler = None
+    
+    def _request_full_scan(self):
+        """Tam taramayı arayüz thread'inde başlatır; sonuç _run_scan içinde bildirilir"""
+        self.root.after(0, self.start_scan)
+        return None
+    
+    def _on_binding_change(self, ip, old_mac, new_mac, tier):
+        """Zamanlayıcı bir IP/MAC bağlamasının değiştiğini gördüğünde çağrılır"""
+        # Tam taramadaki değişiklikleri delta kuralı (binding_change) zaten raporlar
+        if tier == TIER_FULL:
+            return
+        
+        # Sık kontrolde görülen değişikliği tarama sonuçlarına ekle
+        self.binding_changes.append({
+            "type": "binding_changed",
+            "ip": ip,
+            "mac": new_mac,
+            "old_mac": old_mac,
+            "message": f"⚠️ Şüpheli: {ip} IP adresinin MAC adresi değişti: {old_mac} -> {new_mac}"
+        })
+        
+        # Değişikliği tam analizle doğrula
+        self.root.after(0, self.start_scan)
     
     def stop_scan(self):
-        """Periyodik taramayı durdurur"""
+        """Devam eden taramayı iptal eder ve periyodik taramayı durdurur"""
+        # Çalışan komutu sonlandır
+        self.cancel_event.set()
+        if not self.periodic_running:
+            self.stop_button.config(state=tk.DISABLED)
+        
         if self.periodic_running:
             self.periodic_running = False
             self.stop_button.config(state=tk.DISABLED)
@@ -1061,6 +1288,153 @@ class ARP_GUI:
 
 # Program çalıştırma
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ARP Spoofing Tespit Aracı")
+    parser.add_argument("--watchdog", action="store_true",
+                        help="Sadece ağ geçidi bekçisi (GUI olmadan, saniyede birkaç kontrol)")
+    parser.add_argument("--jsonl", metavar="DOSYA", default=None,
+                        help="Bulguları JSON Lines olarak dosyaya yaz ('-' ise stdout)")
+    parser.add_argument("--syslog", metavar="ADRES", nargs="?", const=DEFAULT_SYSLOG_ADDRESS, default=None,
+                        help=f"Bulguları RFC 5424 syslog'a gönder (varsayılan: {DEFAULT_SYSLOG_ADDRESS}, veya host:port)")
+    parser.add_argument("--webhook", metavar="URL", action="append", default=None,
+                        help="Bulguları bu HTTP adresine JSON olarak gönder (birden fazla verilebilir)")
+    parser.add_argument("--outbox", metavar="DOSYA", default=None,
+                        help="Gönderilemeyen webhook bildirimlerinin saklanacağı dosya")
+    parser.add_argument("--dashboard", metavar="PORT", type=int, default=None,
+                        help="Tarama sonuçlarını http://127.0.0.1:PORT/ adresindeki canlı panoda yayınla")
+    parser.add_argument("--watch-ip", metavar="IP", action="append", default=[],
+                        help="Kritik host (DNS, dosya sunucusu vb.): sık kontrol edilir, çift MAC tehlike sayılır")
+    parser.add_argument("--disable-rule", metavar="KURAL", action="append", default=[],
+                        help="Tespit kuralını kapat (ör. special_addresses, mac_multiple_ips)")
+    parser.add_argument("--rule-sample", metavar="KURAL=ORAN", action="append", default=[],
+                        help="Kuralı yalnızca taramaların bu oranında çalıştır (ör. mac_multiple_ips=0.2)")
+    parser.add_argument("--rule-budget-us", metavar="µs", type=float, default=None,
+                        help="Çağrı başına bu CPU süresini aşan kuralları otomatik örneklemeye al")
+    parser.add_argument("--rule-stats", action="store_true",
+                        help="Çıkışta kural başına CPU süresi ve isabet sayılarını yazdır")
+    parser.add_argument("--baseline", metavar="DOSYA", default=None,
+                        help="Güvenilir IP/MAC bağlamaları dosyası (değiştiğinde otomatik yeniden yüklenir)")
+    parser.add_argument("--dhcp-static", metavar="DOSYA", default=None,
+                        help="DHCP snooping için statik izin listesi ('IP MAC' satırları; varsayılan: --baseline)")
+    parser.add_argument("--dhcp-learning", metavar="SANİYE", type=float, default=DEFAULT_LEARNING_PERIOD,
+                        help="DHCP snooping açıldıktan sonra 'kira yok' uyarılarının başlaması için beklenecek "
+                             f"süre (varsayılan: {DEFAULT_LEARNING_PERIOD:.0f})")
+    parser.add_argument("--profile-scans", metavar="N", type=int, default=0,
+                        help="Sonraki N taramayı cProfile ile profille")
+    parser.add_argument("--trace-memory", metavar="N", type=int, default=0,
+                        help="N tarama boyunca bellek ayırmalarını izle (taramalar arası fark)")
+    parser.add_argument("--profile-dir", metavar="DİZİN", default=DEFAULT_PROFILE_DIR,
+                        help="Profil, bellek ve yığın dökümü dosyalarının yazılacağı dizin")
+    parser.add_argument("--state", metavar="DOSYA", default=None,
+                        help="Bağlamaları, uyarı bastırma durumunu ve ağ geçidi kimliğini bu dosyada sakla; "
+                             "yeniden başlatınca kaldığı yerden devam et")
+    parser.add_argument("--state-interval", metavar="SANİYE", type=float, default=DEFAULT_STATE_INTERVAL,
+                        help=f"Durum dosyasının yazılma aralığı (varsayılan: {DEFAULT_STATE_INTERVAL:.0f})")
+    parser.add_argument("--adaptive-interval", action="store_true",
+                        help="Periyodik taramada aralığı değişim hızına göre ayarla (değişim varsa sıklaştır, "
+                             "tablo aynı kaldıkça seyrekleştir)")
+    parser.add_argument("--poll-floor", metavar="SANİYE", type=float, default=30.0,
+                        help="Uyarlamalı modda en kısa tarama aralığı (varsayılan: 30)")
+    parser.add_argument("--poll-ceiling", metavar="SANİYE", type=float, default=None,
+                        help="Uyarlamalı modda en uzun tarama aralığı (varsayılan: seçilen periyot)")
+    parser.add_argument("--poll-cpu-budget", metavar="YÜZDE", type=float, default=1.0,
+                        help="Tam taramaların kullanabileceği en fazla CPU (bir çekirdeğin yüzdesi, varsayılan: 1)")
+    parser.add_argument("--demo", action="store_true",
+                        help="Tanıtım modu: arp komutu çalışmazsa örnek bir ARP tablosu göster")
+    args = parser.parse_args()
+    demo_mode = args.demo
+    
+    # Uyarlamalı aralık ayarları başlamadan doğrulanır
+    if not 0 < args.poll_cpu_budget <= 100:
+        parser.error(f"--poll-cpu-budget (0, 100] aralığında olmalı: {args.poll_cpu_budget}")
+    try:
+        AdaptiveInterval(args.poll_floor, args.poll_ceiling or args.poll_floor, args.poll_cpu_budget / 100)
+    except ValueError as error:
+        parser.error(str(error))
+    
+    # SIGUSR1: yığın dökümü ve örnekleme, SIGUSR2: sonraki taramaları profille
+    profiler = ScanProfiler(args.profile_dir)
+    profiler.install_signal_handlers(scans=args.profile_scans or 3)
+    
+    try:
+        rule_engine.configure(args.disable_rule, args.rule_sample, args.rule_budget_us)
+    except (KeyError, ValueError) as error:
+        parser.error(str(error))
+    
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = TrustedBaseline(args.baseline)
+        except (OSError, ValueError) as error:
+            parser.error(f"Temel çizgi yüklenemedi: {error}")
+    
+    dhcp_static = None
+    if args.dhcp_static:
+        try:
+            dhcp_static = load_static_bindings(args.dhcp_static)
+        except (OSError, ValueError) as error:
+            parser.error(f"DHCP statik izin listesi yüklenemedi: {error}")
+    if args.dhcp_learning < 0:
+        parser.error(f"--dhcp-learning negatif olamaz: {args.dhcp_learning}")
+    
+    # Sıcak yeniden başlatma: durum zamanlayıcıyla ve kapanışta (SIGTERM dahil) kaydedilir
+    checkpoint = None
+    if args.state:
+        checkpoint = StateCheckpoint(args.state, rule_engine, interval=args.state_interval)
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
+    # Olay çıkışları (ve pano) bekçi modunda da kullanılır: gözetimsiz sensör uyarıları buradan çıkar
+    dashboard = None
+    if args.dashboard is not None:
+        dashboard = DashboardServer(port=args.dashboard)
+        try:
+            dashboard.start()
+        except OSError as error:
+            parser.error(f"Pano başlatılamadı: {error}")
+    event_writer = writer_from_args(args.jsonl, args.syslog, args.webhook, args.outbox,
+                                    [dashboard] if dashboard else [])
+    if checkpoint is not None and event_writer is not None and event_writer.alert_manager is not None:
+        checkpoint.alert_managers["events"] = event_writer.alert_manager
+    
+    if args.watchdog:
+        if checkpoint is not None:
+            load_checkpoint(checkpoint)
+            checkpoint.start()
+        try:
+            sys.exit(watchdog_main(baseline=baseline, state=checkpoint, event_writer=event_writer))
+        finally:
+            if checkpoint is not None and not checkpoint.stop():
+                print(f"📌 Bilgi: Durum kaydedilemedi: {checkpoint.last_error}")
+            if event_writer is not None:
+                event_writer.close()
+    
     root = tk.Tk()
     app = ARP_GUI(root)
-    root.mainloop()
+    app.profiler = profiler
+    profiler.profile_scans(args.profile_scans)
+    profiler.trace_memory(args.trace_memory)
+    app.critical_hosts.extend(args.watch_ip)
+    app.adaptive_var.set(args.adaptive_interval)
+    app.period_label.config(text=app._period_label_text())
+    app.poll_floor = args.poll_floor
+    app.poll_ceiling = args.poll_ceiling
+    app.poll_cpu_budget = args.poll_cpu_budget / 100
+    app.baseline = baseline
+    app.dhcp_static = dhcp_static
+    app.dhcp_learning_period = args.dhcp_learning
+    app.dashboard = dashboard
+    app.event_writer = event_writer
+    if checkpoint is not None:
+        checkpoint.alert_managers["ui"] = app.alert_manager
+        load_checkpoint(checkpoint)
+        checkpoint.start()
+    try:
+        root.mainloop()
+    finally:
+        if checkpoint is not None and not checkpoint.stop():
+            print(f"📌 Bilgi: Durum kaydedilemedi: {checkpoint.last_error}")
+    if app.event_writer is not None:
+        app.event_writer.close()
+    if args.rule_stats:
+        print("\n".join(rule_engine.format_stats()))
+    if profiler.written:
+        print("📌 Profil dosyaları: " + ", ".join(profiler.written))
@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Sıcak Yeniden Başlatma için Durum Kontrol Noktası
+Araç her açılışta boş bilgiyle başlarsa, çökme veya güncelleme sırasında yapılan bir
+sahtecilik fark edilmez: ilk tarama "önceki tablo" olmadığı için değişikliği göremez. Bu
+modül tespit durumunu sürümlü bir ikili dosyaya yazar ve açılışta geri yükler:
+
+- Bağlamalar: kural motorunun son taramadaki IP -> MAC kümesi eşlemesi; yeniden başlatmadan
+  sonraki ilk tarama bununla karşılaştırılır (binding_change kuralı),
+- Uyarı bastırma ve hız sayaçları: AlertManager parmak izleri, jeton kovası ve istatistikler;
+  bastırma pencereleri kapalı geçen süre kadar ilerletilir,
+- Ağ geçidi kimliği: bekçinin sabitlediği (veya son taramada tek MAC ile görülen) ağ geçidi
+  IP/MAC çifti; bekçi yeniden öğrenmek (TOFU) yerine bunu sabitler.
+
+Dosya zamanlayıcıyla ve kapanışta atomik olarak yazılır (geçici dosya + fsync + os.replace).
+Açılışta mmap ile açılır; bağlamalar kopyalanmaz, sıralı diziler üzerinde ikili aramayla
+okunur. Böylece milyon kayıtlı bir durum milisaniyeler içinde kullanıma hazırdır.
+
+Dosya düzeni (küçük uçlu):
+    başlık  "<4sHHdQIIQQ": sihirli sayı, sürüm, ayrılmış, kayıt zamanı (Unix), ağ geçidi MAC,
+                           ağ geçidi IP (0: yok), uyarı yöneticisi sayısı, IP sayısı, bağlama sayısı
+    uint32[bağlama]        IP adresleri, sıralı (aynı IP'nin MAC'leri art arda)
+    (8 bayt hizası)
+    uint64[bağlama]        MAC adresleri (48 bit), IP dizisiyle aynı sırada
+    her uyarı yöneticisi için:
+        "<16sddIIQQQQ"     ad, jeton, kova yaşı, bekleyen bastırılan, durum sayısı, istatistikler
+        "<ddidHHH"[durum]  son uyarı yaşı, son görülme yaşı, önem, büyüklük, tür/IP/MAC uzunlukları
+        UTF-8 metinler     parmak izi alanları (uzunluk 0xFFFF: None)
+
+Kullanım:
+    python arp_spoofing_detector.py --state arp-state.bin --state-interval 30
+    python arp_state.py show arp-state.bin
+    python arp_state.py benchmark --entries 1000000
+"""
+
+import argparse
+import bisect
+import mmap
+import os
+import socket
+import struct
+import tempfile
+import threading
+import time
+from collections.abc import Mapping
+
+from arp_oui import mac_to_int
+from arp_watchdog import read_default_gateway_ip
+
+MAGIC = b"ARPS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHdQIIQQ")
+MANAGER = struct.Struct("<16sddIIQQQQ")
+STATE_RECORD = struct.Struct("<ddidHHH")
+NO_TEXT = 0xFFFF
+MAC_MASK = (1 << 48) - 1
+STAT_KEYS = ("alerted", "escalated", "suppressed", "rate_limited")
+
+DEFAULT_STATE_INTERVAL = 60.0
+
+
+class StateFormatError(Exception):
+    """Durum dosyası bozuk veya desteklenmeyen sürümde."""
+
+
+def ip_to_int(ip):
+    """
+    IPv4 adresini 32 bitlik tamsayıya çevirir.
+
+    Raises:
+        OSError: Geçersiz IP adresi
+    """
+    return int.from_bytes(socket.inet_aton(ip), "big")
+
+
+def int_to_ip(value):
+    """32 bitlik tamsayıyı IPv4 adresine çevirir."""
+    return socket.inet_ntoa(value.to_bytes(4, "big"))
+
+
+def int_to_mac(value):
+    """48 bitlik tamsayıyı 'aa:bb:cc:dd:ee:ff' biçimine çevirir."""
+    text = f"{value:012x}"
+    return ":".join(text[position:position + 2] for position in range(0, 12, 2))
+
+
+def _align8(size):
+    return (size + 7) & ~7
+
+
+class CheckpointBindings(Mapping):
+    """
+    Kontrol noktasındaki bağlamaların mmap üzerindeki salt okunur görünümü (IP -> MAC kümesi).
+
+    Kural motoru ilk taramada bunu bir dict gibi kullanır; kayıtlar yalnızca erişildiğinde
+    çözülür. Motor sonraki eşlemeye geçtiğinde görünüm ve eşleme birlikte serbest kalır.
+    """
+
+    def __init__(self, ips, macs, ip_count):
+        self._ips = ips
+        self._macs = macs
+        self._ip_count = ip_count
+
+    def _range(self, ip):
+        try:
+            value = ip_to_int(ip)
+        except (OSError, TypeError):
+            return 0, 0
+        start = bisect.bisect_left(self._ips, value)
+        return start, bisect.bisect_right(self._ips, value, start)
+
+    def __getitem__(self, ip):
+        start, end = self._range(ip)
+        if start == end:
+            raise KeyError(ip)
+        return {int_to_mac(self._macs[index]) for index in range(start, end)}
+
+    def __contains__(self, ip):
+        start, end = self._range(ip)
+        return start != end
+
+    def __len__(self):
+        return self._ip_count
+
+    def __iter__(self):
+        previous = None
+        for value in self._ips:
+            if value != previous:
+                previous = value
+                yield int_to_ip(value)
+
+    def items(self):
+        """Sıralı diziyi tek geçişte gruplar (her IP için ikili arama yapmaz)."""
+        previous, macs = None, None
+        for value, mac in zip(self._ips, self._macs):
+            if value != previous:
+                if macs is not None:
+                    yield int_to_ip(previous), macs
+                previous, macs = value, set()
+            macs.add(int_to_mac(mac))
+        if macs is not None:
+            yield int_to_ip(previous), macs
+
+    def raw(self):
+        """Dizilerin ham baytları (yeniden yazarken çözmeden kopyalamak için)."""
+        return self._ips.tobytes(), self._macs.tobytes(), self._ip_count
+
+
+def _pack_bindings(bindings):
+    """
+    Bağlama eşlemesini (IP, MAC) sırasına göre sıralı iki diziye paketler.
+
+    Returns:
+        tuple: (IP baytları, MAC baytları, IP sayısı, bağlama sayısı)
+    """
+    if bindings is None:
+        return b"", b"", 0, 0
+    if isinstance(bindings, CheckpointBindings):
+        ip_bytes, mac_bytes, ip_count = bindings.raw()
+        return ip_bytes, mac_bytes, ip_count, len(ip_bytes) // 4
+    # (IP, MAC) çifti tek bir tamsayı olarak sıralanır (demet sıralamasından belirgin hızlı)
+    keys = []
+    for ip, macs in bindings.items():
+        try:
+            ip_key = ip_to_int(ip) << 48
+        except OSError:
+            continue
+        for mac in macs:
+            try:
+                keys.append(ip_key | mac_to_int(mac))
+            except ValueError:
+                continue
+    keys.sort()
+    ip_values = [key >> 48 for key in keys]
+    ip_count = len(set(ip_values))
+    return (struct.pack(f"<{len(keys)}I", *ip_values),
+            struct.pack(f"<{len(keys)}Q", *(key & MAC_MASK for key in keys)),
+            ip_count, len(keys))
+
+
+def _encode_text(value):
+    if value is None:
+        return NO_TEXT, b""
+    data = str(value).encode("utf-8")[:NO_TEXT - 1]
+    return len(data), data
+
+
+def _pack_manager(name, state):
+    records, texts = [], []
+    for key, alert_age, seen_age, rank, magnitude in state["states"]:
+        fields = tuple(key) + (None,) * (3 - len(key))
+        encoded = [_encode_text(field) for field in fields[:3]]
+        records.append(STATE_RECORD.pack(alert_age, seen_age, rank, magnitude,
+                                         *(length for length, _ in encoded)))
+        texts.extend(data for _, data in encoded)
+    header = MANAGER.pack(name.encode("utf-8")[:16], state["tokens"], state["bucket_age"],
+                          state["pending_suppressed"], len(records),
+                          *(state["stats"].get(key, 0) for key in STAT_KEYS))
+    return header + b"".join(records) + b"".join(texts)
+
+
+def _age_state(state, seconds):
+    """Uyarı yöneticisi durumundaki yaşları 'seconds' kadar artırır."""
+    aged = dict(state)
+    aged["states"] = [(key, alert_age + seconds, seen_age + seconds, rank, magnitude)
+                      for key, alert_age, seen_age, rank, magnitude in state["states"]]
+    aged["bucket_age"] = state["bucket_age"] + seconds
+    return aged
+
+
+def _unpack_manager(buffer, offset):
+    """
+    Bir uyarı yöneticisi bölümünü okur.
+
+    Returns:
+        tuple: (ad, export_state() biçiminde durum, sonraki bölümün ofseti)
+    """
+    name, tokens, bucket_age, pending, count, *stats = MANAGER.unpack_from(buffer, offset)
+    offset += MANAGER.size
+    records = [STATE_RECORD.unpack_from(buffer, offset + index * STATE_RECORD.size) for index in range(count)]
+    offset += count * STATE_RECORD.size
+    states = []
+    for alert_age, seen_age, rank, magnitude, *lengths in records:
+        key = []
+        for length in lengths:
+            if length == NO_TEXT:
+                key.append(None)
+                continue
+            if offset + length > len(buffer):
+                raise StateFormatError("Uyarı durumu metni dosya sonunu aşıyor")
+            key.append(bytes(buffer[offset:offset + length]).decode("utf-8"))
+            offset += length
+        states.append((tuple(key), alert_age, seen_age, rank, magnitude))
+    state = {"states": states, "tokens": tokens, "bucket_age": bucket_age,
+             "pending_suppressed": pending, "stats": dict(zip(STAT_KEYS, stats))}
+    return name.rstrip(b"\0").decode("utf-8"), state, offset
+
+
+def write_state_file(path, parts):
+    """
+    Baytları atomik olarak yazar: aynı dizinde geçici dosya, fsync, os.replace. Çökme anında
+    dosya ya eski ya yeni içeriğiyle kalır, hiçbir zaman yarım kalmaz.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".arp-state-")
+    try:
+        with os.fdopen(handle, "wb") as temp_file:
+            temp_file.writelines(parts)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    # Yeniden adlandırmanın da diske geçmesi için dizin fsync'lenir (Windows'ta desteklenmez)
+    try:
+        directory_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(directory_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(directory_fd)
+
+
+def read_state_file(path):
+    """
+    Durum dosyasını mmap ile açar. Bağlamalar kopyalanmaz; uyarı durumları (küçük) çözülür.
+
+    Returns:
+        dict: {"saved_at", "gateway": (ip, mac), "bindings": CheckpointBindings,
+               "managers": {ad: durum}}
+
+    Raises:
+        OSError: Dosya açılamazsa
+        StateFormatError: Dosya geçersizse
+    """
+    with open(path, "rb") as state_file:
+        try:
+            mapped = mmap.mmap(state_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise StateFormatError("Durum dosyası boş") from None
+    if len(mapped) < HEADER.size:
+        raise StateFormatError("Durum dosyası çok kısa")
+    (magic, version, _, saved_at, gateway_mac, gateway_ip, manager_count, ip_count,
+     binding_count) = HEADER.unpack_from(mapped, 0)
+    if magic != MAGIC or version != VERSION:
+        raise StateFormatError("Geçersiz veya desteklenmeyen durum dosyası")
+    macs_offset = HEADER.size + _align8(binding_count * 4)
+    managers_offset = macs_offset + binding_count * 8
+    if managers_offset > len(mapped):
+        raise StateFormatError("Bağlama dizileri dosya sonunu aşıyor")
+
+    view = memoryview(mapped)
+    bindings = CheckpointBindings(view[HEADER.size:HEADER.size + binding_count * 4].cast("I"),
+                                  view[macs_offset:managers_offset].cast("Q"), ip_count)
+    managers = {}
+    offset = managers_offset
+    try:
+        for _ in range(manager_count):
+            name, state, offset = _unpack_manager(view, offset)
+            managers[name] = state
+    except (struct.error, UnicodeDecodeError) as error:
+        raise StateFormatError(f"Uyarı durumu okunamadı: {error}") from None
+    gateway = (int_to_ip(gateway_ip), int_to_mac(gateway_mac)) if gateway_ip else (None, None)
+    return {"saved_at": saved_at, "gateway": gateway, "bindings": bindings, "managers": managers}
+
+
+def load_checkpoint(checkpoint):
+    """
+    Kontrol noktasını yükler ve sonucu yazdırır. Okunamayan bir dosya başlatmayı engellemez;
+    boş durumla devam edilir ve ilk kayıtta dosya yeniden yazılır.
+
+    Returns:
+        dict: StateCheckpoint.load() özeti; yüklenemediyse None
+    """
+    try:
+        summary = checkpoint.load()
+    except (OSError, StateFormatError) as error:
+        print(f"📌 Bilgi: Önceki durum okunamadı, boş durumla başlanıyor: {error}")
+        return None
+    if summary is not None:
+        gateway_ip, gateway_mac = summary["gateway"]
+        gateway = f", ağ geçidi {gateway_ip} -> {gateway_mac}" if gateway_ip else ""
+        print(f"📌 Bilgi: Önceki durum yüklendi: {summary['bindings']} bağlama, "
+              f"{summary['alert_states']} uyarı durumu{gateway} "
+              f"({summary['load_ms']:.1f} ms, {summary['age']:.0f} sn önce kaydedildi)")
+    return summary
+
+
+class StateCheckpoint:
+    """
+    Kural motoru, uyarı yöneticileri ve ağ geçidi kimliğini periyodik olarak kaydeden ve
+    açılışta geri yükleyen yardımcı.
+    """
+
+    def __init__(self, path, engine=None, alert_managers=None, interval=DEFAULT_STATE_INTERVAL,
+                 gateway_source=read_default_gateway_ip):
+        """
+        Args:
+            path (str): Durum dosyası
+            engine (RuleEngine): Bağlamaları kaydedilecek kural motoru
+            alert_managers (dict): Ad -> AlertManager (ör. {"ui": ..., "events": ...})
+            interval (float): Zamanlayıcıyla kayıt aralığı (saniye, 0: yalnızca kapanışta)
+            gateway_source (callable): Varsayılan ağ geçidi IP'sini döndüren fonksiyon
+        """
+        self.path = path
+        self.engine = engine
+        self.alert_managers = dict(alert_managers or {})
+        self.interval = interval
+        self.gateway_source = gateway_source
+        self.watchdog = None  # Verilirse ağ geçidi kimliği bekçinin sabitlediği çiftten alınır
+        self.gateway = (None, None)
+        self.saves = 0
+        self.last_error = None
+        self.last_save_ms = 0.0
+        self._lock = threading.Lock()
+        self._packed = None  # (eşleme, paketlenmiş diziler)
+        self._foreign = {}  # Bu süreçte yöneticisi olmayan bölümler -> (durum, kayıt zamanı)
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    # ---- Yükleme ----
+
+    def load(self):
+        """
+        Durum dosyasını açar ve içeriği kayıtlı nesnelere yükler.
+
+        Returns:
+            dict: Özet ({"bindings", "alert_states", "gateway", "age", "load_ms"}); dosya yoksa None
+
+        Raises:
+            OSError: Dosya okunamazsa
+            StateFormatError: Dosya geçersizse
+        """
+        started = time.perf_counter()
+        try:
+            state = read_state_file(self.path)
+        except FileNotFoundError:
+            return None
+        age = max(0.0, time.time() - state["saved_at"])
+        if self.engine is not None:
+            self.engine.restore_bindings(state["bindings"])
+        alert_states = 0
+        for name, manager_state in state["managers"].items():
+            manager = self.alert_managers.get(name)
+            if manager is not None:
+                manager.restore_state(manager_state, elapsed=age)
+                alert_states += len(manager_state["states"])
+            else:
+                # Ör. bekçi modu arayüzün uyarı durumunu kullanmaz ama dosyadan silmemeli
+                self._foreign[name] = (manager_state, state["saved_at"])
+        self.gateway = state["gateway"]
+        return {"bindings": len(state["bindings"]), "alert_states": alert_states,
+                "gateway": self.gateway, "age": age,
+                "load_ms": (time.perf_counter() - started) * 1000}
+
+    def gateway_mac_for(self, gateway_ip):
+        """Önceki çalışmada bu ağ geçidi için kaydedilen MAC (IP değiştiyse None)."""
+        ip, mac = self.gateway
+        return mac if ip and ip == gateway_ip else None
+
+    # ---- Kaydetme ----
+
+    def _current_gateway(self, bindings):
+        watchdog = self.watchdog
+        if watchdog is not None and watchdog.gateway_ip and watchdog.gateway_mac:
+            return watchdog.gateway_ip, watchdog.gateway_mac
+        gateway_ip = self.gateway_source() if bindings is not None else None
+        macs = bindings.get(gateway_ip) if gateway_ip else None
+        # Ağ geçidi birden fazla MAC ile görülüyorsa (olası saldırı) bilinen kimlik korunur
+        if macs and len(macs) == 1:
+            return gateway_ip, next(iter(macs))
+        return self.gateway
+
+    def save(self):
+        """
+        Güncel durumu atomik olarak yazar.
+
+        Returns:
+            int: Yazılan bayt sayısı
+
+        Raises:
+            OSError: Dosya yazılamazsa
+        """
+        with self._lock:
+            started = time.perf_counter()
+            # Motor her taramada eşlemeyi değiştirmek yerine yenisini atar; bu referans tutarlıdır
+            bindings = self.engine.bindings() if self.engine is not None else None
+            # Tarama olmadan geçen kayıtlarda (periyodik mod) aynı eşleme yeniden paketlenmez
+            if self._packed is None or self._packed[0] is not bindings:
+                self._packed = (bindings, _pack_bindings(bindings))
+            ip_bytes, mac_bytes, ip_count, binding_count = self._packed[1]
+            self.gateway = self._current_gateway(bindings)
+            gateway_ip, gateway_mac = self.gateway
+            try:
+                gateway = (ip_to_int(gateway_ip), mac_to_int(gateway_mac)) if gateway_ip else (0, 0)
+            except (OSError, ValueError):
+                gateway = (0, 0)
+            now = time.time()
+            managers = {name: manager.export_state() for name, manager in self.alert_managers.items()}
+            for name, (manager_state, saved_at) in self._foreign.items():
+                if name not in managers:
+                    managers[name] = _age_state(manager_state, max(0.0, now - saved_at))
+            parts = [
+                HEADER.pack(MAGIC, VERSION, 0, now, gateway[1], gateway[0], len(managers),
+                            ip_count, binding_count),
+                ip_bytes,
+                b"\0" * (_align8(len(ip_bytes)) - len(ip_bytes)),
+                mac_bytes,
+            ]
+            parts.extend(_pack_manager(name, manager_state) for name, manager_state in managers.items())
+            write_state_file(self.path, parts)
+            self.saves += 1
+            self.last_save_ms = (time.perf_counter() - started) * 1000
+            self.last_error = None
+            return sum(len(part) for part in parts)
+
+    def _save_quietly(self):
+        try:
+            self.save()
+            return True
+        except OSError as error:
+            # Disk dolu vb.: önceki kontrol noktası yerinde kalır, sonraki denemede tekrar yazılır
+            self.last_error = str(error)
+            return False
+
+    # ---- Zamanlayıcı ----
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self._save_quietly()
+
+    def start(self):
+        """Zamanlayıcıyla kaydı arka plan thread'inde başlatır."""
+        if self.interval and self._thread is None:
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="state-checkpoint", daemon=True)
+            self._thread.start()
+
+    def stop(self, save=True):
+        """
+        Zamanlayıcıyı durdurur ve (varsayılan olarak) son durumu yazar.
+
+        Returns:
+            bool: Son kayıt başarılıysa (veya istenmediyse) True
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(5.0)
+            self._thread = None
+        return self._save_quietly() if save else True
+
+
+def main(argv=None):
+    """Komut satırından durum dosyasını gösterir veya kayıt/yükleme süresini ölçer."""
+    parser = argparse.ArgumentParser(description="ARP Spoofing Tespit Aracı - Durum kontrol noktası")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    show_parser = subparsers.add_parser("show", help="Durum dosyasının özetini göster")
+    show_parser.add_argument("path")
+    benchmark_parser = subparsers.add_parser("benchmark", help="Sentetik durumla kayıt/yükleme süresini ölç")
+    benchmark_parser.add_argument("--entries", type=int, default=1000000, metavar="N")
+    args = parser.parse_args(argv)
+
+    if args.command == "show":
+        try:
+            state = read_state_file(args.path)
+        except (OSError, StateFormatError) as error:
+            print(f"❌ Durum dosyası okunamadı: {error}")
+            return 1
+        age = max(0.0, time.time() - state["saved_at"])
+        gateway_ip, gateway_mac = state["gateway"]
+        print(f"📌 {len(state['bindings'])} IP bağlaması, {age:.0f} sn önce kaydedildi")
+        print(f"📌 Ağ geçidi: {gateway_ip or '-'} -> {gateway_mac or '-'}")
+        for name, manager_state in state["managers"].items():
+            stats = ", ".join(f"{key}={value}" for key, value in manager_state["stats"].items())
+            print(f"📌 Uyarı yöneticisi '{name}': {len(manager_state['states'])} durum, {stats}")
+        return 0
+
+    from arp_alerts import AlertManager
+    from arp_rules import RuleEngine
+
+    engine = RuleEngine([])
+    engine.restore_bindings({int_to_ip(0x0A000000 + index): {int_to_mac(0x020000000000 + index)}
+                             for index in range(args.entries)})
+    manager = AlertManager(rate=1.0, burst=4096)
+    for index in range(min(args.entries, manager.max_fingerprints)):
+        manager.admit({"type": "duplicate_ip", "ip": int_to_ip(0x0A000000 + index),
+                       "mac": int_to_mac(0x020000000000 + index), "message": "⚠️ Şüpheli"})
+    directory = tempfile.mkdtemp(prefix="arp-state-")
+    path = os.path.join(directory, "state.bin")
+    try:
+        checkpoint = StateCheckpoint(path, engine, {"ui": manager}, gateway_source=lambda: "10.0.0.1")
+        started = time.perf_counter()
+        size = checkpoint.save()
+        print(f"📊 Kayıt: {size / 1e6:.1f} MB, {(time.perf_counter() - started) * 1000:.1f} ms")
+
+        restored = StateCheckpoint(path, RuleEngine([]), {"ui": AlertManager()})
+        summary = restored.load()
+        bindings = restored.engine.bindings()
+        started = time.perf_counter()
+        bindings.get(int_to_ip(0x0A000000 + args.entries // 2))
+        lookup_us = (time.perf_counter() - started) * 1e6
+        print(f"📊 Yükleme: {summary['bindings']} bağlama, {summary['alert_states']} uyarı durumu, "
+              f"{summary['load_ms']:.2f} ms; ilk arama {lookup_us:.1f} µs")
+        started = time.perf_counter()
+        restored.save()
+        print(f"📊 Yüklenen durumu yeniden kayıt: {(time.perf_counter() - started) * 1000:.1f} ms")
+    finally:
+        for name in os.listdir(directory):
+            os.unlink(os.path.join(directory, name))
+        os.rmdir(directory)
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - Ağ Geçidi Bekçisi (Watchdog)
+Başlangıçta öğrenilen ağ geçidi IP/MAC eşleşmesini sabitler ve yalnızca bu komşu kaydını
+saniyede birkaç kez kontrol eder. Tam tablo dökümü ve 'ip route' çağrısı gerektirmez;
+ilk farklılıkta milisaniyeler içinde uyarı üretir.
+"""
+
+import os
+import re
+import socket
+import struct
+import subprocess
+import threading
+import time
+
+PROC_ARP_PATH = "/proc/net/arp"
+PROC_ROUTE_PATH = "/proc/net/route"
+
+# Tamamlanmamış komşu kayıtlarında görülen MAC adresi
+INCOMPLETE_MAC = "00:00:00:00:00:00"
+
+
+# Yönlendirme tablosu çıktısından varsayılan rotayı ayıklama
+def parse_default_route(output):
+    """
+    'ip route', 'netstat -rn' (macOS/BSD) veya 'route print' (Windows) çıktısından
+    varsayılan ağ geçidinin IP adresini bulur.
+
+    Args:
+        output (str): Komut çıktısı
+
+    Returns:
+        str: Ağ geçidi IP adresi, bulunamazsa None
+    """
+    ipv4 = r'(\d+\.\d+\.\d+\.\d+)'
+    patterns = (
+        r'^default via ' + ipv4,                # ip route
+        r'^default\s+' + ipv4,                  # netstat -rn
+        r'^0\.0\.0\.0\s+0\.0\.0\.0\s+' + ipv4,  # route print
+    )
+    for line in output.splitlines():
+        line = line.strip()
+        for pattern in patterns:
+            match = re.match(pattern, line)
+            if match:
+                return match.group(1)
+    return None
+
+
+# /proc/net/route üzerinden varsayılan ağ geçidini okuma
+def read_default_gateway_ip(route_path=PROC_ROUTE_PATH):
+    """
+    Varsayılan ağ geçidinin IP adresini alt süreç çalıştırmadan okur.
+    /proc/net/route yoksa (Linux dışı sistemler) yönlendirme tablosu komutlarına başvurulur:
+    Linux'ta 'ip route', Windows'ta 'route print', macOS/BSD'de 'netstat -rn'.
+
+    Returns:
+        str: Ağ geçidi IP adresi, bulunamazsa None
+    """
+    try:
+        with open(route_path) as route_file:
+            next(route_file, None)  # Başlık satırını atla
+            for line in route_file:
+                fields = line.split()
+                # Hedef 00000000 ve RTF_GATEWAY (0x2) bayrağı: varsayılan rota
+                if len(fields) >= 4 and fields[1] == "00000000" and int(fields[3], 16) & 0x2:
+                    return socket.inet_ntoa(struct.pack("<L", int(fields[2], 16)))
+    except (OSError, ValueError):
+        pass
+
+    if os.name == 'nt':  # Windows
+        commands = (["route", "print", "-4"],)
+    else:  # Linux / macOS / BSD
+        commands = (["ip", "route"], ["netstat", "-rn", "-f", "inet"])
+    for command in commands:
+        try:
+            output = subprocess.check_output(command, text=True, timeout=2)
+        except (OSError, subprocess.SubprocessError):
+            continue
+        gateway_ip = parse_default_route(output)
+        if gateway_ip:
+            return gateway_ip
+    return None
+
+
+# Tek bir komşu kaydını okuma
+def read_neighbor_mac(ip, arp_path=PROC_ARP_PATH):
+    """
+    Verilen IP için komşu önbelleğindeki MAC adresini döndürür.
+    Linux'ta /proc/net/arp doğrudan okunur; diğer sistemlerde yalnızca bu IP için
+    'arp' komutu çalıştırılır.
+
+    Args:
+        ip (str): Aranacak IP adresi
+
+    Returns:
+        str: Küçük harfli MAC adresi, kayıt yoksa veya eksikse None
+    """
+    if os.path.exists(arp_path):
+        prefix = ip + " "
+        with open(arp_path) as arp_file:
+            for line in arp_file:
+                if line.startswith(prefix):
+                    fields = line.split()
+                    # Flags 0x0: kayıt tamamlanmamış
+                    if len(fields) >= 4 and fields[2] != "0x0" and fields[3] != INCOMPLETE_MAC:
+                        return fields[3].lower()
+                    return None
+        return None
+
+    try:
+        if os.name == 'nt':  # Windows
+            output = subprocess.check_output(['arp', '-a', ip], text=True, timeout=2)
+        else:  # macOS / BSD
+            output = subprocess.check_output(['arp', '-n', ip], text=True, timeout=2)
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    match = re.search(r'([0-9a-fA-F]{1,2}(?:[-:][0-9a-fA-F]{1,2}){5})', output)
+    if not match:
+        return None
+    # macOS baştaki sıfırları atar (ör. 0:1:2:...), standart biçime getir
+    parts = re.split(r'[-:]', match.group(1).lower())
+    return ':'.join(part.zfill(2) for part in parts)
+
+
+# /proc/net/arp tablosunun tamamını okuma
+def read_proc_arp_table(arp_path=PROC_ARP_PATH):
+    """
+    Komşu önbelleğinin tamamını alt süreç çalıştırmadan okur (yalnızca Linux).
+
+    Returns:
+        list: get_arp_table() ile aynı biçimde kayıtlar; dosya yoksa None
+    """
+    if not os.path.exists(arp_path):
+        return None
+    entries = []
+    with open(arp_path) as arp_file:
+        next(arp_file, None)  # Başlık satırını atla
+        for line in arp_file:
+            fields = line.split()
+            # Alanlar: IP, HW türü, bayraklar, MAC, maske, arayüz
+            if len(fields) >= 6 and fields[2] != "0x0" and fields[3] != INCOMPLETE_MAC:
+                entries.append({"ip": fields[0], "mac": fields[3].lower(), "interface": fields[5]})
+    return entries
+
+
+class GatewayWatchdog:
+    """
+    Ağ geçidinin MAC adresini yüksek sıklıkla izleyen hafif bekçi.
+
+    Başlangıçta ağ geçidi IP/MAC çifti sabitlenir (pin). Sonraki her kontrolde yalnızca bu
+    IP'nin komşu kaydı okunur; MAC farklıysa uyarı üretilir. Aynı farklılık için tekrar uyarı
+    verilmez, MAC sabitlenen değere dönerse bekçi yeniden kurulur.
+    """
+
+    def __init__(self, gateway_ip=None, gateway_mac=None, interval=0.2, on_alert=None,
+                 lookup=read_neighbor_mac, baseline=None):
+        """
+        Args:
+            gateway_ip (str): İzlenecek IP. None ise varsayılan ağ geçidi kullanılır.
+            gateway_mac (str): Beklenen MAC. None ise ilk okumada öğrenilir.
+            interval (float): Kontroller arası süre (saniye)
+            on_alert (callable): Uyarı sözlüğü ile çağrılacak fonksiyon
+            lookup (callable): IP -> MAC okuma fonksiyonu
+            baseline (TrustedBaseline): Verilirse beklenen MAC öğrenilmez, temel çizgiden alınır
+                ve dosya değiştiğinde güncellenir
+        """
+        self.gateway_ip = gateway_ip
+        self.gateway_mac = gateway_mac.lower() if gateway_mac else None
+        self.interval = interval
+        self.on_alert = on_alert
+        self.lookup = lookup
+        self.baseline = baseline
+
+        self.checks = 0
+        self.last_check_ms = 0.0
+        self.last_seen_mac = None
+        self._last_ok = None
+        self._alerted = False
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def pin(self):
+        """
+        Ağ geçidi IP ve MAC adresini öğrenir ve sabitler.
+
+        Returns:
+            bool: Sabitleme başarılıysa True
+        """
+        if not self.gateway_ip:
+            self.gateway_ip = read_default_gateway_ip()
+        if self.gateway_ip and self.baseline is not None:
+            # İlk görüşte güvenme (TOFU) yerine temel çizgideki MAC sabitlenir
+            self.gateway_mac = self.baseline.expected_mac(self.gateway_ip) or self.gateway_mac
+        if self.gateway_ip and not self.gateway_mac:
+            self.gateway_mac = self.lookup(self.gateway_ip)
+        self._last_ok = time.monotonic()
+        return bool(self.gateway_ip and self.gateway_mac)
+
+    def check_once(self):
+        """
+        Ağ geçidi kaydını bir kez kontrol eder.
+
+        Returns:
+            dict: Farklılık ilk kez görüldüyse uyarı sözlüğü, aksi halde None
+
+        Raises:
+            ValueError: İzlenecek ağ geçidi IP adresi yoksa
+        """
+        if not self.gateway_ip:
+            raise ValueError("Ağ geçidi IP adresi yok (varsayılan rota bulunamadı)")
+        if self.baseline is not None and self.baseline.reload_if_changed():
+            self.gateway_mac = self.baseline.expected_mac(self.gateway_ip) or self.gateway_mac
+            self._alerted = False
+        started = time.monotonic()
+        mac = self.lookup(self.gateway_ip)
+        finished = time.monotonic()
+        self.checks += 1
+        self.last_check_ms = (finished - started) * 1000
+        self.last_seen_mac = mac
+
+        # Kayıt geçici olarak yoksa (ör. yeniden çözümleme) uyarı verme
+        if mac is None or mac == self.gateway_mac:
+            self._last_ok = finished
+            self._alerted = False
+            return None
+
+        if self._alerted:
+            return None
+        self._alerted = True
+
+        # Değişiklik, son başarılı kontrol ile bu kontrol arasında bir anda oldu
+        latency_ms = (finished - (self._last_ok or started)) * 1000
+        return {
+            "type": "gateway_mac_changed",
+            "ip": self.gateway_ip,
+            "mac": mac,
+            "expected_mac": self.gateway_mac,
+            "latency_ms": latency_ms,
+            "check_ms": self.last_check_ms,
+            "message": f"❌ TEHLİKE: Ağ geçidi {self.gateway_ip} MAC adresi değişti: "
+                       f"{self.gateway_mac} -> {mac} (en geç {latency_ms:.1f} ms içinde tespit edildi)"
+        }
+
+    def run(self):
+        """Durdurulana kadar kontrol döngüsünü çalıştırır."""
+        while not self._stop_event.is_set():
+            alert = self.check_once()
+            if alert and self.on_alert:
+                self.on_alert(alert)
+            self._stop_event.wait(self.interval)
+
+    def start(self):
+        """Bekçiyi arka plan thread'inde başlatır."""
+        # MAC verilmiş olsa da IP yoksa (varsayılan rota yok) önce öğrenilmesi gerekir
+        if (not self.gateway_ip or self.gateway_mac is None) and not self.pin():
+            return False
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """Bekçiyi durdurur."""
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(1.0)
+
+
+def watchdog_main(interval=0.2, baseline=None, state=None, event_writer=None):
+    """
+    Komut satırından bekçi modunu çalıştırır (--watchdog).
+
+    Args:
+        interval (float): Kontroller arası süre (saniye)
+        baseline (TrustedBaseline): Ağ geçidinin güvenilir MAC'ini sağlayan temel çizgi
+        state (StateCheckpoint): Yüklenmiş kontrol noktası; önceki çalışmada sabitlenen MAC
+            yeniden öğrenilmeden kullanılır ve sabitlenen çift kaydedilir
+        event_writer (EventWriter): Verilirse uyarılar ayrıca JSON Lines/syslog/webhook/pano
+            çıkışlarına yazılır (gözetimsiz sensör kullanımı)
+
+    Returns:
+        int: Çıkış kodu
+    """
+    gateway_ip = read_default_gateway_ip()
+    if not gateway_ip:
+        print("❌ Varsayılan ağ geçidi bulunamadı (varsayılan rota yok), bekçi modu başlatılamıyor.")
+        return 1
+    restored_mac = state.gateway_mac_for(gateway_ip) if state is not None else None
+    watchdog = GatewayWatchdog(gateway_ip, restored_mac, interval=interval, baseline=baseline)
+    if not watchdog.pin():
+        print("❌ Ağ geçidi IP/MAC adresi öğrenilemedi, bekçi modu başlatılamıyor.")
+        return 1
+    if state is not None:
+        state.watchdog = watchdog
+        if restored_mac and watchdog.gateway_mac == restored_mac:
+            print("📌 Bilgi: Ağ geçidi MAC'i önceki çalışmadan alındı (yeniden öğrenilmedi).")
+
+    print(f"🛡️  Ağ geçidi bekçisi aktif: {watchdog.gateway_ip} -> {watchdog.gateway_mac}")
+    print(f"ℹ️  Kontrol aralığı: {int(interval * 1000)} ms. Durdurmak için Ctrl+C.")
+    def on_alert(alert):
+        print(alert["message"], flush=True)
+        if event_writer is not None:
+            event_writer.emit(alert)
+
+    watchdog.on_alert = on_alert
+    try:
+        watchdog.run()
+    except KeyboardInterrupt:
+        print(f"\n👋 Bekçi durduruldu. Toplam kontrol: {watchdog.checks}")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(watchdog_main())
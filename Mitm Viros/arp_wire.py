@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - İkili Tablo Biçimi
+Komşu tablolarını 'struct' ile sabit genişlikli kayıtlara paketler: 4 bayt IPv4, 6 bayt MAC,
+arayüz kimliği, bayraklar ve zaman damgası. Bir önceki tabloya göre fark (delta) kodlaması
+desteklenir. Kayıtlar 'memoryview' üzerinden kopyalanmadan okunur; biçim geçmiş arşivleri,
+ajan -> toplayıcı iletimi ve test verileri için kullanılır.
+
+Düzen (little-endian):
+    Başlık : magic(4) sürüm(B) tür(B) arayüz_sayısı(H) eklenen(I) silinen(I) zaman(d)
+    Arayüz : uzunluk(B) + UTF-8 ad, arayüz_sayısı kadar
+    Kayıt  : ip(4s) mac(6s) arayüz_id(H) bayrak(B) boşluk(x) zaman_farkı(i) - önce eklenenler,
+             sonra silinenler; zaman farkı başlık zamanına göre işaretli saniyedir (başlıktan
+             önce görülen kayıtlar negatif)
+"""
+
+import math
+import mmap
+import os
+import re
+import socket
+import struct
+import time
+
+MAGIC = b"ARPS"
+VERSION = 1
+
+KIND_FULL = 0
+KIND_DELTA = 1
+
+# Kayıt bayrakları
+FLAG_STATIC = 0x01
+FLAG_GATEWAY = 0x02
+FLAG_INCOMPLETE = 0x04
+
+HEADER = struct.Struct("<4sBBHIId")
+RECORD = struct.Struct("<4s6sHBxi")
+OFFSET_RANGE = range(-2 ** 31, 2 ** 31)
+MAC_OCTET = re.compile(r"[0-9a-fA-F]{1,2}")
+
+
+class WireFormatError(ValueError):
+    """İkili veri beklenen biçimde değilse fırlatılır."""
+
+
+def _pack_ip(ip):
+    return socket.inet_aton(ip)
+
+
+def _pack_mac(mac):
+    """
+    MAC adresini 6 bayta çevirir. Baştaki sıfırları atılmış oktetler (macOS: 0:1:2:...)
+    kabul edilir; eksik veya fazla oktet sessizce doldurulmaz.
+
+    Raises:
+        WireFormatError: Geçersiz MAC adresi
+    """
+    text = mac.replace("-", ":")
+    octets = text.split(":") if ":" in text else [text[index:index + 2] for index in range(0, len(text), 2)]
+    try:
+        if len(octets) != 6 or not all(MAC_OCTET.fullmatch(octet) for octet in octets):
+            raise ValueError
+        return bytes(int(octet, 16) for octet in octets)
+    except ValueError:
+        raise WireFormatError(f"Geçersiz MAC adresi: {mac!r}") from None
+
+
+def check_entry(entry):
+    """
+    Kaydın kabloya yazılabildiğini doğrular (IP ve MAC ayrıştırılabiliyor mu).
+
+    Raises:
+        WireFormatError: Geçersiz IP veya MAC adresi
+    """
+    try:
+        _pack_ip(entry["ip"])
+    except OSError:
+        raise WireFormatError(f"Geçersiz IP adresi: {entry['ip']!r}") from None
+    _pack_mac(entry["mac"])
+
+
+def _row_key(entry):
+    return (entry["ip"], entry["mac"].lower(), entry.get("interface", ""))
+
+
+def _encode(kind, added, removed, timestamp):
+    if timestamp is None:
+        timestamp = time.time()
+
+    # Arayüz adları bir kez yazılır, kayıtlar yalnızca kimliklerini taşır
+    interfaces = {}
+    for entry in list(added) + list(removed):
+        interfaces.setdefault(entry.get("interface", ""), len(interfaces))
+
+    parts = [HEADER.pack(MAGIC, VERSION, kind, len(interfaces), len(added), len(removed), timestamp)]
+    for name in interfaces:
+        encoded = name.encode("utf-8")[:255]
+        parts.append(struct.pack("<B", len(encoded)) + encoded)
+
+    base = int(timestamp)
+    for entry in list(added) + list(removed):
+        seen_offset = int(entry.get("timestamp", base)) - base
+        if seen_offset not in OFFSET_RANGE:
+            raise WireFormatError(f"Kayıt zamanı başlık zamanından çok uzak: {entry['ip']}")
+        parts.append(RECORD.pack(_pack_ip(entry["ip"]), _pack_mac(entry["mac"]),
+                                 interfaces[entry.get("interface", "")],
+                                 entry.get("flags", 0), seen_offset))
+    return b"".join(parts)
+
+
+def encode_snapshot(arp_table, timestamp=None):
+    """
+    ARP tablosunun tamamını ikili biçime kodlar.
+
+    Args:
+        arp_table (list): ARP tablosu kayıtları ({"ip", "mac", "interface"} ve isteğe bağlı
+            "flags", "timestamp")
+        timestamp (float): Anlık görüntü zamanı (varsayılan: şimdi)
+
+    Returns:
+        bytes: Kodlanmış anlık görüntü
+    """
+    return _encode(KIND_FULL, list(arp_table), [], timestamp)
+
+
+def encode_delta(previous, current, timestamp=None):
+    """
+    İki tablo arasındaki farkı ikili biçime kodlar.
+
+    Args:
+        previous (list): Önceki ARP tablosu
+        current (list): Güncel ARP tablosu
+        timestamp (float): Fark zamanı (varsayılan: şimdi)
+
+    Returns:
+        bytes: Kodlanmış fark
+    """
+    previous_rows = {_row_key(entry): entry for entry in previous}
+    current_rows = {_row_key(entry): entry for entry in current}
+    added = [entry for key, entry in current_rows.items() if key not in previous_rows]
+    removed = [entry for key, entry in previous_rows.items() if key not in current_rows]
+    return _encode(KIND_DELTA, added, removed, timestamp)
+
+
+def parse_header(buffer):
+    """
+    Başlığı ve arayüz tablosunu ayrıştırır.
+
+    Args:
+        buffer (bytes | memoryview | mmap): Kodlanmış veri
+
+    Returns:
+        tuple: (tür, zaman, arayüz adları, eklenen sayısı, silinen sayısı, kayıtların başlangıcı)
+
+    Raises:
+        WireFormatError: Veri kısa, bozuk veya desteklenmeyen sürümde
+    """
+    view = memoryview(buffer)
+    if len(view) < HEADER.size:
+        raise WireFormatError("Veri başlık için çok kısa")
+    magic, version, kind, interface_count, added, removed, timestamp = HEADER.unpack_from(view, 0)
+    if magic != MAGIC or version != VERSION:
+        raise WireFormatError("Bilinmeyen biçim veya sürüm")
+    if kind not in (KIND_FULL, KIND_DELTA):
+        raise WireFormatError(f"Bilinmeyen kayıt türü: {kind}")
+    if not math.isfinite(timestamp):
+        raise WireFormatError("Geçersiz zaman damgası")
+
+    offset = HEADER.size
+    interfaces = []
+    for _ in range(interface_count):
+        if offset >= len(view) or offset + 1 + view[offset] > len(view):
+            raise WireFormatError("Arayüz tablosu eksik")
+        length = view[offset]
+        try:
+            interfaces.append(bytes(view[offset + 1:offset + 1 + length]).decode("utf-8"))
+        except UnicodeDecodeError:
+            raise WireFormatError("Arayüz adı UTF-8 değil") from None
+        offset += 1 + length
+
+    if len(view) < offset + (added + removed) * RECORD.size:
+        raise WireFormatError("Kayıtlar eksik")
+    return kind, timestamp, interfaces, added, removed, offset
+
+
+def iter_records(buffer):
+    """
+    Kayıtları sözlük oluşturmadan, ham demetler olarak döndürür.
+
+    Yields:
+        tuple: (silindi_mi, ip_bayt, mac_bayt, arayüz_id, bayrak, zaman_farkı)
+    """
+    kind, timestamp, interfaces, added, removed, offset = parse_header(buffer)
+    view = memoryview(buffer)[offset:offset + (added + removed) * RECORD.size]
+    for index, record in enumerate(RECORD.iter_unpack(view)):
+        yield (index >= added,) + record
+
+
+def decode(buffer):
+    """
+    Kodlanmış anlık görüntüyü veya farkı çözer.
+
+    Args:
+        buffer (bytes | memoryview | mmap): Kodlanmış veri
+
+    Returns:
+        dict: {"kind", "timestamp", "added": list, "removed": list}; listelerdeki kayıtlar
+              get_arp_table() ile aynı biçimdedir ("flags" ve "timestamp" eklenmiş olarak)
+
+    Raises:
+        WireFormatError: Veri bozuksa (her çözme hatası bu türle bildirilir)
+    """
+    kind, timestamp, interfaces, added_count, removed_count, offset = parse_header(buffer)
+    view = memoryview(buffer)[offset:offset + (added_count + removed_count) * RECORD.size]
+    base = int(timestamp)
+    ntoa = socket.inet_ntoa
+
+    try:
+        entries = [
+            {"ip": ntoa(ip), "mac": mac.hex(":"), "interface": interfaces[interface_id],
+             "flags": flags, "timestamp": base + offset_seconds}
+            for ip, mac, interface_id, flags, offset_seconds in RECORD.iter_unpack(view)
+        ]
+    except IndexError:
+        raise WireFormatError("Kayıt tanımsız bir arayüze başvuruyor") from None
+    return {
+        "kind": kind,
+        "timestamp": timestamp,
+        "added": entries[:added_count],
+        "removed": entries[added_count:],
+    }
+
+
+def apply_delta(previous, delta):
+    """
+    Çözülmüş bir farkı önceki tabloya uygular.
+
+    Args:
+        previous (list): Önceki ARP tablosu
+        delta (dict): decode() çıktısı
+
+    Returns:
+        list: Güncel ARP tablosu
+    """
+    if delta["kind"] == KIND_FULL:
+        return list(delta["added"])
+    removed = {_row_key(entry) for entry in delta["removed"]}
+    table = [entry for entry in previous if _row_key(entry) not in removed]
+    table.extend(delta["added"])
+    return table
+
+
+def save_snapshot(path, arp_table, timestamp=None):
+    """Tabloyu dosyaya atomik olarak (geçici dosya + yeniden adlandırma) kaydeder."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as snapshot_file:
+        snapshot_file.write(encode_snapshot(arp_table, timestamp))
+    os.replace(temp_path, path)
+
+
+def load_snapshot(path):
+    """
+    Dosyadaki anlık görüntüyü bellek eşlemeli (mmap) olarak okuyup çözer.
+
+    Returns:
+        dict: decode() çıktısı
+    """
+    with open(path, "rb") as snapshot_file:
+        with mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return decode(mapped)
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Spoofing Tespit Aracı - DHCP Snooping Kira Tablosu
+Yakalanan trafikteki DHCP ACK ve RELEASE mesajlarını pasif olarak çözer ve IP -> MAC
+kiralarını (bitiş zamanıyla) indeksli bir tabloda tutar. Her ARP gözlemi bu tabloya O(1)
+aramayla doğrulanır: kirası ve statik izin kaydı olmayan bağlamalar yüksek güvenle
+işaretlenir. Böylece router ile saldırganı ayırt edemeyen sezgisel kurallara (.1/.254,
+MAC başına 3 IP) gerek kalmaz.
+
+Statik izin listesi (router, sunucular gibi DHCP dışı adresler) temel çizgi dosyasıyla aynı
+biçimdedir ("IP MAC" satırları; "multi" satırları yok sayılır).
+
+Kullanım:
+    python dhcp_snooping.py --interface eth0
+    python dhcp_snooping.py --pcap yakalama.pcap
+    python arp_spoofing_detector.py --dhcp-static statik.txt --dhcp-learning 3600
+"""
+
+import argparse
+import socket
+import struct
+import threading
+import time
+
+from arp_baseline import parse_baseline
+from arp_capture import decode_udp, open_capture_socket, iter_live_frames, iter_pcap
+
+DHCP_SERVER_PORT = 67
+DHCP_CLIENT_PORT = 68
+DHCP_MAGIC_COOKIE = b"\x63\x82\x53\x63"
+
+# DHCP mesaj türleri (seçenek 53)
+DHCPDISCOVER = 1
+DHCPOFFER = 2
+DHCPREQUEST = 3
+DHCPDECLINE = 4
+DHCPACK = 5
+DHCPNAK = 6
+DHCPRELEASE = 7
+DHCPINFORM = 8
+
+OPTION_REQUESTED_IP = 50
+OPTION_LEASE_TIME = 51
+OPTION_MESSAGE_TYPE = 53
+OPTION_SERVER_ID = 54
+OPTION_PAD = 0
+OPTION_END = 255
+
+BOOTP_HEADER = struct.Struct("!BBBBIHH4s4s4s4s16s")
+
+# En uzun tipik kira süresi: bu kadar gözlemden önce "kira yok" uyarısı verilmez
+DEFAULT_LEARNING_PERIOD = 86400.0
+
+# Doğrulama sonuçları
+BINDING_LEASED = "leased"
+BINDING_STATIC = "static"
+BINDING_MISMATCH = "mismatch"
+BINDING_EXPIRED = "expired"
+BINDING_UNKNOWN = "unknown"
+
+
+def decode_dhcp(payload):
+    """
+    BOOTP/DHCP yükünü çözer.
+
+    Args:
+        payload (bytes): UDP yükü
+
+    Returns:
+        dict: {"op", "xid", "mac", "ciaddr", "yiaddr", "type", "lease_time", "requested_ip",
+               "server_id"}; DHCP değilse None
+    """
+    if len(payload) < BOOTP_HEADER.size + 192 + 4:
+        return None
+    (op, htype, hlen, _, xid, _, _, ciaddr, yiaddr, _, _, chaddr) = BOOTP_HEADER.unpack_from(payload, 0)
+    options_offset = BOOTP_HEADER.size + 192  # sname(64) + file(128)
+    if htype != 1 or hlen != 6 or bytes(payload[options_offset:options_offset + 4]) != DHCP_MAGIC_COOKIE:
+        return None
+
+    message = {
+        "op": op,
+        "xid": xid,
+        "mac": bytes(chaddr[:6]).hex(":"),
+        "ciaddr": socket.inet_ntoa(ciaddr),
+        "yiaddr": socket.inet_ntoa(yiaddr),
+        "type": None,
+        "lease_time": None,
+        "requested_ip": None,
+        "server_id": None,
+    }
+
+    offset = options_offset + 4
+    while offset < len(payload):
+        code = payload[offset]
+        if code == OPTION_END:
+            break
+        if code == OPTION_PAD:
+            offset += 1
+            continue
+        if offset + 1 >= len(payload):
+            break
+        length = payload[offset + 1]
+        value = bytes(payload[offset + 2:offset + 2 + length])
+        offset += 2 + length
+        if len(value) < length:
+            break
+        if code == OPTION_MESSAGE_TYPE and length == 1:
+            message["type"] = value[0]
+        elif code == OPTION_LEASE_TIME and length == 4:
+            message["lease_time"] = struct.unpack("!I", value)[0]
+        elif code == OPTION_REQUESTED_IP and length == 4:
+            message["requested_ip"] = socket.inet_ntoa(value)
+        elif code == OPTION_SERVER_ID and length == 4:
+            message["server_id"] = socket.inet_ntoa(value)
+
+    return message if message["type"] is not None else None
+
+
+def load_static_bindings(path):
+    """
+    Statik izin listesini temel çizgi biçimindeki dosyadan okur.
+
+    Returns:
+        dict: {ip: mac}
+
+    Raises:
+        OSError, ValueError: Dosya okunamazsa veya geçersizse
+    """
+    with open(path, encoding="utf-8") as static_file:
+        bindings, _ = parse_baseline(static_file)
+    return bindings
+
+
+class DhcpLeaseTable:
+    """
+    DHCP kiralarından oluşan IP -> (MAC, bitiş) indeksi ve statik izin listesi.
+
+    Kira tablosu ancak en uzun kira süresi kadar gözlem yapıldıktan sonra eksiksiz kabul
+    edilebilir. Bu öğrenme süresi dolana kadar "kira yok" durumları raporlanmaz; MAC
+    uyuşmazlıkları ise her zaman raporlanır.
+    """
+
+    def __init__(self, static_bindings=None, learning_period=DEFAULT_LEARNING_PERIOD, clock=time.time):
+        """
+        Args:
+            static_bindings (dict): Statik izin listesi {ip: mac} (ör. router, sunucular)
+            learning_period (float): "Kira yok" uyarılarından önceki öğrenme süresi (saniye)
+            clock (callable): Zaman kaynağı
+        """
+        self.leases = {}  # ip -> (mac, bitiş zamanı)
+        self.static = {ip: mac.lower() for ip, mac in (static_bindings or {}).items()}
+        self.clock = clock
+        self.learning_until = clock() + learning_period
+        self.lock = threading.Lock()
+        self.acks = 0
+        self.releases = 0
+
+    def observe(self, message, now=None):
+        """
+        Çözülmüş bir DHCP mesajını tabloya işler (yalnızca ACK ve RELEASE).
+
+        Args:
+            message (dict): decode_dhcp() çıktısı
+            now (float): Gözlem zamanı (varsayılan: şimdi)
+        """
+        if now is None:
+            now = self.clock()
+        with self.lock:
+            if message["type"] == DHCPACK and message["yiaddr"] != "0.0.0.0":
+                # INFORM'a verilen ACK'ler kira içermez (yiaddr 0.0.0.0)
+                lease_time = message["lease_time"] if message["lease_time"] is not None else 3600
+                self.leases[message["yiaddr"]] = (message["mac"], now + lease_time)
+                self.acks += 1
+            elif message["type"] == DHCPRELEASE:
+                lease = self.leases.get(message["ciaddr"])
+                if lease and lease[0] == message["mac"]:
+                    del self.leases[message["ciaddr"]]
+                self.releases += 1
+
+    def lookup(self, ip, mac, now=None):
+        """
+        Bir IP/MAC bağlamasını kira tablosuna göre doğrular (O(1)). Kira kaydı kilit altında
+        okunur; snooping thread'i kirayı aynı anda silse de sonuç tutarlıdır.
+
+        Returns:
+            tuple: (durum, beklenen MAC); durum BINDING_LEASED, BINDING_STATIC,
+                   BINDING_MISMATCH, BINDING_EXPIRED veya BINDING_UNKNOWN, beklenen MAC
+                   yoksa None
+        """
+        mac = mac.lower()
+        static_mac = self.static.get(ip)
+        if static_mac is not None:
+            return (BINDING_STATIC if static_mac == mac else BINDING_MISMATCH), static_mac
+        with self.lock:
+            lease = self.leases.get(ip)
+        if lease is None:
+            return BINDING_UNKNOWN, None
+        if lease[0] != mac:
+            return BINDING_MISMATCH, lease[0]
+        if lease[1] < (self.clock() if now is None else now):
+            return BINDING_EXPIRED, lease[0]
+        return BINDING_LEASED, lease[0]
+
+    def validate(self, ip, mac, now=None):
+        """
+        Bir IP/MAC bağlamasını kira tablosuna göre doğrular (O(1)).
+
+        Returns:
+            str: BINDING_LEASED, BINDING_STATIC, BINDING_MISMATCH, BINDING_EXPIRED veya
+                 BINDING_UNKNOWN
+        """
+        return self.lookup(ip, mac, now)[0]
+
+    def is_learning(self, now=None):
+        """Öğrenme süresi henüz dolmadıysa True döndürür."""
+        return (self.clock() if now is None else now) < self.learning_until
+
+    def check_binding(self, ip, mac, now=None):
+        """
+        Bir bağlamayı doğrular ve gerekiyorsa bulgu üretir.
+
+        Returns:
+            dict: Bulgu sözlüğü veya bağlama geçerliyse None
+        """
+        status, expected = self.lookup(ip, mac, now)
+        if status == BINDING_MISMATCH:
+            return {
+                "type": "dhcp_lease_mismatch",
+                "ip": ip,
+                "mac": mac,
+                "expected_mac": expected,
+                "message": f"❌ TEHLİKE: {ip} IP adresi {mac} MAC adresinde görülüyor, ancak DHCP kirası/statik kayıt {expected} adresine ait!"
+            }
+        if status in (BINDING_UNKNOWN, BINDING_EXPIRED) and not self.is_learning(now):
+            reason = "süresi dolmuş kira" if status == BINDING_EXPIRED else "DHCP kirası veya statik kayıt yok"
+            return {
+                "type": "dhcp_no_lease",
+                "ip": ip,
+                "mac": mac,
+                "message": f"⚠️ Şüpheli: {ip} -> {mac} bağlaması için {reason}"
+            }
+        return None
+
+
+class DhcpSnooper:
+    """Canlı trafikten DHCP mesajlarını dinleyip kira tablosunu güncelleyen arka plan thread'i."""
+
+    def __init__(self, lease_table, interface=None):
+        self.lease_table = lease_table
+        self.interface = interface
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def process_frame(self, frame, now=None):
+        """Tek bir Ethernet çerçevesini işler; DHCP mesajıysa tabloya ekler."""
+        udp = decode_udp(frame)
+        if udp is None:
+            return None
+        source_port, destination_port = udp[3], udp[4]
+        dhcp_ports = (DHCP_SERVER_PORT, DHCP_CLIENT_PORT)
+        if source_port not in dhcp_ports or destination_port not in dhcp_ports:
+            return None
+        message = decode_dhcp(udp[5])
+        if message is not None:
+            self.lease_table.observe(message, now)
+        return message
+
+    def run_check(self):
+        """
+        Yakalama soketinin açılabildiğini doğrular.
+
+        Raises:
+            OSError: Platform desteklemiyorsa veya yetki yoksa
+        """
+        open_capture_socket(self.interface).close()
+
+    def run(self):
+        """Durdurulana kadar yakalama döngüsünü çalıştırır."""
+        capture = open_capture_socket(self.interface)
+        try:
+            for timestamp, frame in iter_live_frames(capture, self._stop_event):
+                self.process_frame(frame, timestamp)
+        finally:
+            capture.close()
+
+    def start(self):
+        """Dinleyiciyi arka planda başlatır."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Dinleyiciyi durdurur."""
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(1.0)
+
+
+def main(argv=None):
+    """Komut satırından DHCP kiralarını izler ve yazdırır."""
+    parser = argparse.ArgumentParser(description="ARP Spoofing Tespit Aracı - DHCP snooping")
+    parser.add_argument("--interface", default=None, help="Canlı yakalama arayüzü")
+    parser.add_argument("--pcap", default=None, help="Okunacak pcap dosyası")
+    args = parser.parse_args(argv)
+
+    lease_table = DhcpLeaseTable()
+    snooper = DhcpSnooper(lease_table, args.interface)
+    if args.pcap:
+        frames = iter_pcap(args.pcap)
+    else:
+        frames = iter_live_frames(open_capture_socket(args.interface))
+
+    names = {DHCPACK: "ACK", DHCPRELEASE: "RELEASE"}
+    try:
+        for timestamp, frame in frames:
+            message = snooper.process_frame(frame, timestamp)
+            if message and message["type"] in names:
+                ip = message["yiaddr"] if message["type"] == DHCPACK else message["ciaddr"]
+                print(f"📌 DHCP {names[message['type']]}: {ip} -> {message['mac']}", flush=True)
+    except KeyboardInterrupt:
+        pass
+    print(f"\n📊 Aktif kira sayısı: {len(lease_table.leases)}")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+
+"""Testler, 'Mitm Viros' dizinindeki modülleri doğrudan içe aktarır."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
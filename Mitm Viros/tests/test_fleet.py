@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+"""Filo toplayıcısı ve ajanının localhost üzerinde birlikte testi."""
+
+import asyncio
+import json
+
+import arp_fleet
+
+GATEWAY_MAC = "aa:aa:aa:aa:aa:01"
+
+
+def table(*rows):
+    return [{"ip": ip, "mac": mac, "interface": "eth0"} for ip, mac in rows]
+
+
+async def wait_for(condition, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "koşul zaman aşımına uğradı"
+        await asyncio.sleep(0.01)
+
+
+def multi_segment(aggregator):
+    return [finding for finding in aggregator.active_findings()
+            if finding["type"] == "fleet_gateway_multi_segment"]
+
+
+def test_agents_report_and_clear_gateway_multi_segment():
+    async def scenario():
+        aggregator = arp_fleet.FleetAggregator()
+        server = await aggregator.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        tables = {
+            "s1": table(("10.0.0.1", GATEWAY_MAC), ("10.0.0.20", "00:00:00:00:00:20")),
+            "s2": table(("10.0.1.1", GATEWAY_MAC)),
+        }
+        gateways = {"s1": "10.0.0.1", "s2": "10.0.1.1"}
+        agents = {sensor: arp_fleet.FleetAgent("127.0.0.1", port, sensor, interval=0.02,
+                                               table_source=lambda sensor=sensor: tables[sensor],
+                                               gateway_source=lambda sensor=sensor: gateways[sensor])
+                  for sensor in tables}
+        tasks = {sensor: asyncio.ensure_future(agent.run()) for sensor, agent in agents.items()}
+        try:
+            await wait_for(lambda: len(multi_segment(aggregator)) == 1)
+            assert multi_segment(aggregator)[0]["mac"] == GATEWAY_MAC
+
+            # s2'nin ağ geçidi başka bir MAC'e geçti: eski MAC'in bulgusu temizlenmeli
+            tables["s2"] = table(("10.0.1.1", "bb:bb:bb:bb:bb:01"))
+            await wait_for(lambda: not multi_segment(aggregator))
+
+            # Tekrar aynı MAC; ardından s2 bağlantısını kesince bulgu yine temizlenmeli
+            tables["s2"] = table(("10.0.1.1", GATEWAY_MAC))
+            await wait_for(lambda: len(multi_segment(aggregator)) == 1)
+            agents["s2"].running = False
+            tasks.pop("s2").cancel()
+            await wait_for(lambda: "s2" not in aggregator.sensors)
+            assert not multi_segment(aggregator)
+            assert set(aggregator.ip_index) == {"10.0.0.1", "10.0.0.20"}
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(scenario())
+
+
+def test_reused_private_range_conflicts_only_within_segment():
+    async def scenario():
+        aggregator = arp_fleet.FleetAggregator()
+        server = await aggregator.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        # İki site de 192.168.1.1'i ağ geçidi olarak kullanıyor, ama MAC'ler farklı
+        site_b_mac = "bb:bb:bb:bb:bb:01"
+        tables = {
+            "a1": table(("192.168.1.1", GATEWAY_MAC)),
+            "a2": table(("192.168.1.1", GATEWAY_MAC)),
+            "b1": table(("192.168.1.1", site_b_mac)),
+        }
+        gateway_macs = {"a1": GATEWAY_MAC, "a2": GATEWAY_MAC, "b1": site_b_mac}
+        agents = {sensor: arp_fleet.FleetAgent("127.0.0.1", port, sensor, interval=0.02,
+                                               table_source=lambda sensor=sensor: tables[sensor],
+                                               gateway_source=lambda: "192.168.1.1",
+                                               gateway_mac_source=lambda ip, sensor=sensor: gateway_macs[sensor])
+                  for sensor in tables}
+        tasks = {sensor: asyncio.ensure_future(agent.run()) for sensor, agent in agents.items()}
+
+        def conflicts():
+            return [finding for finding in aggregator.active_findings()
+                    if finding["type"] == "fleet_ip_conflict"]
+
+        try:
+            await wait_for(lambda: len(aggregator.sensors) == 3 and
+                           all(state["rows"] for state in aggregator.sensors.values()))
+            assert agents["a1"].segment == agents["a2"].segment != agents["b1"].segment
+            assert not conflicts()
+
+            # A sitesindeki bir sensör ağ geçidini saldırgan MAC'iyle görüyor
+            tables["a2"] = table(("192.168.1.1", "ee:ee:ee:ee:ee:01"))
+            await wait_for(lambda: len(conflicts()) == 1)
+            finding = conflicts()[0]
+            assert finding["macs"] == [GATEWAY_MAC, "ee:ee:ee:ee:ee:01"]
+            assert finding["segments"] == [agents["a1"].segment]
+            assert finding["message"].startswith("❌ TEHLİKE: Ağ geçidi 192.168.1.1")
+
+            tables["a2"] = table(("192.168.1.1", GATEWAY_MAC))
+            await wait_for(lambda: not conflicts())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(scenario())
+
+
+def test_malformed_delta_drops_only_that_sensor():
+    async def scenario():
+        aggregator = arp_fleet.FleetAggregator()
+        server = await aggregator.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            hello = json.dumps({"sensor": "bad", "gateway": "10.0.0.1"}).encode("utf-8")
+            writer.write(arp_fleet.encode_frame(arp_fleet.MESSAGE_HELLO, hello))
+            snapshot = bytearray(arp_fleet.arp_wire.encode_snapshot(table(("10.0.0.1", GATEWAY_MAC))))
+            snapshot[24] = 200  # Arayüz adı uzunluğu veri sonunu aşıyor
+            writer.write(arp_fleet.encode_frame(arp_fleet.MESSAGE_DELTA, bytes(snapshot)))
+            await writer.drain()
+
+            # Toplayıcı bağlantıyı kapatır ve sensörü görünümden çıkarır
+            assert await reader.read() == b""
+            await wait_for(lambda: not aggregator.sensors)
+            writer.close()
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(scenario())
+
+
+def test_agent_skips_unencodable_rows():
+    async def scenario():
+        aggregator = arp_fleet.FleetAggregator()
+        server = await aggregator.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        # Linux 'arp -n' çözümlenmemiş komşu satırı: MAC sütununda arayüz adı
+        rows = table(("10.0.0.1", GATEWAY_MAC), ("10.0.0.9", "eth0"), ("10.0.0.20", "00:00:00:00:00:20"))
+        agent = arp_fleet.FleetAgent("127.0.0.1", port, "s1", interval=0.02,
+                                     table_source=lambda: rows, gateway_source=lambda: "10.0.0.1")
+        task = asyncio.ensure_future(agent.run())
+        try:
+            await wait_for(lambda: set(aggregator.ip_index) == {"10.0.0.1", "10.0.0.20"})
+            assert not task.done()
+            assert agent.skipped_rows >= 1
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(scenario())
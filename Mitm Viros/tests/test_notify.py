@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""Webhook bildirimlerinin localhost üzerindeki sahte HTTP sunucusuyla testi."""
+
+import http.server
+import json
+import threading
+import time
+
+import pytest
+
+from arp_notify import WebhookNotifier
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.requests.append((time.monotonic(), body["events"]))
+            status, headers = server.responses.pop(0) if server.responses else (200, {})
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.responses = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}/arp"
+
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "koşul zaman aşımına uğradı"
+        time.sleep(0.01)
+
+
+def events(count, start=0):
+    return [{"type": "binding_changed", "ip": f"10.0.0.{index}"} for index in range(start, start + count)]
+
+
+def test_retry_after_is_honoured_then_delivered(stub_server):
+    stub_server.responses = [(503, {"Retry-After": "1"})]
+    notifier = WebhookNotifier([url(stub_server)], flush_interval=0.05, backoff_base=0.01)
+    try:
+        notifier.write_batch(events(3))
+        wait_for(lambda: notifier.stats[url(stub_server)]["delivered"] == 3)
+    finally:
+        notifier.close()
+
+    (failed_at, first), (delivered_at, second) = stub_server.requests
+    assert first == second == events(3)
+    # Geri çekilme (0,01 sn) yerine sunucunun istediği bekleme uygulanır
+    assert delivered_at - failed_at >= 0.9
+    assert notifier.stats[url(stub_server)]["pending"] == 0
+
+
+def test_outbox_is_replayed_after_restart(stub_server, tmp_path):
+    outbox = tmp_path / "giden.json"
+    stub_server.responses = [(503, {})] * 10
+    notifier = WebhookNotifier([url(stub_server)], outbox_path=str(outbox), flush_interval=0.05,
+                               backoff_base=60.0)
+    notifier.write_batch(events(2))
+    wait_for(lambda: stub_server.requests)
+    notifier.close()
+    assert json.loads(outbox.read_text(encoding="utf-8")) == {url(stub_server): events(2)}
+
+    # Yeniden başlatma: kutudaki olaylar beklemeden ve yenileriyle birlikte gönderilir
+    stub_server.responses = []
+    before_restart = len(stub_server.requests)
+    restarted = WebhookNotifier([url(stub_server)], outbox_path=str(outbox), flush_interval=0.05)
+    try:
+        restarted.write_batch(events(1, start=2))
+        wait_for(lambda: restarted.stats[url(stub_server)]["delivered"] == 3)
+    finally:
+        restarted.close()
+    delivered = [event for _, batch in stub_server.requests[before_restart:] for event in batch]
+    assert delivered == events(3)
+    assert json.loads(outbox.read_text(encoding="utf-8")) == {url(stub_server): []}
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+"""Profil çıkarma sinyal işleyicisi testleri."""
+
+import signal
+
+import pytest
+
+from arp_profiling import ScanProfiler
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR2"), reason="SIGUSR2 yalnızca POSIX'te var")
+def test_sigusr2_while_lock_held_arms_at_next_scan(tmp_path):
+    profiler = ScanProfiler(str(tmp_path))
+    previous = signal.getsignal(signal.SIGUSR2)
+    try:
+        assert profiler.install_signal_handlers(scans=1)
+        # Arayüz güncellemesi kilidi tutarken gelen sinyal kilitlenmeye yol açmamalı
+        with profiler._lock:
+            signal.raise_signal(signal.SIGUSR2)
+        assert profiler.active
+        assert not profiler._profile_remaining
+
+        with profiler.scan():
+            sum(range(1000))
+        assert not profiler.active
+        assert any(path.endswith(".pstats") for path in profiler.written)
+        assert any("memory-scan1" in path for path in profiler.written)
+    finally:
+        signal.signal(signal.SIGUSR2, previous)
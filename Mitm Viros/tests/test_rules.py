@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+"""Kural motoru filtre kuralları testleri."""
+
+from arp_rules import RuleEngine, default_rules
+from arp_spoofing_detector import detect_arp_spoofing
+
+
+def make_table(mac, ips):
+    return [{"ip": ip, "mac": mac, "interface": "eth0"} for ip in ips]
+
+
+def test_router_filter_can_be_disabled():
+    table = make_table("02:00:00:00:00:01", ["192.168.1.1", "192.168.1.5", "192.168.1.254"])
+    engine = RuleEngine(default_rules())
+    assert detect_arp_spoofing(table, engine=engine) == []
+
+    engine.disable("router_ip")
+    findings = detect_arp_spoofing(table, engine=engine)
+    assert findings
+    assert any(row["name"] == "router_ip" and row["calls"] == 1 for row in engine.stats())
+
+
+def test_filters_are_costed_and_count_hits():
+    table = (make_table("ff:ff:ff:ff:ff:ff", ["192.168.1.255"]) +
+             make_table("01:00:5e:00:00:16", ["224.0.0.22"]) +
+             make_table("02:00:00:00:00:09", ["10.0.0.9"]))
+    engine = RuleEngine(default_rules())
+    detect_arp_spoofing(table, engine=engine)
+    hits = {row["name"]: row["hits"] for row in engine.stats()}
+    assert hits["safe_mac"] == 2  # yayın + 01: çok noktaya yayın
+    assert hits["reserved_mac"] == 1
+    assert hits["safe_ip"] == 1
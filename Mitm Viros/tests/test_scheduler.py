@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+"""Katmanlı tarama zamanlayıcısı testleri."""
+
+import sys
+import threading
+
+from arp_alerts import alert_fingerprint
+from arp_rules import is_threat
+from arp_scheduler import TIER_FULL, AdaptiveInterval, TieredScanScheduler, new_findings
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_scheduler(full_scan, clock, on_change=None):
+    return TieredScanScheduler(full_interval=60.0, lookup=lambda ip: None, full_scan=full_scan,
+                               on_change=on_change, clock=clock, cpu_clock=lambda: 0.0)
+
+
+def test_full_tier_with_async_scan_callback():
+    # GUI'deki gibi root.after() kimliği döndüren bir geri çağırma zamanlayıcıyı düşürmemeli
+    clock = FakeClock()
+    calls = []
+
+    def full_scan():
+        calls.append(clock.now)
+        return "after#12"
+
+    scheduler = make_scheduler(full_scan, clock)
+    clock.now += 61
+    assert scheduler.run_pending() == [TIER_FULL]
+    assert calls == [clock.now]
+    assert scheduler.bindings == {}
+    assert scheduler.seconds_until_full() == 60.0
+
+
+def test_full_tier_updates_bindings_and_reports_changes():
+    clock = FakeClock()
+    tables = [[{"ip": "192.168.1.10", "mac": "AA:BB:CC:DD:EE:01"}],
+              [{"ip": "192.168.1.10", "mac": "aa:bb:cc:dd:ee:02"}]]
+    changes = []
+    scheduler = make_scheduler(lambda: tables.pop(0), clock,
+                               on_change=lambda *change: changes.append(change))
+
+    clock.now += 61
+    assert scheduler.run_pending() == [TIER_FULL]
+    assert scheduler.bindings == {"192.168.1.10": "aa:bb:cc:dd:ee:01"}
+
+    clock.now += 61
+    scheduler.run_pending()
+    assert changes == [("192.168.1.10", "aa:bb:cc:dd:ee:01", "aa:bb:cc:dd:ee:02", TIER_FULL)]
+    assert "192.168.1.10" in scheduler.warm_hosts
+
+
+def test_persistent_finding_does_not_pin_interval_at_floor():
+    interval = AdaptiveInterval(floor=30.0, ceiling=3600.0, initial=600.0)
+    finding = {"type": "duplicate_ip", "ip": "10.0.0.5", "mac": "02:00:00:00:00:05",
+               "message": "⚠️ Şüpheli: 10.0.0.5 birden fazla MAC adresine sahip"}
+    keys = set()
+
+    fresh, keys = new_findings([finding], keys, alert_fingerprint)
+    assert interval.observe(True, any(is_threat(entry) for entry in fresh)) == 30.0
+
+    # Aynı bulgu sonraki taramalarda yeni değil: aralık uzamaya devam eder
+    for _ in range(3):
+        fresh, keys = new_findings([dict(finding)], keys, alert_fingerprint)
+        assert fresh == []
+        interval.observe(False, any(is_threat(entry) for entry in fresh))
+    assert interval.interval > 30.0
+
+
+
+def test_update_bindings_from_another_thread_while_running():
+    # GUI'de tarama thread'i update_bindings() çağırırken periyodik thread run_pending() çalıştırır
+
+    clock = FakeClock()
+    changes = []
+    scheduler = TieredScanScheduler(full_interval=3600.0, lookup=lambda ip: "02:00:00:00:00:01",
+                                    full_scan=lambda: None, on_change=lambda *change: changes.append(change),
+                                    warm_interval=0.0, clock=clock, cpu_clock=lambda: 0.0)
+    errors = []
+
+    def scan_thread():
+        try:
+            # Her turda yeni IP'lerin MAC'i değişir: ılık katman sürekli büyür
+            for round_number in range(300):
+                for last_octet in (1, 2):
+                    scheduler.update_bindings([{"ip": f"10.{round_number // 200}.{round_number % 200}.{host}",
+                                                "mac": f"02:00:00:00:{last_octet:02x}:{host:02x}"}
+                                               for host in range(100)])
+        except Exception as error:  # pragma: no cover - yalnızca yarış durumunda
+            errors.append(error)
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Yarışı görünür kılmak için sık thread geçişi
+    thread = threading.Thread(target=scan_thread)
+    try:
+        thread.start()
+        while thread.is_alive():
+            try:
+                scheduler.run_pending()
+            except RuntimeError as error:
+                errors.append(error)
+        thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    scheduler.run_pending()
+    assert not errors
+    assert changes
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+"""Varsayılan ağ geçidi okuma testleri (Linux dışı yönlendirme tablosu çıktıları)."""
+
+import subprocess
+
+import arp_watchdog
+from arp_watchdog import parse_default_route
+
+NETSTAT_OUTPUT = """Routing tables
+
+Internet:
+Destination        Gateway            Flags           Netif Expire
+default            link#14            UCSIg       bridge100      !
+default            192.168.1.1        UGScg             en0
+127                127.0.0.1          UCS               lo0
+"""
+
+ROUTE_PRINT_OUTPUT = """===========================================================================
+IPv4 Route Table
+===========================================================================
+Active Routes:
+Network Destination        Netmask          Gateway       Interface  Metric
+          0.0.0.0          0.0.0.0      192.168.0.1    192.168.0.10     25
+        127.0.0.0        255.0.0.0         On-link         127.0.0.1    331
+"""
+
+
+def test_parse_default_route_formats():
+    assert parse_default_route("default via 10.0.0.1 dev eth0 proto dhcp\n") == "10.0.0.1"
+    assert parse_default_route(NETSTAT_OUTPUT) == "192.168.1.1"
+    assert parse_default_route(ROUTE_PRINT_OUTPUT) == "192.168.0.1"
+    assert parse_default_route("10.0.0.0/24 dev eth0 scope link\n") is None
+
+
+def test_falls_back_to_netstat_without_proc_and_ip(tmp_path, monkeypatch):
+    def check_output(command, **kwargs):
+        if command[0] == "netstat":
+            return NETSTAT_OUTPUT
+        raise FileNotFoundError(command[0])
+
+    monkeypatch.setattr(arp_watchdog.os, "name", "posix")
+    monkeypatch.setattr(subprocess, "check_output", check_output)
+    assert arp_watchdog.read_default_gateway_ip(str(tmp_path / "route")) == "192.168.1.1"
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+"""İkili tablo biçimi testleri."""
+
+import pytest
+
+import arp_wire
+
+
+TABLE = [
+    {"ip": "10.0.0.1", "mac": "0:11:22:3:44:55", "interface": "eth0", "timestamp": 900},
+    {"ip": "10.0.0.2", "mac": "aa:bb:cc:dd:ee:ff", "interface": "wlan0", "timestamp": 1100},
+]
+
+
+def test_snapshot_round_trip_keeps_timestamps_before_header():
+    decoded = arp_wire.decode(arp_wire.encode_snapshot(TABLE, timestamp=1000.0))
+    assert [(entry["mac"], entry["timestamp"]) for entry in decoded["added"]] == [
+        ("00:11:22:03:44:55", 900), ("aa:bb:cc:dd:ee:ff", 1100)]
+
+
+@pytest.mark.parametrize("mac", ["aa:bb:cc", "aabbccddee", "aa:bb:cc:dd:ee:fg", "aa:bb:cc:dd:ee:ff:00"])
+def test_invalid_mac_is_rejected(mac):
+    with pytest.raises(arp_wire.WireFormatError):
+        arp_wire.encode_snapshot([{"ip": "10.0.0.1", "mac": mac}])
+
+
+def test_every_truncation_raises_wire_format_error():
+    data = arp_wire.encode_snapshot(TABLE, timestamp=1000.0)
+    for length in range(len(data)):
+        with pytest.raises(arp_wire.WireFormatError):
+            arp_wire.decode(data[:length])